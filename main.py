@@ -9,6 +9,7 @@ import os
 import re
 import uuid
 import warnings
+from datetime import datetime
 from typing import Any, Optional, List
 
 # Suppress noisy warnings from LiteLLM/Pydantic internals
@@ -155,7 +156,7 @@ async def _generate_session_title(session_id: str, user_msg: str, assistant_msg:
 
         title = response.choices[0].message.content.strip().strip('"\'')
         if title:
-            update_session_title(session_id, title[:100])
+            await update_session_title_async(session_id, title[:100])
             logger.debug("[TITLE] Generated title for session %s: %s", session_id, title)
     except Exception as e:
         logger.warning("[TITLE] Failed to generate title for session %s: %s", session_id, e)
@@ -169,7 +170,7 @@ async def _load_history_into_session(session, session_id: str, session_service):
     if session.events:
         return  # Already has in-memory history
 
-    db_messages = get_session_messages(session_id)
+    db_messages = await get_session_messages_async(session_id)
     if not db_messages:
         return
 
@@ -260,16 +261,16 @@ from my_agent.tools.chart_guardrails import (
 )
 from my_agent.tools.suggestions import generate_suggestions
 from my_agent.tools.chat_history import (
-    get_user_id_by_username,
-    ensure_session,
-    save_message,
-    update_session_title,
-    update_report_in_message,
-    get_report_model_from_db,
-    get_sessions,
-    get_session_messages,
-    delete_session,
-    delete_messages_from,
+    get_user_id_by_username_async,
+    record_chat_message_async,
+    save_message_async,
+    update_session_title_async,
+    update_report_in_message_async,
+    get_report_model_from_db_async,
+    get_sessions_async,
+    get_session_messages_async,
+    delete_session_async,
+    delete_messages_from_async,
 )
 
 # Initialize FastAPI app
@@ -489,16 +490,42 @@ async def new_session():
 # ---------------------------------------------------------------------------
 
 @app.get("/sessions")
-async def list_sessions(userId: int):
-    """Return the user's chat sessions for the sidebar."""
-    rows = get_sessions(user_id=userId)
-    return {"sessions": rows}
+async def list_sessions(
+    userId: int,
+    limit: int = 50,
+    before: Optional[str] = None,
+    beforeId: Optional[str] = None,
+):
+    """Return the user's chat sessions for the sidebar.
+
+    To load the next page, pass the returned nextBefore's updatedAt as
+    `before` and its id as `beforeId` (nextBefore is null once the list
+    is exhausted).
+    """
+    if (before is None) != (beforeId is None):
+        return JSONResponse(status_code=400, content={
+            "status": "error", "message": "before and beforeId must be given together"
+        })
+    if before is not None:
+        try:
+            datetime.fromisoformat(before)
+            uuid.UUID(beforeId)
+        except ValueError:
+            return JSONResponse(status_code=400, content={
+                "status": "error", "message": "before must be an ISO timestamp and beforeId a session id"
+            })
+    rows = await get_sessions_async(user_id=userId, limit=limit, before=before, before_id=beforeId)
+    next_before = (
+        {"updatedAt": rows[-1]["UpdatedAt"], "id": rows[-1]["Id"]}
+        if len(rows) == limit else None
+    )
+    return {"sessions": rows, "nextBefore": next_before}
 
 
 @app.get("/sessions/{session_id}/messages")
-async def load_session_messages(session_id: str):
-    """Return all messages for a given session."""
-    msgs = get_session_messages(session_id)
+async def load_session_messages(session_id: str, afterId: int = 0, limit: Optional[int] = None):
+    """Return a session's messages (all of them unless paged with afterId/limit)."""
+    msgs = await get_session_messages_async(session_id, after_id=afterId, limit=limit)
     # Normalize keys for frontend: ReportHtml → reportHtml, ReportModelJson → reportModelJson
     for msg in msgs:
         rh = msg.pop("ReportHtml", None)
@@ -513,7 +540,7 @@ async def load_session_messages(session_id: str):
 @app.delete("/sessions/{session_id}")
 async def remove_session(session_id: str):
     """Soft-delete a chat session."""
-    ok = delete_session(session_id)
+    ok = await delete_session_async(session_id)
     if ok:
         return {"success": True}
     return {"success": False, "error": "Session not found or already deleted"}
@@ -526,7 +553,7 @@ class TitleUpdate(BaseModel):
 @app.delete("/sessions/{session_id}/messages/from/{message_id}")
 async def remove_messages_from(session_id: str, message_id: int):
     """Delete a message and all messages after it in a session."""
-    deleted = delete_messages_from(session_id, message_id)
+    deleted = await delete_messages_from_async(session_id, message_id)
     if deleted >= 0:
         return {"success": True, "deleted": deleted}
     return {"success": False, "error": "Failed to delete messages"}
@@ -535,7 +562,7 @@ async def remove_messages_from(session_id: str, message_id: int):
 @app.patch("/sessions/{session_id}/title")
 async def rename_session(session_id: str, body: TitleUpdate):
     """Rename a chat session."""
-    ok = update_session_title(session_id, body.title)
+    ok = await update_session_title_async(session_id, body.title)
     return {"success": ok}
 
 
@@ -592,7 +619,7 @@ async def edit_report_inline(request: ReportEditRequest):
     # In-memory ADK session state mutations (via _InlineToolContext) are NOT reliably
     # persisted across HTTP calls (direct dict mutation bypasses ADK event tracking).
     # Each edit saves to DB; each edit call must reload from DB to see previous changes.
-    db_model, db_html = get_report_model_from_db(session_id)
+    db_model, db_html = await get_report_model_from_db_async(session_id)
 
     if db_model:
         # Extract undo stack that was embedded in the model for DB persistence
@@ -711,7 +738,7 @@ async def edit_report_inline(request: ReportEditRequest):
             # Embed undo stack inside model so next call can restore it from DB
             model_to_save = {**report_model, "_undo_stack": ctx.state.get("report_undo_stack", [])}
             model_json = json.dumps(model_to_save, default=str)
-            update_report_in_message(session_id, report_html, model_json)
+            await update_report_in_message_async(session_id, report_html, model_json)
         except Exception as e:
             logger.warning(f"[REPORT EDIT] Failed to persist to DB: {e}")
 
@@ -747,7 +774,7 @@ async def download_report_pdf(request: ReportPdfRequest):
     report_html = None
 
     # 1. Try DB (authoritative — always has the latest after inline edits)
-    msgs = get_session_messages(session_id)
+    msgs = await get_session_messages_async(session_id)
     for msg in reversed(msgs):
         rh = msg.get("ReportHtml")
         if rh:
@@ -913,10 +940,11 @@ async def run_sse(request: RunSSERequest):
         if part.text:
             raw_user_text += part.text
 
-    db_user_id = get_user_id_by_username(username)
+    db_user_id = await get_user_id_by_username_async(username)
     if db_user_id is not None:
-        ensure_session(session_id, db_user_id, title=raw_user_text[:100])
-        save_message(session_id, "user", raw_user_text)
+        await record_chat_message_async(
+            session_id, db_user_id, "user", raw_user_text, title=raw_user_text[:100]
+        )
     else:
         logger.warning("[CHAT HISTORY] Could not resolve DB userId for username=%s, skipping persistence", username)
 
@@ -1357,7 +1385,7 @@ async def run_sse(request: RunSSERequest):
                     except Exception:
                         pass  # Non-critical — editing will have limited functionality
             if db_content and db_user_id is not None:
-                save_message(
+                await save_message_async(
                     session_id, "assistant", db_content,
                     report_html=db_report_html,
                     report_model_json=db_report_model_json,
@@ -1430,7 +1458,7 @@ async def run_sse(request: RunSSERequest):
         except Exception:
             pass
         if response_text and db_user_id is not None:
-            save_message(
+            await save_message_async(
                 session_id, "assistant", response_text,
                 report_html=ns_report_html,
                 report_model_json=ns_report_model_json,
@@ -11,7 +11,7 @@ from google.adk.agents import LlmAgent
 from google.adk.tools.agent_tool import AgentTool
 
 from .config import AGENT_MODEL
-from .prompts.templates import Prompts
+from .prompts.templates import HTML_OUTPUT_FORMAT, oip_assistant_system
 from .tools.rag_tool import search_oip_documents
 from .agents.ticket_analytics import ticket_analytics
 from .agents.engineer_analytics import engineer_analytics
@@ -55,7 +55,8 @@ RULES:
 oip_expert = LlmAgent(
     name="oip_expert",
     model=AGENT_MODEL,
-    instruction=Prompts.oip_assistant_system(),
+    # Static string: keep it byte-identical across turns for prefix caching
+    instruction=oip_assistant_system(),
     description="Expert on Ebttikar OIP platform - answers questions using document search",
     tools=[search_oip_documents],
 )
@@ -198,7 +199,7 @@ IMPORTANT RULES:
 - If a user asks "what did I ask you?" or similar, summarize their questions naturally without mentioning any filter tags or technical metadata.
 - If a user asks something completely unrelated to OIP, tickets, or greetings, politely explain that you specialize in OIP-related questions and ticket analytics.
 
-{Prompts.HTML_OUTPUT_FORMAT}""",
+{HTML_OUTPUT_FORMAT}""",
     description="Main OIP Assistant - routes to greeter, ticket analytics, engineer analytics, inventory analytics, OIP expert, or report generator",
     tools=[AgentTool(agent=report_generator)],
     sub_agents=[greeter, oip_expert, ticket_analytics, engineer_analytics, inventory_analytics, report_editor],
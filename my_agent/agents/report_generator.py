@@ -13,7 +13,7 @@ See docs/spec-report-generation.md for the full spec.
 from google.adk.agents import LlmAgent, SequentialAgent
 
 from ..config import AGENT_MODEL
-from ..tools.db_tools import get_current_date, get_lookups
+from ..tools.db_tools import get_current_date, get_lookups_async
 from ..tools.report_tools import collect_report_data, build_html_report
 
 
@@ -25,7 +25,7 @@ report_planner = LlmAgent(
     name="report_planner",
     model=AGENT_MODEL,
     output_key="report_plan",
-    tools=[get_current_date, get_lookups],
+    tools=[get_current_date, get_lookups_async],
     instruction="""You are the Report Planner. Your job is to analyze the user's report request
 and produce a structured plan that tells the Data Collector what to fetch.
 
@@ -9,7 +9,15 @@ from datetime import datetime
 from google.adk.agents import LlmAgent
 
 from ..config import AGENT_MODEL
-from ..tools.db_tools import get_ticket_summary, get_ticket_timeline, get_current_date, create_chart_from_session, get_lookups, get_pm_checklist_data
+from ..tools.db_tools import (
+    get_ticket_summary_async,
+    get_ticket_summary_batch_async,
+    get_ticket_timeline_async,
+    get_current_date,
+    create_chart_from_session,
+    get_lookups_async,
+    get_pm_checklist_data_async,
+)
 from ..tools.chart_tools import (
     create_ticket_status_chart,
     create_completion_rate_gauge,
@@ -105,6 +113,8 @@ Examples:
 
 ### 1. Database Tools (Get Data)
 - `get_ticket_summary` - Retrieves ticket statistics from the TickTraq database
+- `get_ticket_summary_batch` - Several ticket summaries in ONE call for side-by-side comparisons
+  - Use for "ANB vs Barclays", "Riyadh vs Jeddah": `filters=[{{"project_names": "ANB"}}, {{"project_names": "Barclays"}}]`
 - `get_current_date` - Returns current date information
 - `get_lookups` - Retrieves reference data (regions, projects, teams, statuses, task types)
   - Use when users ask "what regions are there?", "list all teams", "what task types exist?"
@@ -796,13 +806,14 @@ Use this agent for questions like:
 - "Completed PMs in Eastern Province"
 """,
     tools=[
-        # Database tools
-        get_ticket_summary,
-        get_ticket_timeline,
+        # Database tools (run on a worker thread; same tool names as the sync versions)
+        get_ticket_summary_async,
+        get_ticket_summary_batch_async,
+        get_ticket_timeline_async,
         get_current_date,
-        get_lookups,
+        get_lookups_async,
         # PM Checklist tools
-        get_pm_checklist_data,
+        get_pm_checklist_data_async,
         create_pm_chart,
         # Session-aware chart tools (read data from session state automatically)
         create_chart_from_session,
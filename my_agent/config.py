@@ -103,11 +103,23 @@ class RAGConfig:
 
     # Embeddings
     EMBEDDING_DIMENSION = 1536  # ada-002 dimension
-    EMBEDDING_BATCH_SIZE = 20
+    EMBEDDING_BATCH_SIZE = 96  # texts per embedding API call
+    INGEST_CONCURRENCY = 8  # embedding calls in flight during ingest
+    INGEST_QUEUE_SIZE = 16  # embedded batches waiting to be indexed
+    INGEST_ADD_BATCH = 4096  # vectors per index.add during ingest
+
+    # FAISS index (faiss.index_factory spec; "Flat" = exact search).
+    # SQ8 stores each dimension as int8: 4x less memory than float32
+    FAISS_INDEX_TYPE = "HNSW32,SQ8"
+    HNSW_EF_CONSTRUCTION = 200
+    HNSW_EF_SEARCH = 64  # floor; raised to 4 * top_k for larger queries
 
     # Retrieval
     DEFAULT_TOP_K = 5
     SIMILARITY_THRESHOLD = 0.3  # minimum similarity score
+    RESULT_CACHE_SIZE = 512  # exact-match search results kept in memory
+    SEMANTIC_CACHE_SIZE = 1024  # past query vectors for near-duplicate hits
+    SEMANTIC_CACHE_THRESHOLD = 0.95  # cosine similarity to reuse results
 
 # =============================================================================
 # AGENT SETTINGS
@@ -78,6 +78,14 @@ class DocumentLoader:
         """
         return Path(file_path).read_text(encoding="utf-8")
 
+    # Extension -> (loader, document type)
+    _LOADERS = {
+        ".pdf": (load_pdf, DocumentType.PDF),
+        ".docx": (load_docx, DocumentType.DOCX),
+        ".doc": (load_docx, DocumentType.DOCX),
+        ".txt": (load_txt, DocumentType.TXT),
+    }
+
     @classmethod
     def load(cls, file_path: str) -> Document:
         """Load document based on file extension.
@@ -95,17 +103,12 @@ class DocumentLoader:
 
         ext = path.suffix.lower()
 
-        if ext == ".pdf":
-            content = cls.load_pdf(str(path))
-            doc_type = DocumentType.PDF
-        elif ext in [".docx", ".doc"]:
-            content = cls.load_docx(str(path))
-            doc_type = DocumentType.DOCX
-        elif ext == ".txt":
-            content = cls.load_txt(str(path))
-            doc_type = DocumentType.TXT
-        else:
-            raise ValueError(f"Unsupported file type: {ext}")
+        try:
+            loader, doc_type = cls._LOADERS[ext]
+        except KeyError:
+            raise ValueError(f"Unsupported file type: {ext}") from None
+
+        content = loader(str(path))
 
         return Document(
             content=content,
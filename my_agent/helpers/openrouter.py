@@ -10,6 +10,12 @@ from ..config import (
 )
 from ..models import EmbeddingResponse, LLMResponse
 
+# orjson is an optional speedup for decoding API responses
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 
 class OpenRouterClient:
     """Reusable client for OpenRouter API calls"""
@@ -49,22 +55,38 @@ class OpenRouterClient:
             model: Embedding model to use
 
         Returns:
-            List of embedding vectors
+            List of embedding vectors (one per input text, in input order)
         """
+        # Repeated boilerplate (headers, footers) is embedded only once;
+        # texts differing only in whitespace share a vector.
+        unique_index: Dict[str, int] = {}
+        unique_texts: List[str] = []
+        order: List[int] = []
+        for text in texts:
+            key = " ".join(text.split())
+            idx = unique_index.get(key)
+            if idx is None:
+                idx = unique_index[key] = len(unique_texts)
+                unique_texts.append(text)
+            order.append(idx)
+
         response = requests.post(
             f"{self.base_url}/embeddings",
             headers=self.headers,
             json={
                 "model": model,
-                "input": texts,
+                "input": unique_texts,
                 "encoding_format": "float",
             },
             timeout=60,
         )
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
 
-        return [item["embedding"] for item in data["data"]]
+        embeddings = [item["embedding"] for item in data["data"]]
+        if len(unique_texts) == len(texts):
+            return embeddings
+        return [embeddings[idx] for idx in order]
 
     def get_embedding(
         self,
@@ -121,7 +143,7 @@ class OpenRouterClient:
             timeout=120,
         )
         response.raise_for_status()
-        return response.json()["choices"][0]["message"]["content"]
+        return _json_loads(response.content)["choices"][0]["message"]["content"]
 
     def chat_completion_with_history(
         self,
@@ -153,7 +175,7 @@ class OpenRouterClient:
             timeout=120,
         )
         response.raise_for_status()
-        return response.json()["choices"][0]["message"]["content"]
+        return _json_loads(response.content)["choices"][0]["message"]["content"]
 
     # =========================================================================
     # UTILITY METHODS
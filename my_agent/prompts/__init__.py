@@ -1,4 +1,18 @@
 """Prompt templates for agents and tools"""
-from .templates import Prompts
+from .templates import (
+    HTML_OUTPUT_FORMAT,
+    Prompts,
+    error_response,
+    format_rag_context,
+    no_results_response,
+    oip_assistant_system,
+)
 
-__all__ = ["Prompts"]
+__all__ = [
+    "HTML_OUTPUT_FORMAT",
+    "Prompts",
+    "error_response",
+    "format_rag_context",
+    "no_results_response",
+    "oip_assistant_system",
+]
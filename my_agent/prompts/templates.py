@@ -8,37 +8,57 @@ Context Engineering Best Practices (2025):
 - Support for prompt chaining
 
 Reference: https://www.promptingguide.ai/guides/context-engineering-guide
-"""
-from typing import List, Dict, Optional
-
-
-class Prompts:
-    """Centralized prompt templates with f-string parameters.
-
-    SHARED CONSTANTS:
-    =================
-    - HTML_OUTPUT_FORMAT: Include this in any agent that needs HTML output
-
-    FUNCTION-TO-PROMPT MAPPING:
-    ===========================
-    - oip_assistant_system()     -> Used by: root_agent in agent.py (main system prompt)
-    - format_rag_context()       -> Used by: search_oip_documents tool (formats retrieved docs)
-    - rag_qa_prompt()            -> Used by: direct LLM calls outside ADK (optional)
-    - rag_qa_with_history()      -> Used by: multi-turn conversations (optional)
-    - query_rewrite_prompt()     -> Used by: advanced RAG pipeline (optional)
-    - query_expansion_prompt()   -> Used by: fusion retrieval (optional)
-    - query_classification_prompt() -> Used by: adaptive retrieval (optional)
-    - summarize_chunk_prompt()   -> Used by: long document summarization (optional)
-    - synthesize_documents_prompt() -> Used by: multi-doc synthesis (optional)
-    - no_results_response()      -> Used by: rag_tool.py when no docs found
-    - error_response()           -> Used by: rag_tool.py on errors
-    - extract_data_prompt()      -> Used by: future chart/data features
-    """
 
-    # =========================================================================
-    # SHARED OUTPUT FORMAT - Reuse in all agent instructions
-    # =========================================================================
-    HTML_OUTPUT_FORMAT = """
+Centralized prompt templates as module-level functions. The ``Prompts``
+class at the bottom re-exposes them for ``Prompts.<name>`` callers.
+
+SHARED CONSTANTS:
+=================
+- HTML_OUTPUT_FORMAT: Include this in any agent that needs HTML output
+
+FUNCTION-TO-PROMPT MAPPING:
+===========================
+- oip_assistant_system()     -> Used by: root_agent in agent.py (main system prompt)
+- format_rag_context()       -> Used by: search_oip_documents tool (formats retrieved docs)
+- rag_qa_prompt()            -> Used by: direct LLM calls outside ADK (optional)
+- rag_qa_with_history()      -> Used by: multi-turn conversations (optional)
+- query_rewrite_prompt()     -> Used by: advanced RAG pipeline (optional)
+- query_expansion_prompt()   -> Used by: fusion retrieval (optional)
+- query_classification_prompt() -> Used by: adaptive retrieval (optional)
+- summarize_chunk_prompt()   -> Used by: long document summarization (optional)
+- synthesize_documents_prompt() -> Used by: multi-doc synthesis (optional)
+- no_results_response()      -> Used by: rag_tool.py when no docs found
+- error_response()           -> Used by: rag_tool.py on errors
+- extract_data_prompt()      -> Used by: future chart/data features
+"""
+from functools import lru_cache
+from operator import itemgetter
+from typing import Final, List, Dict, Optional, Tuple
+
+__all__ = [
+    "HTML_OUTPUT_FORMAT",
+    "Prompts",
+    "oip_assistant_system",
+    "format_rag_context",
+    "rag_qa_prompt",
+    "rag_qa_with_history",
+    "query_rewrite_prompt",
+    "query_expansion_prompt",
+    "query_classification_prompt",
+    "summarize_chunk_prompt",
+    "synthesize_documents_prompt",
+    "no_results_response",
+    "error_response",
+    "suggestions_prompt",
+    "extract_data_prompt",
+]
+
+
+# =============================================================================
+# STATIC PROMPT TEXT (built once at import, shared by every call)
+# =============================================================================
+
+_HTML_OUTPUT_FORMAT: Final[str] = """
 <OUTPUT_FORMAT>
 You MUST format ALL responses using clean HTML. NEVER use markdown (**bold**, *italic*, etc.).
 
@@ -81,164 +101,52 @@ COMMUNICATION RULES:
 </OUTPUT_FORMAT>
 """
 
-    # =========================================================================
-    # AGENT SYSTEM PROMPTS
-    # =========================================================================
-
-    @staticmethod
-    def oip_assistant_system() -> str:
-        """Main OIP Assistant system prompt for Google ADK agent.
-
-        USED BY: root_agent (oip_expert sub-agent) in my_agent/agent.py
-        CONTROLS: Overall response style, length, and behavior
-
-        PROMPT STRUCTURE: Uses ReAct pattern (Reason + Act)
-        - Thought: Analyze query intent and plan retrieval
-        - Action: Use search_oip_documents tool
-        - Observation: Process retrieved context
-        - Response: Generate formatted HTML output
-        """
-        return """<PERSONA>
-You are a professional, knowledgeable assistant for the Ebttikar Operations Intelligence Platform (OIP).
-You communicate clearly and structure information so it's easy to scan and understand.
-</PERSONA>
-
-<INSTRUCTIONS>
-- ALWAYS use search_oip_documents tool FIRST to retrieve information
-- Base answers ONLY on retrieved context — never fabricate
-- If no info found, say: "I don't have that information in OIP docs."
-- Support English and Arabic queries — respond in the user's language
-- Do NOT mention source documents, filenames, or internal technical details
-- NEVER mention ACTIVE_TEAM_FILTER, ACTIVE_PROJECT_FILTER, ACTIVE_REGION_FILTER or any internal system tags
-- NEVER expose database columns, stored procedure names, or developer terms
-</INSTRUCTIONS>
-
-<OUTPUT_FORMAT>
-You MUST format ALL responses using clean HTML. NEVER use markdown syntax like **bold** or *italic*.
-
-REQUIRED STRUCTURE FOR EVERY RESPONSE:
-1. Start with a brief summary sentence wrapped in <p>
-2. Use <ul> bullet lists for ALL details (this is mandatory — never write plain text lists)
-3. Bold key terms with <strong> and use <em> for secondary emphasis
-4. End with a brief closing <p> if helpful
-
-HTML TAGS TO USE:
-- <p>text</p> — every paragraph
-- <strong>text</strong> — key terms, feature names, labels (renders as bold)
-- <em>text</em> — descriptions, secondary info
-- <ul><li>item</li></ul> — bullet lists (USE GENEROUSLY for readability)
-- <ol><li>item</li></ol> — numbered steps
-- <br> — line breaks
-
-STYLING FOR VISUAL APPEAL:
-- Use <span style='color:#1a73e8'> for section headers and important category labels (blue accent)
-- Use <span style='color:#1a73e8'><strong>text</strong></span> to make section titles pop in blue + bold
-- Use <strong> for feature names and key terms within bullet items
-- Use <em> for definitions, descriptions, and technical terms in parentheses
-- Use <u>text</u> sparingly to underline critical terms or warnings the user should notice
-- Every list item should follow: <li><strong>Label</strong> — Description text</li>
-
-EXAMPLE RESPONSE — DETAILED (follow this pattern closely):
-<p><strong>Daily Activity Approval</strong> in OIP ensures data integrity through structured workflows where engineers submit logs for <u>Team Lead review</u> before management visibility.</p>
-
+# oip_assistant_system() sections, composed once below in a fixed order
+_OIP_PERSONA: Final[str] = """<PERSONA>
+You are a professional assistant for the Ebttikar Operations Intelligence Platform (OIP). Structure answers so they are easy to scan.
+</PERSONA>"""
+
+_OIP_INSTRUCTIONS: Final[str] = """<INSTRUCTIONS>
+- ALWAYS call search_oip_documents FIRST and answer ONLY from the retrieved context
+- If nothing relevant is found, say: "I don't have that information in OIP docs."
+- Respond in the user's language (English or Arabic)
+- Never mention source documents, filenames, internal tags (ACTIVE_*_FILTER), database columns, stored procedures, or developer terms
+</INSTRUCTIONS>"""
+
+_OIP_OUTPUT_FORMAT: Final[str] = """<OUTPUT_FORMAT>
+Use clean HTML only — never markdown.
+- Open with a one-sentence summary in <p>; put ALL details in <ul> lists; optional closing <p>
+- List items: <li><strong>Label</strong> — Description</li>
+- <strong> for key terms, <em> for descriptions, <u> sparingly for critical values, <ol> for steps
+- Section titles: <span style='color:#1a73e8'><strong>Title:</strong></span>
+
+EXAMPLE:
+<p><strong>Daily Activity Approval</strong> requires <u>Team Lead review</u> before logs reach management.</p>
 <p><span style='color:#1a73e8'><strong>Key Workflow Elements:</strong></span></p>
 <ul>
-<li><strong>Log Entry</strong> — Engineers use a spreadsheet-style interface to input daily activities including <em>Site Name, Ticket Number, Time Started/Ended</em>, and Remarks</li>
-<li><strong>Approval Chain</strong> — Logs require <u>Team Lead approval</u> before becoming visible to management</li>
-<li><strong>Visibility Rule</strong> — Pending logs are hidden from management until approved, ensuring data accuracy</li>
-<li><strong>Delegation</strong> — Supports temporary reassignment of approvals via a built-in system</li>
-<li><strong>Notifications</strong> — Alerts sent via <em>email</em> or <em>WhatsApp</em> for pending approvals</li>
+<li><strong>Log Entry</strong> — Engineers record <em>Site Name, Ticket Number, Time Started/Ended</em>, and Remarks</li>
+<li><strong>Notifications</strong> — Alerts via <em>email</em> or <em>WhatsApp</em> for pending approvals</li>
 </ul>
+</OUTPUT_FORMAT>"""
 
-<p>This is part of <span style='color:#1a73e8'><strong>Phase One</strong></span> implementation, centralizing monitoring and productivity tracking across all teams.</p>
-
-EXAMPLE RESPONSE — SHORT:
-<p><strong>OIP</strong> (<em>Operations Intelligence Platform</em>) is a centralized system for managing tickets, <span style='color:#1a73e8'>SLA monitoring</span>, and approval workflows across Ebttikar's operations.</p>
-
-EXAMPLE RESPONSE — MULTI-SECTION:
-<p><strong>Ticket Management</strong> in OIP covers the full lifecycle from creation to closure.</p>
-
-<p><span style='color:#1a73e8'><strong>Ticket Creation:</strong></span></p>
-<ul>
-<li><strong>Sources</strong> — Created from <em>client requests</em>, internal needs, or <u>bulk upload</u></li>
-<li><strong>Assignment</strong> — Auto-assigned to engineers based on region and team</li>
-</ul>
-
-<p><span style='color:#1a73e8'><strong>Ticket Closure:</strong></span></p>
-<ul>
-<li><strong>Approval Required</strong> — Team Lead must approve before closure</li>
-<li><strong>SLA Tracking</strong> — System calculates <em>delay days</em> excluding weekends with a <u>24-hour grace period</u></li>
-</ul>
-</OUTPUT_FORMAT>
-
-<GUARDRAILS>
-- Never make up features not in documentation
-- Don't speculate about pricing or timelines
-- If outside OIP scope, politely redirect
-- Always use HTML formatting — never plain text or markdown
-- Never expose internal system details to users
+_OIP_GUARDRAILS: Final[str] = """<GUARDRAILS>
+- Never invent features or speculate about pricing or timelines
+- If the question is outside OIP scope, politely redirect
 </GUARDRAILS>"""
 
-    # =========================================================================
-    # RAG CONTEXT FORMATTING
-    # =========================================================================
-
-    @staticmethod
-    def format_rag_context(
-        results: List[Dict],
-        query: str,
-        include_scores: bool = True
-    ) -> str:
-        """Format retrieved documents into structured context.
-
-        USED BY: search_oip_documents() in my_agent/tools/rag_tool.py
-        PURPOSE: Wraps retrieved FAISS results in XML tags for LLM consumption
-
-        Args:
-            results: List of dicts with 'text', 'source', 'score', 'rank' keys
-            query: Original user query (for context)
-            include_scores: Whether to show relevance scores
-
-        Returns:
-            Formatted context string with clear structure
-        """
-        if not results:
-            return "<NO_DOCUMENTS_FOUND/>"
-
-        context_parts = [
-            f"<RETRIEVED_CONTEXT query=\"{query}\" num_results=\"{len(results)}\">"
-        ]
-
-        for result in results:
-            rank = result.get("rank", "?")
-            source = result.get("source", "Unknown")
-            text = result.get("text", "")
-            score = result.get("score", 0)
-
-            if include_scores:
-                header = f"<DOCUMENT rank=\"{rank}\" source=\"{source}\" relevance=\"{score:.2f}\">"
-            else:
-                header = f"<DOCUMENT rank=\"{rank}\" source=\"{source}\">"
-
-            context_parts.append(f"{header}\n{text}\n</DOCUMENT>")
-
-        context_parts.append("</RETRIEVED_CONTEXT>")
-
-        return "\n\n".join(context_parts)
-
-    # =========================================================================
-    # RAG QA PROMPTS (for prompt chaining if needed)
-    # =========================================================================
-
-    @staticmethod
-    def rag_qa_prompt(context: str, question: str) -> str:
-        """Generate answer from retrieved context (for direct LLM calls).
-
-        USED BY: Optional - direct OpenRouter/LLM calls outside ADK
-        PURPOSE: Standalone RAG QA without agent framework
-        NOT USED BY: ADK agents (they use oip_assistant_system instead)
-        """
-        return f"""<TASK>
+# Provider prefix caches (OpenAI/Anthropic/Gemini) key on the leading bytes
+# of the prompt, so this must stay a single static string: oip_assistant_system()
+# returns this exact object on every call. Never prepend or interpolate
+# session-specific data (user, date, filters) into it; send that in a
+# separate message instead.
+_OIP_ASSISTANT_SYSTEM: Final[str] = "\n\n".join((
+    _OIP_PERSONA,
+    _OIP_INSTRUCTIONS,
+    _OIP_OUTPUT_FORMAT,
+    _OIP_GUARDRAILS,
+))
+
+_RAG_QA_TEMPLATE: Final[str] = """<TASK>
 Answer the question based ONLY on the provided context.
 </TASK>
 
@@ -260,32 +168,7 @@ Answer the question based ONLY on the provided context.
 
 <ANSWER>"""
 
-    @staticmethod
-    def rag_qa_with_history(
-        context: str,
-        question: str,
-        chat_history: Optional[List[Dict]] = None
-    ) -> str:
-        """RAG QA prompt with conversation history for follow-up questions.
-
-        USED BY: Optional - multi-turn direct LLM calls
-        PURPOSE: Maintains context across conversation turns
-        NOT USED BY: ADK agents (ADK handles history internally)
-        """
-        history_section = ""
-        if chat_history:
-            history_parts = []
-            for msg in chat_history[-5:]:  # Last 5 messages
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-                history_parts.append(f"{role.upper()}: {content}")
-            history_section = f"""<CONVERSATION_HISTORY>
-{chr(10).join(history_parts)}
-</CONVERSATION_HISTORY>
-
-"""
-
-        return f"""{history_section}<CONTEXT>
+_RAG_QA_WITH_HISTORY_TEMPLATE: Final[str] = """{history_section}<CONTEXT>
 {context}
 </CONTEXT>
 
@@ -302,18 +185,7 @@ Answer the question based ONLY on the provided context.
 
 <ANSWER>"""
 
-    # =========================================================================
-    # QUERY PROCESSING (for advanced RAG pipelines)
-    # =========================================================================
-
-    @staticmethod
-    def query_rewrite_prompt(query: str) -> str:
-        """Rewrite query for better retrieval (prompt chaining step 1).
-
-        USED BY: Optional - advanced RAG pipeline with query preprocessing
-        PURPOSE: Improves retrieval by expanding/clarifying user queries
-        """
-        return f"""<TASK>
+_QUERY_REWRITE_TEMPLATE: Final[str] = """<TASK>
 Rewrite the following user query to improve document retrieval.
 Make it more specific and include relevant technical terms.
 </TASK>
@@ -331,14 +203,7 @@ Make it more specific and include relevant technical terms.
 
 <REWRITTEN_QUERY>"""
 
-    @staticmethod
-    def query_expansion_prompt(query: str, num_variations: int = 3) -> str:
-        """Generate query variations for fusion retrieval.
-
-        USED BY: Optional - hybrid/fusion search implementations
-        PURPOSE: Creates multiple query variants for broader retrieval
-        """
-        return f"""<TASK>
+_QUERY_EXPANSION_TEMPLATE: Final[str] = """<TASK>
 Generate {num_variations} alternative phrasings of this query for document search.
 Each variation should capture the same intent but use different words.
 </TASK>
@@ -356,14 +221,7 @@ Each variation should capture the same intent but use different words.
 
 <ALTERNATIVE_QUERIES>"""
 
-    @staticmethod
-    def query_classification_prompt(query: str) -> str:
-        """Classify query intent for adaptive retrieval.
-
-        USED BY: Optional - intent-based routing systems
-        PURPOSE: Categorizes queries to adjust retrieval strategy
-        """
-        return f"""<TASK>
+_QUERY_CLASSIFICATION_TEMPLATE: Final[str] = """<TASK>
 Classify the query intent into exactly one category.
 </TASK>
 
@@ -381,18 +239,7 @@ Classify the query intent into exactly one category.
 
 <CLASSIFICATION>"""
 
-    # =========================================================================
-    # SUMMARIZATION (for long contexts)
-    # =========================================================================
-
-    @staticmethod
-    def summarize_chunk_prompt(text: str, max_sentences: int = 3) -> str:
-        """Summarize a single document chunk.
-
-        USED BY: Optional - long document processing
-        PURPOSE: Condenses chunks before final synthesis
-        """
-        return f"""<TASK>
+_SUMMARIZE_CHUNK_TEMPLATE: Final[str] = """<TASK>
 Summarize the following text in {max_sentences} sentences or less.
 Preserve key facts, numbers, and technical terms.
 </TASK>
@@ -403,19 +250,290 @@ Preserve key facts, numbers, and technical terms.
 
 <SUMMARY>"""
 
-    @staticmethod
-    def synthesize_documents_prompt(documents: List[str]) -> str:
-        """Synthesize multiple documents into coherent summary.
+_EXTRACT_DATA_TEMPLATE: Final[str] = """<TASK>
+Extract {data_type} from the following text.
+Return as JSON format.
+</TASK>
+
+<TEXT>
+{text}
+</TEXT>
+
+<OUTPUT_FORMAT>
+{{
+  "data_type": "{data_type}",
+  "items": [
+    {{"label": "...", "value": ..., "unit": "..."}}
+  ],
+  "source": "extracted from text"
+}}
+</OUTPUT_FORMAT>
+
+<EXTRACTED_DATA>"""
+
+# Templates with the count already filled in for the usual small values
+_QUERY_EXPANSION_BY_N: Final[Dict[int, str]] = {
+    n: _QUERY_EXPANSION_TEMPLATE.replace("{num_variations}", str(n)) for n in range(1, 11)
+}
+_SUMMARIZE_CHUNK_BY_N: Final[Dict[int, str]] = {
+    n: _SUMMARIZE_CHUNK_TEMPLATE.replace("{max_sentences}", str(n)) for n in range(1, 11)
+}
+
+# Number of trailing chat turns included by rag_qa_with_history
+_HISTORY_WINDOW: Final[int] = 5
+
+# Unpacks a format_rag_context() result dict into (rank, source, text, score)
+_RESULT_FIELDS = itemgetter("rank", "source", "text", "score")
+
+
+def _document_order(result: Dict) -> Tuple[str, int]:
+    """Sort key placing format_rag_context() documents in corpus order."""
+    return result.get("source", ""), result.get("chunk_index", 0)
+
+
+# <RETRIEVED_CONTEXT> frame used by format_rag_context()
+_RAG_CONTEXT_OPEN = '<RETRIEVED_CONTEXT num_results="{}">'.format
+_RAG_CONTEXT_CLOSE: Final[str] = "</RETRIEVED_CONTEXT>"
+_RAG_QUERY = "<QUERY>{}</QUERY>".format
+
+# Bound str.format of the <DOCUMENT> block, args: (rank, source, text, score).
+# relevance is always 4 characters ("0.85") for scores in [0, 1]
+_RAG_DOCUMENT_WITH_SCORE = '<DOCUMENT rank="{0}" source="{1}" relevance="{3:.2f}">\n{2}\n</DOCUMENT>'.format
+_RAG_DOCUMENT = '<DOCUMENT rank="{0}" source="{1}">\n{2}\n</DOCUMENT>'.format
+
+_NO_RESULTS_TEMPLATE: Final[str] = """I searched the OIP documentation but couldn't find specific information about "{query}".
+
+Possible reasons:
+1. The topic isn't covered in the current documentation
+2. Try rephrasing with different terms (e.g., technical vs. general)
+3. The information might be in a document not yet indexed
+
+Would you like me to help rephrase your question?"""
+
+_ERROR_TEMPLATE: Final[str] = """I encountered an issue while processing your request.
+
+Error: {error_type}{detail_line}
+
+Please try:
+1. Rephrasing your question
+2. Being more specific
+3. Trying again in a moment
+
+If the problem persists, contact support."""
+
+# error_response() variants resolved once so each call is a single .format()
+_ERROR_WITH_DETAILS_TEMPLATE: Final[str] = _ERROR_TEMPLATE.replace("{detail_line}", "\nDetails: {details}")
+_ERROR_NO_DETAILS_TEMPLATE: Final[str] = _ERROR_TEMPLATE.replace("{detail_line}", "")
+
 
-        USED BY: Optional - multi-document aggregation
-        PURPOSE: Combines multiple sources into unified response
-        """
-        docs_formatted = "\n\n".join(
-            f"<DOC_{i+1}>\n{doc}\n</DOC_{i+1}>"
-            for i, doc in enumerate(documents)
+def _escape_attr(value: str) -> str:
+    """Escape a value for use inside a double-quoted XML attribute."""
+    return (
+        value.replace("&", "&amp;")
+        .replace('"', "&quot;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+    )
+
+
+@lru_cache(maxsize=256)
+def _format_rag_context_cached(
+    query: Optional[str],
+    documents: Tuple[Tuple, ...],
+    include_scores: bool,
+) -> str:
+    """Render the <RETRIEVED_CONTEXT> block for format_rag_context().
+
+    Popular queries hit the same top-k chunks, so the rendered block is
+    memoized on the (rank, source, text, score) tuples of the results.
+    """
+    # Pick the document template once rather than per result
+    format_document = _RAG_DOCUMENT_WITH_SCORE if include_scores else _RAG_DOCUMENT
+    n = len(documents)
+    # Header + one slot per document + closing tag (+ query), sized up front.
+    # The query goes last so the header and documents stay a stable prefix.
+    context_parts = [""] * (n + 2 if query is None else n + 3)
+    context_parts[0] = _RAG_CONTEXT_OPEN(n)
+    for i, (rank, source, text, score) in enumerate(documents, 1):
+        context_parts[i] = format_document(rank, _escape_attr(source), text, score)
+    context_parts[n + 1] = _RAG_CONTEXT_CLOSE
+    if query is not None:
+        context_parts[n + 2] = _RAG_QUERY(_escape_attr(query))
+
+    return "\n\n".join(context_parts)
+
+
+# =============================================================================
+# SHARED OUTPUT FORMAT - Reuse in all agent instructions
+# =============================================================================
+HTML_OUTPUT_FORMAT: Final[str] = _HTML_OUTPUT_FORMAT
+
+
+# =============================================================================
+# AGENT SYSTEM PROMPTS
+# =============================================================================
+
+def oip_assistant_system() -> str:
+    """Main OIP Assistant system prompt for Google ADK agent.
+
+    USED BY: root_agent (oip_expert sub-agent) in my_agent/agent.py
+    CONTROLS: Overall response style, length, and behavior
+
+    PROMPT STRUCTURE: Persona, instructions, terse HTML output rules with a
+    single example, guardrails. Kept short because it is sent every turn.
+
+    Returns the same module-level string object on every call so the
+    provider's prompt-prefix cache always hits.
+    """
+    return _OIP_ASSISTANT_SYSTEM
+
+
+# =============================================================================
+# RAG CONTEXT FORMATTING
+# =============================================================================
+
+def format_rag_context(
+    results: List[Dict],
+    query: Optional[str] = None,
+    include_scores: bool = True
+) -> str:
+    """Format retrieved documents into structured context.
+
+    USED BY: search_oip_documents() in my_agent/tools/rag_tool.py
+    PURPOSE: Wraps retrieved FAISS results in XML tags for LLM consumption
+
+    Args:
+        results: List of dicts with 'text', 'source', 'score', 'rank' keys,
+            and optionally 'chunk_index'. Documents are emitted sorted by
+            (source, chunk_index), not by rank, so near-tie score jitter
+            between runs can't reorder the prompt and break prefix caching;
+            the rank attribute still carries the retrieval order.
+        query: Original user query, emitted as a trailing <QUERY> element so
+            the block's prefix is identical across questions. Omitted when
+            None, since the query is already the latest user message.
+        include_scores: Whether to show relevance scores
+
+    Returns:
+        Formatted context string with clear structure
+    """
+    if not results:
+        return "<NO_DOCUMENTS_FOUND/>"
+
+    results = sorted(results, key=_document_order)
+    try:
+        # rag_tool always supplies every key, so this is the common path
+        documents = tuple(map(_RESULT_FIELDS, results))
+    except KeyError:
+        documents = tuple(
+            (get("rank", "?"), get("source", "Unknown"), get("text", ""), get("score", 0))
+            for get in (result.get for result in results)
         )
+    return _format_rag_context_cached(query, documents, include_scores)
+
+
+# =============================================================================
+# RAG QA PROMPTS (for prompt chaining if needed)
+# =============================================================================
+
+def rag_qa_prompt(context: str, question: str) -> str:
+    """Generate answer from retrieved context (for direct LLM calls).
+
+    USED BY: Optional - direct OpenRouter/LLM calls outside ADK
+    PURPOSE: Standalone RAG QA without agent framework
+    NOT USED BY: ADK agents (they use oip_assistant_system instead)
+    """
+    return _RAG_QA_TEMPLATE.format(context=context, question=question)
+
+
+def rag_qa_with_history(
+    context: str,
+    question: str,
+    chat_history: Optional[List[Dict]] = None
+) -> str:
+    """RAG QA prompt with conversation history for follow-up questions.
+
+    USED BY: Optional - multi-turn direct LLM calls
+    PURPOSE: Maintains context across conversation turns
+    NOT USED BY: ADK agents (ADK handles history internally)
+    """
+    history_section = ""
+    if chat_history:
+        recent = chat_history[-_HISTORY_WINDOW:]
+        history_body = "\n".join(
+            f"{get('role', 'user').upper()}: {get('content', '')}"
+            for get in (msg.get for msg in recent)
+        )
+        history_section = f"""<CONVERSATION_HISTORY>
+{history_body}
+</CONVERSATION_HISTORY>
+
+"""
+
+    return _RAG_QA_WITH_HISTORY_TEMPLATE.format(history_section=history_section, context=context, question=question)
+
+
+# =============================================================================
+# QUERY PROCESSING (for advanced RAG pipelines)
+# =============================================================================
+
+def query_rewrite_prompt(query: str) -> str:
+    """Rewrite query for better retrieval (prompt chaining step 1).
+
+    USED BY: Optional - advanced RAG pipeline with query preprocessing
+    PURPOSE: Improves retrieval by expanding/clarifying user queries
+    """
+    return _QUERY_REWRITE_TEMPLATE.format(query=query)
+
+
+def query_expansion_prompt(query: str, num_variations: int = 3) -> str:
+    """Generate query variations for fusion retrieval.
+
+    USED BY: Optional - hybrid/fusion search implementations
+    PURPOSE: Creates multiple query variants for broader retrieval
+    """
+    template = _QUERY_EXPANSION_BY_N.get(num_variations)
+    if template is None:
+        return _QUERY_EXPANSION_TEMPLATE.format(query=query, num_variations=num_variations)
+    return template.format(query=query)
+
+
+def query_classification_prompt(query: str) -> str:
+    """Classify query intent for adaptive retrieval.
+
+    USED BY: Optional - intent-based routing systems
+    PURPOSE: Categorizes queries to adjust retrieval strategy
+    """
+    return _QUERY_CLASSIFICATION_TEMPLATE.format(query=query)
+
 
-        return f"""<TASK>
+# =============================================================================
+# SUMMARIZATION (for long contexts)
+# =============================================================================
+
+def summarize_chunk_prompt(text: str, max_sentences: int = 3) -> str:
+    """Summarize a single document chunk.
+
+    USED BY: Optional - long document processing
+    PURPOSE: Condenses chunks before final synthesis
+    """
+    template = _SUMMARIZE_CHUNK_BY_N.get(max_sentences)
+    if template is None:
+        return _SUMMARIZE_CHUNK_TEMPLATE.format(text=text, max_sentences=max_sentences)
+    return template.format(text=text)
+
+
+def synthesize_documents_prompt(documents: List[str]) -> str:
+    """Synthesize multiple documents into coherent summary.
+
+    USED BY: Optional - multi-document aggregation
+    PURPOSE: Combines multiple sources into unified response
+    """
+    docs_formatted = "\n\n".join(
+        f"<DOC_{n}>\n{doc}\n</DOC_{n}>"
+        for n, doc in enumerate(documents, 1)
+    )
+
+    return f"""<TASK>
 Synthesize the following documents into a coherent summary.
 Identify key themes, agreements, and any contradictions.
 </TASK>
@@ -433,117 +551,112 @@ Identify key themes, agreements, and any contradictions.
 
 <SYNTHESIS>"""
 
-    # =========================================================================
-    # ERROR HANDLING
-    # =========================================================================
 
-    @staticmethod
-    def no_results_response(query: str) -> str:
-        """Response when no documents are found.
+# =============================================================================
+# ERROR HANDLING
+# =============================================================================
 
-        USED BY: search_oip_documents() in my_agent/tools/rag_tool.py
-        PURPOSE: Fallback message when FAISS returns empty results
-        """
-        return f"""I searched the OIP documentation but couldn't find specific information about "{query}".
+@lru_cache(maxsize=256)
+def no_results_response(query: str) -> str:
+    """Response when no documents are found.
 
-Possible reasons:
-1. The topic isn't covered in the current documentation
-2. Try rephrasing with different terms (e.g., technical vs. general)
-3. The information might be in a document not yet indexed
+    USED BY: search_oip_documents() in my_agent/tools/rag_tool.py
+    PURPOSE: Fallback message when FAISS returns empty results
+    """
+    return _NO_RESULTS_TEMPLATE.format(query=query)
 
-Would you like me to help rephrase your question?"""
 
-    @staticmethod
-    def error_response(error_type: str, details: str = "") -> str:
-        """Response when an error occurs.
+@lru_cache(maxsize=256)
+def error_response(error_type: str, details: str = "") -> str:
+    """Response when an error occurs.
 
-        USED BY: search_oip_documents() in my_agent/tools/rag_tool.py
-        PURPOSE: User-friendly error messages for system failures
-        """
-        detail_line = f"\nDetails: {details}" if details else ""
-        return f"""I encountered an issue while processing your request.
+    USED BY: search_oip_documents() in my_agent/tools/rag_tool.py
+    PURPOSE: User-friendly error messages for system failures
+    """
+    if details:
+        return _ERROR_WITH_DETAILS_TEMPLATE.format(error_type=error_type, details=details)
+    return _ERROR_NO_DETAILS_TEMPLATE.format(error_type=error_type)
 
-Error: {error_type}{detail_line}
 
-Please try:
-1. Rephrasing your question
-2. Being more specific
-3. Trying again in a moment
+# =============================================================================
+# FOLLOW-UP SUGGESTIONS
+# =============================================================================
 
-If the problem persists, contact support."""
+def suggestions_prompt() -> str:
+    """System prompt for generating contextual follow-up suggestions.
 
-    # =========================================================================
-    # FOLLOW-UP SUGGESTIONS
-    # =========================================================================
-
-    @staticmethod
-    def suggestions_prompt() -> str:
-        """System prompt for generating contextual follow-up suggestions.
-
-        USED BY: generate_suggestions() in my_agent/tools/suggestions.py
-        PURPOSE: Tells the LLM how to produce short, relevant follow-up questions
-        """
-        return (
-            "You generate follow-up question suggestions for the OIP Assistant chatbot.\n\n"
-            "## CHATBOT SCOPE — only suggest questions within these capabilities:\n\n"
-            "1. **Ticket Analytics**: ticket status, SLA breaches, completion rates, "
-            "workload, ticket trends over time, breakdowns by project/team/region, charts\n"
-            "2. **Engineer Analytics**: engineer performance, tickets per engineer, "
-            "daily activity logs (work hours, distance, activity types TR/PM/Other), "
-            "certification status, engineer charts\n"
-            "3. **Inventory Analytics**: spare parts consumption, parts used per site, "
-            "inventory by category/project, consumption charts\n"
-            "4. **PM Checklists**: site equipment data (Panel IPs, models), "
-            "door contacts, motion detectors, PM visit summaries\n"
-            "5. **OIP Documentation**: how the OIP platform works, ticket workflows, "
-            "SLA rules, system modules\n\n"
-            "## HARD BOUNDARIES — NEVER suggest these:\n"
-            "- General knowledge (weather, news, coding, math)\n"
-            "- Actions the chatbot cannot do (create tickets, assign tasks, send emails)\n"
-            "- Questions about other systems or platforms\n"
-            "- Anything outside the 5 capabilities listed above\n\n"
-            "## RULES:\n"
-            "- Return ONLY a JSON array of 3-4 short questions\n"
-            "- Each question must be under 60 characters\n"
-            "- Questions must be diverse (don't repeat the user's question)\n"
-            "- Questions should be natural follow-ups to the conversation\n"
-            "- Make questions actionable — things the user can ask next\n"
-            "- If the last response was about tickets, suggest engineer/inventory/chart follow-ups\n"
-            "- If the last response was about engineers, suggest chart/certification/hours follow-ups\n"
-            "- Do NOT include any explanation, just the JSON array\n\n"
-            "Example output:\n"
-            '[\"Show SLA breaches by project\", \"Chart daily activity logs\", '
-            '\"Which certifications are expiring?\", \"Compare teams side by side\"]'
-        )
+    USED BY: generate_suggestions() in my_agent/tools/suggestions.py
+    PURPOSE: Tells the LLM how to produce short, relevant follow-up questions
+    """
+    return (
+        "You generate follow-up question suggestions for the OIP Assistant chatbot.\n\n"
+        "## CHATBOT SCOPE — only suggest questions within these capabilities:\n\n"
+        "1. **Ticket Analytics**: ticket status, SLA breaches, completion rates, "
+        "workload, ticket trends over time, breakdowns by project/team/region, charts\n"
+        "2. **Engineer Analytics**: engineer performance, tickets per engineer, "
+        "daily activity logs (work hours, distance, activity types TR/PM/Other), "
+        "certification status, engineer charts\n"
+        "3. **Inventory Analytics**: spare parts consumption, parts used per site, "
+        "inventory by category/project, consumption charts\n"
+        "4. **PM Checklists**: site equipment data (Panel IPs, models), "
+        "door contacts, motion detectors, PM visit summaries\n"
+        "5. **OIP Documentation**: how the OIP platform works, ticket workflows, "
+        "SLA rules, system modules\n\n"
+        "## HARD BOUNDARIES — NEVER suggest these:\n"
+        "- General knowledge (weather, news, coding, math)\n"
+        "- Actions the chatbot cannot do (create tickets, assign tasks, send emails)\n"
+        "- Questions about other systems or platforms\n"
+        "- Anything outside the 5 capabilities listed above\n\n"
+        "## RULES:\n"
+        "- Return ONLY a JSON array of 3-4 short questions\n"
+        "- Each question must be under 60 characters\n"
+        "- Questions must be diverse (don't repeat the user's question)\n"
+        "- Questions should be natural follow-ups to the conversation\n"
+        "- Make questions actionable — things the user can ask next\n"
+        "- If the last response was about tickets, suggest engineer/inventory/chart follow-ups\n"
+        "- If the last response was about engineers, suggest chart/certification/hours follow-ups\n"
+        "- Do NOT include any explanation, just the JSON array\n\n"
+        "Example output:\n"
+        '[\"Show SLA breaches by project\", \"Chart daily activity logs\", '
+        '\"Which certifications are expiring?\", \"Compare teams side by side\"]'
+    )
+
+
+# =============================================================================
+# FUTURE: CHART/DATA PROMPTS
+# =============================================================================
+
+def extract_data_prompt(text: str, data_type: str = "metrics") -> str:
+    """Extract structured data from text for visualization.
+
+    USED BY: Future - chart/data extraction features
+    PURPOSE: Converts text to structured JSON for visualizations
+    """
+    return _EXTRACT_DATA_TEMPLATE.format(text=text, data_type=data_type)
 
-    # =========================================================================
-    # FUTURE: CHART/DATA PROMPTS
-    # =========================================================================
 
-    @staticmethod
-    def extract_data_prompt(text: str, data_type: str = "metrics") -> str:
-        """Extract structured data from text for visualization.
+# =============================================================================
+# BACKWARD-COMPATIBLE NAMESPACE
+# =============================================================================
 
-        USED BY: Future - chart/data extraction features
-        PURPOSE: Converts text to structured JSON for visualizations
-        """
-        return f"""<TASK>
-Extract {data_type} from the following text.
-Return as JSON format.
-</TASK>
 
-<TEXT>
-{text}
-</TEXT>
+class Prompts:
+    """Namespace kept for existing ``Prompts.<name>`` callers.
 
-<OUTPUT_FORMAT>
-{{
-  "data_type": "{data_type}",
-  "items": [
-    {{"label": "...", "value": ..., "unit": "..."}}
-  ],
-  "source": "extracted from text"
-}}
-</OUTPUT_FORMAT>
+    New code should import the module-level functions directly.
+    """
 
-<EXTRACTED_DATA>"""
+    HTML_OUTPUT_FORMAT = HTML_OUTPUT_FORMAT
+    oip_assistant_system = staticmethod(oip_assistant_system)
+    format_rag_context = staticmethod(format_rag_context)
+    rag_qa_prompt = staticmethod(rag_qa_prompt)
+    rag_qa_with_history = staticmethod(rag_qa_with_history)
+    query_rewrite_prompt = staticmethod(query_rewrite_prompt)
+    query_expansion_prompt = staticmethod(query_expansion_prompt)
+    query_classification_prompt = staticmethod(query_classification_prompt)
+    summarize_chunk_prompt = staticmethod(summarize_chunk_prompt)
+    synthesize_documents_prompt = staticmethod(synthesize_documents_prompt)
+    no_results_response = staticmethod(no_results_response)
+    error_response = staticmethod(error_response)
+    suggestions_prompt = staticmethod(suggestions_prompt)
+    extract_data_prompt = staticmethod(extract_data_prompt)
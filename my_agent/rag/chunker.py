@@ -1,8 +1,22 @@
 """Document chunking strategies for RAG"""
-from typing import List
+import os
+import re
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import List, Optional, Tuple
 from ..models import Document, DocumentChunk, ChunkMetadata
 from ..config import RAGConfig
 
+# Sentence end (". ", "! ", "? ") or line break; chunks split right after it
+_SENTENCE_BREAK = re.compile(r"[.!?] |\n")
+
+# (start, end) offsets of every _SENTENCE_BREAK match, as two sorted lists
+_Breaks = Tuple[List[int], List[int]]
+
+# Below this many documents, process start-up costs more than it saves
+_PARALLEL_MIN_DOCS = 8
+
 
 class SemanticChunker:
     """Split documents into semantic chunks with overlap"""
@@ -36,8 +50,9 @@ class SemanticChunker:
         # Split by paragraphs first (respects semantic boundaries)
         paragraphs = self._split_paragraphs(text)
 
-        # Merge small paragraphs, split large ones
-        raw_chunks = self._merge_and_split(paragraphs)
+        # Merge small paragraphs, split large ones; sentence breaks are
+        # found in one scan of the document and shared by every split
+        raw_chunks = self._merge_and_split(paragraphs, self._find_breaks(text))
 
         # Create DocumentChunk objects
         total_chunks = len(raw_chunks)
@@ -57,51 +72,86 @@ class SemanticChunker:
 
         return chunks
 
-    def _split_paragraphs(self, text: str) -> List[str]:
-        """Split text into paragraphs."""
+    def _split_paragraphs(self, text: str) -> List[Tuple[int, str]]:
+        """Split text into paragraphs, each with its offset in ``text``."""
+        paragraphs = []
+        pos = 0
         # Split on double newlines (paragraph breaks)
-        paragraphs = text.split("\n\n")
-        # Filter empty paragraphs
-        return [p.strip() for p in paragraphs if p.strip()]
-
-    def _merge_and_split(self, paragraphs: List[str]) -> List[str]:
+        for raw in text.split("\n\n"):
+            para = raw.strip()
+            # Filter empty paragraphs
+            if para:
+                paragraphs.append((pos + len(raw) - len(raw.lstrip()), para))
+            pos += len(raw) + 2
+        return paragraphs
+
+    @staticmethod
+    def _find_breaks(text: str) -> _Breaks:
+        """Locate every sentence break in ``text`` in a single scan."""
+        starts: List[int] = []
+        ends: List[int] = []
+        for match in _SENTENCE_BREAK.finditer(text):
+            starts.append(match.start())
+            ends.append(match.end())
+        return starts, ends
+
+    def _merge_and_split(
+        self, paragraphs: List[Tuple[int, str]], breaks: _Breaks
+    ) -> List[str]:
         """Merge small paragraphs and split large ones."""
         chunks = []
-        current_chunk = ""
+        # Paragraphs of the chunk being built; joined once on flush
+        current_parts: List[str] = []
+        current_len = 0  # length of "\n\n".join(current_parts)
 
-        for para in paragraphs:
+        for offset, para in paragraphs:
             # If paragraph alone exceeds chunk size, split it
             if len(para) > self.chunk_size:
                 # Save current chunk if exists
-                if current_chunk:
-                    chunks.append(current_chunk)
-                    current_chunk = ""
+                if current_parts:
+                    chunks.append("\n\n".join(current_parts))
+                    current_parts = []
+                    current_len = 0
 
                 # Split large paragraph with overlap
-                para_chunks = self._split_with_overlap(para)
+                para_chunks = self._split_with_overlap(para, offset, breaks)
                 chunks.extend(para_chunks)
 
             # If adding paragraph exceeds chunk size, save current and start new
-            elif len(current_chunk) + len(para) + 2 > self.chunk_size:
-                if current_chunk:
-                    chunks.append(current_chunk)
-                current_chunk = para
+            elif current_len + len(para) + 2 > self.chunk_size:
+                if current_parts:
+                    chunks.append("\n\n".join(current_parts))
+                current_parts = [para]
+                current_len = len(para)
 
             # Otherwise, add to current chunk
             else:
-                if current_chunk:
-                    current_chunk += "\n\n" + para
+                if current_parts:
+                    current_len += len(para) + 2
                 else:
-                    current_chunk = para
+                    current_len = len(para)
+                current_parts.append(para)
 
         # Don't forget the last chunk
-        if current_chunk:
-            chunks.append(current_chunk)
+        if current_parts:
+            chunks.append("\n\n".join(current_parts))
 
         return chunks
 
-    def _split_with_overlap(self, text: str) -> List[str]:
-        """Split long text with overlap."""
+    def _split_with_overlap(
+        self, text: str, offset: int = 0, breaks: Optional[_Breaks] = None
+    ) -> List[str]:
+        """Split long text with overlap.
+
+        Args:
+            text: Text to split
+            offset: Position of ``text`` within the text ``breaks`` indexes
+            breaks: Precomputed sentence breaks (see _find_breaks); found
+                in ``text`` itself when omitted
+        """
+        if breaks is None:
+            breaks, offset = self._find_breaks(text), 0
+        break_starts, break_ends = breaks
         chunks = []
         start = 0
 
@@ -110,12 +160,11 @@ class SemanticChunker:
 
             # If not at end, try to break at sentence boundary
             if end < len(text):
-                # Look for sentence end near chunk boundary
-                for sep in [". ", "! ", "? ", "\n"]:
-                    last_sep = text.rfind(sep, start, end)
-                    if last_sep > start + self.chunk_size // 2:
-                        end = last_sep + 1
-                        break
+                # Last sentence break ending inside the window, if it
+                # starts in the back half
+                i = bisect_right(break_ends, offset + end) - 1
+                if i >= 0 and break_starts[i] >= offset + start + self.chunk_size // 2 + 1:
+                    end = break_starts[i] - offset + 1
 
             chunk = text[start:end].strip()
             if chunk:
@@ -135,8 +184,14 @@ class SemanticChunker:
         Returns:
             List of all chunks from all documents
         """
-        all_chunks = []
-        for doc in documents:
-            chunks = self.chunk_document(doc)
-            all_chunks.extend(chunks)
-        return all_chunks
+        if len(documents) <= _PARALLEL_MIN_DOCS or (os.cpu_count() or 1) < 2:
+            all_chunks = []
+            for doc in documents:
+                chunks = self.chunk_document(doc)
+                all_chunks.extend(chunks)
+            return all_chunks
+
+        # Chunking is pure-Python CPU work: fan documents out across cores
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(self.chunk_document, documents, chunksize=4)
+            return list(chain.from_iterable(results))
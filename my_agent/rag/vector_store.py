@@ -1,13 +1,68 @@
 """FAISS vector store for document embeddings"""
-import json
+import asyncio
+import hashlib
+import os
+import struct
+import sys
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
 
-from ..models import DocumentChunk, SearchResult, ChunkMetadata
+from ..models import ChunkMetadata, DocumentChunk, DocumentType, SearchResult
 from ..config import FAISS_INDEX_DIR, RAGConfig
 
+# orjson is an optional speedup for the metadata.json sidecar
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    import json
+    from json import loads as _json_loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+# Categorical codes for the doc_type column (-1 = unknown)
+_DOC_TYPE_VOCAB: Tuple[DocumentType, ...] = tuple(DocumentType)
+_DOC_TYPE_CODES: Dict[DocumentType, int] = {t: i for i, t in enumerate(_DOC_TYPE_VOCAB)}
+
+
+def _tmp_path(path: Path) -> Path:
+    """Sibling path that save() writes before swapping the file into place."""
+    return path.with_name(path.name + ".tmp")
+
+
+class _MappedTexts(Sequence[str]):
+    """Read-only chunk texts backed by a memory-mapped UTF-8 blob.
+
+    Only the bytes of texts that are actually returned by a search are
+    paged in and decoded; worker processes share the mapped pages.
+    """
+
+    def __init__(self, blob_file: Path, offsets_file: Path):
+        self._offsets = np.load(offsets_file, mmap_mode="r")
+        if blob_file.stat().st_size:
+            self._blob = np.memmap(blob_file, dtype=np.uint8, mode="r")
+        else:
+            self._blob = np.empty(0, dtype=np.uint8)  # mmap rejects empty files
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def intact(self) -> bool:
+        """Whether the offsets end exactly at the end of the blob."""
+        return len(self._offsets) > 0 and int(self._offsets[-1]) == len(self._blob)
+
+    def __getitem__(self, idx: int) -> str:
+        if idx < 0:
+            idx += len(self)
+        start, end = self._offsets[idx], self._offsets[idx + 1]
+        return self._blob[start:end].tobytes().decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        return (self[i] for i in range(len(self)))
+
 
 class FAISSVectorStore:
     """FAISS-based vector storage and retrieval"""
@@ -16,12 +71,14 @@ class FAISSVectorStore:
         self,
         dimension: int = RAGConfig.EMBEDDING_DIMENSION,
         index_path: Optional[str] = None,
+        index_type: str = RAGConfig.FAISS_INDEX_TYPE,
     ):
         """Initialize vector store.
 
         Args:
             dimension: Embedding vector dimension (1536 for ada-002)
             index_path: Path to store/load index
+            index_type: faiss.index_factory spec, e.g. "HNSW32,SQ8" or "Flat"
         """
         try:
             import faiss
@@ -30,24 +87,125 @@ class FAISSVectorStore:
             raise ImportError("FAISS required: pip install faiss-cpu")
 
         self.dimension = dimension
+        self.index_type = index_type
         self.index_path = Path(index_path) if index_path else FAISS_INDEX_DIR
+        # On-disk layout, resolved once for save/load/exists
+        self._index_file = self.index_path / "index.faiss"
+        self._data_file = self.index_path / "metadata.json"
+        self._texts_file = self.index_path / "texts.bin"
+        self._offsets_file = self.index_path / "texts_offsets.npy"
 
         self.index: Optional[object] = None
-        self.metadata: List[dict] = []
-        self.texts: List[str] = []
+        # True when vectors are unit-length in an inner-product index, so
+        # search distances are already cosine similarities
+        self.normalized = True
+        # Search results keyed by hash of (query vector, top_k, threshold),
+        # plus a semantic cache of past query vectors (see clear_cache)
+        self._result_cache: OrderedDict[bytes, List[SearchResult]] = OrderedDict()
+        self.clear_cache()
+        self._reset_columns()
+        self.texts: Sequence[str] = []
 
     def create_index(self) -> None:
         """Create a new empty FAISS index."""
-        # IndexFlatL2 for exact search (good for small-medium datasets)
-        self.index = self.faiss.IndexFlatL2(self.dimension)
-        self.metadata = []
+        # HNSW graph by default: approximate search in ~O(log N) instead of
+        # a full scan, over int8-quantized vectors; "Flat" keeps exact
+        # float32 search for tiny corpora
+        self.index = self.faiss.index_factory(
+            self.dimension, self.index_type, self.faiss.METRIC_INNER_PRODUCT
+        )
+        self.normalized = True
+        hnsw = getattr(self.index, "hnsw", None)
+        if hnsw is not None:
+            hnsw.efConstruction = RAGConfig.HNSW_EF_CONSTRUCTION
+        self._reset_columns()
         self.texts = []
+        self.clear_cache()
+
+    def _reset_columns(self) -> None:
+        """Empty the per-chunk metadata columns.
 
-    def add_documents(self, chunks: List[DocumentChunk]) -> int:
+        Metadata is stored column-wise (one array per field, row i = vector
+        id i) so filters like ``source == X`` are single NumPy comparisons.
+        """
+        self._sources = np.empty(0, dtype=object)
+        self._pages = np.empty(0, dtype=np.int32)  # -1 = no page
+        self._chunk_index = np.empty(0, dtype=np.int32)
+        self._total_chunks = np.empty(0, dtype=np.int32)
+        self._doc_types = np.empty(0, dtype=np.int8)  # codes into _DOC_TYPE_VOCAB
+        # ChunkMetadata per row, built on first use then handed out as-is
+        self._metadata_cache: Dict[int, ChunkMetadata] = {}
+
+    def _extend_columns(self, metadata: Sequence[ChunkMetadata]) -> None:
+        """Append one row per chunk to the metadata columns."""
+        start = len(self._sources)
+        self._sources = np.concatenate([
+            self._sources,
+            np.array([sys.intern(m.source) for m in metadata], dtype=object),
+        ])
+        self._pages = np.concatenate([
+            self._pages,
+            np.array([-1 if m.page is None else m.page for m in metadata], dtype=np.int32),
+        ])
+        self._chunk_index = np.concatenate([
+            self._chunk_index,
+            np.array([m.chunk_index for m in metadata], dtype=np.int32),
+        ])
+        self._total_chunks = np.concatenate([
+            self._total_chunks,
+            np.array([m.total_chunks for m in metadata], dtype=np.int32),
+        ])
+        self._doc_types = np.concatenate([
+            self._doc_types,
+            np.array(
+                [-1 if m.doc_type is None else _DOC_TYPE_CODES[m.doc_type] for m in metadata],
+                dtype=np.int8,
+            ),
+        ])
+        # Validated on ingest: reuse the caller's instances for search results
+        self._metadata_cache.update(enumerate(metadata, start))
+
+    def _chunk_metadata(self, idx: int) -> ChunkMetadata:
+        """Return the ChunkMetadata for vector id ``idx``."""
+        metadata = self._metadata_cache.get(idx)
+        if metadata is None:
+            page = int(self._pages[idx])
+            code = int(self._doc_types[idx])
+            # Columns only ever hold validated values, so skip re-validation
+            metadata = ChunkMetadata.model_construct(
+                source=self._sources[idx],
+                page=None if page < 0 else page,
+                chunk_index=int(self._chunk_index[idx]),
+                total_chunks=int(self._total_chunks[idx]),
+                doc_type=None if code < 0 else _DOC_TYPE_VOCAB[code],
+            )
+            self._metadata_cache[idx] = metadata
+        return metadata
+
+    def _filter_ids(
+        self,
+        source_filter: Optional[str],
+        doc_type: Optional[DocumentType],
+    ) -> np.ndarray:
+        """Vector ids whose metadata matches the given filters."""
+        mask = np.ones(len(self._sources), dtype=bool)
+        if source_filter is not None:
+            mask &= self._sources == source_filter
+        if doc_type is not None:
+            mask &= self._doc_types == _DOC_TYPE_CODES[DocumentType(doc_type)]
+        return np.flatnonzero(mask).astype(np.int64)
+
+    def add_documents(
+        self,
+        chunks: List[DocumentChunk],
+        embeddings: Optional[np.ndarray] = None,
+    ) -> int:
         """Add document chunks with embeddings to index.
 
         Args:
-            chunks: List of DocumentChunk objects with embeddings
+            chunks: List of DocumentChunk objects
+            embeddings: Optional (len(chunks), dimension) array of vectors.
+                When omitted, each chunk's ``embedding`` field is used.
 
         Returns:
             Number of documents added
@@ -55,29 +213,169 @@ class FAISSVectorStore:
         if self.index is None:
             self.create_index()
 
-        embeddings = []
-        for chunk in chunks:
-            if chunk.embedding is None:
+        if not chunks:
+            return 0
+
+        if embeddings is None:
+            # Fill one contiguous float32 buffer; NumPy converts each row in C
+            vectors = np.empty((len(chunks), self.dimension), dtype=np.float32)
+            for i, chunk in enumerate(chunks):
+                if chunk.embedding is None:
+                    raise ValueError(
+                        f"Chunk missing embedding: {chunk.text[:50]}..."
+                    )
+                vectors[i] = chunk.embedding
+        else:
+            vectors = np.ascontiguousarray(embeddings, dtype=np.float32)
+            if vectors.shape != (len(chunks), self.dimension):
                 raise ValueError(
-                    f"Chunk missing embedding: {chunk.text[:50]}..."
+                    f"Expected embeddings of shape ({len(chunks)}, {self.dimension}), "
+                    f"got {vectors.shape}"
                 )
+            if vectors is embeddings:
+                # normalize_L2 works in place; don't modify the caller's array
+                vectors = vectors.copy()
+
+        if self.normalized:
+            self.faiss.normalize_L2(vectors)
+        self._train_if_needed(vectors)
+        self.index.add(vectors)
 
-            embeddings.append(chunk.embedding)
-            self.metadata.append(chunk.metadata.model_dump())
-            self.texts.append(chunk.text)
+        if not isinstance(self.texts, list):
+            self.texts = list(self.texts)
+        self.texts.extend(chunk.text for chunk in chunks)
+        self._extend_columns([chunk.metadata for chunk in chunks])
 
-        # Convert to numpy and add to index
-        if embeddings:
-            vectors = np.array(embeddings, dtype=np.float32)
-            self.index.add(vectors)
+        self.clear_cache()
+        return len(chunks)
 
-        return len(embeddings)
+    async def ingest(
+        self,
+        chunks: List[DocumentChunk],
+        embed_fn: Callable[[List[str]], Any],
+        batch_size: int = RAGConfig.EMBEDDING_BATCH_SIZE,
+        on_batch: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """Embed chunks concurrently and stream the vectors into the index.
+
+        Up to RAGConfig.INGEST_CONCURRENCY embedding calls run at once while
+        a consumer adds finished vectors in blocks of RAGConfig.INGEST_ADD_BATCH.
+        The bounded queue holds back the embedding side if indexing lags.
+        Into a new, untrained quantized index the vectors are instead held
+        until all have arrived, trained on, then added.
+
+        Args:
+            chunks: Chunks to embed and index
+            embed_fn: Maps a list of texts to their vectors, e.g.
+                OpenRouterClient.get_embeddings. Blocking functions run in
+                a worker thread; coroutine functions are awaited.
+            batch_size: Texts per embedding call
+            on_batch: Optional callback, called with the batch length each
+                time a batch of embeddings arrives
+
+        Returns:
+            Number of documents added
+        """
+        if self.index is None:
+            self.create_index()
+
+        if not chunks:
+            return 0
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=RAGConfig.INGEST_QUEUE_SIZE)
+        semaphore = asyncio.Semaphore(RAGConfig.INGEST_CONCURRENCY)
+        is_coroutine = asyncio.iscoroutinefunction(embed_fn)
+
+        async def produce(start: int) -> None:
+            batch = chunks[start : start + batch_size]
+            texts = [chunk.text for chunk in batch]
+            async with semaphore:
+                if is_coroutine:
+                    embeddings = await embed_fn(texts)
+                else:
+                    embeddings = await asyncio.to_thread(embed_fn, texts)
+            await queue.put((batch, embeddings))
+
+        # A quantized index learns its value ranges from its first add; an
+        # untrained one buffers the whole corpus so it trains on all of it,
+        # not just whichever batches happened to arrive first
+        train_on_all = not self.index.is_trained
+
+        async def consume() -> int:
+            # Batches arrive in completion order; vectors and their chunks
+            # are added together, so ids and metadata rows stay aligned
+            buffer = np.empty(
+                (
+                    len(chunks) if train_on_all else max(RAGConfig.INGEST_ADD_BATCH, batch_size),
+                    self.dimension,
+                ),
+                dtype=np.float32,
+            )
+            pending: List[DocumentChunk] = []
+            added = 0
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                batch, embeddings = item
+                if len(pending) + len(batch) > len(buffer):
+                    added += self.add_documents(pending, buffer[: len(pending)])
+                    pending = []
+                buffer[len(pending) : len(pending) + len(batch)] = embeddings
+                pending.extend(batch)
+                if on_batch is not None:
+                    on_batch(len(batch))
+            if train_on_all:
+                self._train_if_needed(self._prepared(buffer[: len(pending)]))
+            if pending:
+                added += self.add_documents(pending, buffer[: len(pending)])
+            return added
+
+        producers = asyncio.gather(
+            *(produce(start) for start in range(0, len(chunks), batch_size))
+        )
+        consumer = asyncio.create_task(consume())
+        try:
+            # The consumer only finishes early if indexing failed
+            await asyncio.wait(
+                [producers, consumer], return_when=asyncio.FIRST_COMPLETED
+            )
+            if consumer.done():
+                consumer.result()
+            await producers
+            await queue.put(None)
+            return await consumer
+        finally:
+            # No-op on success; on failure stop the other side and reap it
+            producers.cancel()
+            consumer.cancel()
+            await asyncio.gather(producers, consumer, return_exceptions=True)
+
+    def _prepared(self, vectors: np.ndarray) -> np.ndarray:
+        """Copy of vectors as add_documents() feeds them to the index."""
+        vectors = np.array(vectors, dtype=np.float32)
+        if self.normalized:
+            self.faiss.normalize_L2(vectors)
+        return vectors
+
+    def _train_if_needed(self, vectors: np.ndarray) -> None:
+        """Train a quantized index (e.g. SQ8) on its first batch of vectors.
+
+        The scalar quantizer learns per-dimension value ranges; the trained
+        parameters are stored in index.faiss by write_index. ingest() trains
+        on the whole corpus first; a direct add_documents() call trains on
+        the vectors it is given, so pass a representative set the first time.
+        """
+        if not self.index.is_trained:
+            self.index.train(vectors)
 
     def search(
         self,
         query_embedding: List[float],
         top_k: int = RAGConfig.DEFAULT_TOP_K,
         threshold: float = RAGConfig.SIMILARITY_THRESHOLD,
+        source_filter: Optional[str] = None,
+        doc_type: Optional[DocumentType] = None,
     ) -> List[SearchResult]:
         """Search for similar documents.
 
@@ -85,6 +383,8 @@ class FAISSVectorStore:
             query_embedding: Query vector
             top_k: Number of results to return
             threshold: Minimum similarity score (0-1)
+            source_filter: Only return chunks from this source file
+            doc_type: Only return chunks of this document type
 
         Returns:
             List of SearchResult objects
@@ -92,56 +392,241 @@ class FAISSVectorStore:
         if self.index is None or self.index.ntotal == 0:
             return []
 
-        # Search
         query_vector = np.array([query_embedding], dtype=np.float32)
-        distances, indices = self.index.search(query_vector, top_k)
 
-        results = []
-        for dist, idx in zip(distances[0], indices[0]):
-            if idx < 0:  # Invalid index
-                continue
+        # Repeated questions produce identical embeddings: serve from the LRU
+        filtered = source_filter is not None or doc_type is not None
+        key_data = query_vector.tobytes() + struct.pack("<id", top_k, threshold)
+        if filtered:
+            key_data += repr((source_filter, doc_type)).encode("utf-8")
+        cache_key = hashlib.blake2b(key_data, digest_size=16).digest()
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            self._result_cache.move_to_end(cache_key)
+            return list(cached)
+
+        # Near-duplicate questions ("what is OIP" / "tell me about OIP")
+        # (filtered searches skip it; its entries don't record the filters)
+        unit_query = query_vector if self.normalized else query_vector.copy()
+        self.faiss.normalize_L2(unit_query)
+        if not filtered:
+            cached = self._semantic_lookup(unit_query, top_k, threshold)
+            if cached is not None:
+                self._remember(cache_key, cached)
+                return list(cached)
+
+        results = self._search_index(
+            query_vector, top_k, threshold, source_filter, doc_type
+        )[0]
+
+        self._remember(cache_key, results)
+        if not filtered:
+            self._semantic_store(unit_query, top_k, threshold, results)
+
+        return list(results)
+
+    def search_batch(
+        self,
+        query_embeddings: np.ndarray,
+        top_k: int = RAGConfig.DEFAULT_TOP_K,
+        threshold: float = RAGConfig.SIMILARITY_THRESHOLD,
+        source_filter: Optional[str] = None,
+        doc_type: Optional[DocumentType] = None,
+    ) -> List[List[SearchResult]]:
+        """Search for several queries in one FAISS call.
 
-            # Convert L2 distance to similarity score (0-1)
-            # Lower distance = higher similarity
-            score = 1 / (1 + float(dist))
+        Database vectors are streamed once for the whole batch, so e.g. 4
+        query variations cost far less than 4 search() calls. Results are
+        not cached.
 
-            if score < threshold:
-                continue
+        Args:
+            query_embeddings: (num_queries, dimension) array of query vectors
+            top_k: Number of results to return per query
+            threshold: Minimum similarity score (0-1)
+            source_filter: Only return chunks from this source file
+            doc_type: Only return chunks of this document type
 
-            results.append(
+        Returns:
+            One list of SearchResult objects per query, in input order
+        """
+        queries = np.array(query_embeddings, dtype=np.float32).reshape(-1, self.dimension)
+        if self.index is None or self.index.ntotal == 0:
+            return [[] for _ in range(len(queries))]
+        if self.normalized:
+            self.faiss.normalize_L2(queries)
+        return self._search_index(queries, top_k, threshold, source_filter, doc_type)
+
+    def search_fused(
+        self,
+        query_embeddings: np.ndarray,
+        top_k: int = RAGConfig.DEFAULT_TOP_K,
+        threshold: float = RAGConfig.SIMILARITY_THRESHOLD,
+        rrf_k: int = 60,
+    ) -> List[SearchResult]:
+        """Multi-query retrieval merged with reciprocal-rank fusion.
+
+        Each chunk scores sum(1 / (rrf_k + rank)) over the query lists it
+        appears in; results keep the best similarity seen for the chunk.
+
+        Args:
+            query_embeddings: (num_queries, dimension) array, e.g. the
+                original question plus its query_expansion_prompt variations
+            top_k: Number of fused results to return
+            threshold: Minimum similarity score (0-1) for each hit
+            rrf_k: RRF damping constant (60 in the original paper)
+
+        Returns:
+            List of SearchResult objects, best fused rank first
+        """
+        fused: Dict[Tuple[str, int], float] = {}
+        best: Dict[Tuple[str, int], SearchResult] = {}
+        for results in self.search_batch(query_embeddings, top_k, threshold):
+            for rank, result in enumerate(results, 1):
+                key = (result.metadata.source, result.metadata.chunk_index)
+                fused[key] = fused.get(key, 0.0) + 1.0 / (rrf_k + rank)
+                if key not in best or result.score > best[key].score:
+                    best[key] = result
+        ranked = sorted(fused, key=fused.__getitem__, reverse=True)
+        return [best[key] for key in ranked[:top_k]]
+
+    def _search_index(
+        self,
+        queries: np.ndarray,
+        top_k: int,
+        threshold: float,
+        source_filter: Optional[str],
+        doc_type: Optional[DocumentType],
+    ) -> List[List[SearchResult]]:
+        """Run one FAISS search for a (num_queries, dimension) matrix."""
+        # Search (HNSW: wider beam for larger k keeps recall up)
+        hnsw = getattr(self.index, "hnsw", None)
+        ef_search = max(top_k * 4, RAGConfig.HNSW_EF_SEARCH)
+        if hnsw is not None:
+            hnsw.efSearch = ef_search
+
+        params = None
+        if source_filter is not None or doc_type is not None:
+            # Prefilter on the metadata columns; FAISS skips other ids in C
+            ids = self._filter_ids(source_filter, doc_type)
+            if ids.size == 0:
+                return [[] for _ in range(len(queries))]
+            selector = self.faiss.IDSelectorBatch(ids)
+            if hnsw is not None:
+                params = self.faiss.SearchParametersHNSW(sel=selector, efSearch=ef_search)
+            else:
+                params = self.faiss.SearchParameters(sel=selector)
+
+        distances, indices = self.index.search(queries, top_k, params=params)
+
+        # Score and filter all hits in one vectorized pass
+        if self.normalized:
+            # Inner product of unit vectors = cosine similarity
+            scores = distances
+        else:
+            # Legacy L2 index: map distance to a 0-1 similarity
+            scores = 1 / (1 + distances)
+        keep = (indices >= 0) & (scores >= threshold)  # -1 = no hit
+
+        return [
+            [
                 SearchResult(
                     text=self.texts[idx],
                     score=score,
-                    metadata=ChunkMetadata(**self.metadata[idx]),
+                    metadata=self._chunk_metadata(idx),
                 )
-            )
-
+                for idx, score in zip(row_ids[row_keep].tolist(), row_scores[row_keep].tolist())
+            ]
+            for row_ids, row_scores, row_keep in zip(indices, scores, keep)
+        ]
+
+    def _remember(self, cache_key: bytes, results: List[SearchResult]) -> None:
+        """Insert into the exact-match LRU, evicting the oldest entry."""
+        self._result_cache[cache_key] = results
+        if len(self._result_cache) > RAGConfig.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+    def _semantic_lookup(
+        self, unit_query: np.ndarray, top_k: int, threshold: float
+    ) -> Optional[List[SearchResult]]:
+        """Return results cached for a near-identical past query, if any."""
+        if self._semantic_index.ntotal == 0:
+            return None
+
+        similarity, ids = self._semantic_index.search(unit_query, 1)
+        if similarity[0][0] < RAGConfig.SEMANTIC_CACHE_THRESHOLD:
+            return None
+
+        cached_top_k, cached_threshold, results = self._semantic_values[int(ids[0][0])]
+        if cached_top_k != top_k or cached_threshold != threshold:
+            return None
         return results
 
+    def _semantic_store(
+        self,
+        unit_query: np.ndarray,
+        top_k: int,
+        threshold: float,
+        results: List[SearchResult],
+    ) -> None:
+        """Add a query to the semantic cache, evicting FIFO when full."""
+        entry_id = self._semantic_next_id
+        self._semantic_next_id += 1
+        self._semantic_index.add_with_ids(unit_query, np.array([entry_id], dtype=np.int64))
+        self._semantic_values[entry_id] = (top_k, threshold, results)
+
+        if len(self._semantic_values) > RAGConfig.SEMANTIC_CACHE_SIZE:
+            oldest_id, _ = self._semantic_values.popitem(last=False)
+            self._semantic_index.remove_ids(np.array([oldest_id], dtype=np.int64))
+
+    def clear_cache(self) -> None:
+        """Drop cached search results (called whenever the index changes)."""
+        self._result_cache.clear()
+        # Small inner-product index over past query vectors
+        self._semantic_index = self.faiss.IndexIDMap2(self.faiss.IndexFlatIP(self.dimension))
+        self._semantic_values: OrderedDict[int, Tuple[int, float, List[SearchResult]]] = OrderedDict()
+        self._semantic_next_id = 0
+
     def save(self) -> None:
-        """Persist index to disk."""
+        """Persist index to disk.
+
+        Each file is written under a temporary name and swapped in with
+        os.replace (metadata.json last), so a process that still has the
+        previous index loaded, with texts.bin memory-mapped, keeps reading the
+        old files. Windows can't replace a file another process has mapped:
+        stop the server there before re-ingesting.
+        """
         if self.index is None:
             raise ValueError("No index to save")
 
         self.index_path.mkdir(parents=True, exist_ok=True)
 
+        if isinstance(self.texts, _MappedTexts):
+            # Drop our own mapping of texts.bin before it is replaced
+            self.texts = list(self.texts)
+
         # Save FAISS index
-        index_file = self.index_path / "index.faiss"
-        self.faiss.write_index(self.index, str(index_file))
-
-        # Save metadata and texts
-        data_file = self.index_path / "metadata.json"
-        with open(data_file, "w", encoding="utf-8") as f:
-            json.dump(
-                {
-                    "metadata": self.metadata,
-                    "texts": self.texts,
-                    "dimension": self.dimension,
-                },
-                f,
-                ensure_ascii=False,
-                indent=2,
-            )
+        self.faiss.write_index(self.index, str(_tmp_path(self._index_file)))
+
+        # Save texts as one UTF-8 blob + offsets so load() can memory-map them
+        encoded = [text.encode("utf-8") for text in self.texts]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        with open(_tmp_path(self._texts_file), "wb") as f:
+            f.write(b"".join(encoded))
+        with open(_tmp_path(self._offsets_file), "wb") as f:
+            np.save(f, offsets)
+
+        # Save metadata
+        with open(_tmp_path(self._data_file), "wb") as f:
+            f.write(_json_dumps({
+                "columns": self._columns_to_json(),
+                "dimension": self.dimension,
+                "index_type": self.index_type,
+                "normalized": self.normalized,
+            }))
+
+        for path in (self._index_file, self._texts_file, self._offsets_file, self._data_file):
+            os.replace(_tmp_path(path), path)
 
         print(f"Index saved to {self.index_path}")
 
@@ -149,27 +634,93 @@ class FAISSVectorStore:
         """Load index from disk.
 
         Returns:
-            True if loaded successfully, False if files don't exist
+            True if loaded successfully, False if files don't exist or
+            don't belong to the same save
         """
-        index_file = self.index_path / "index.faiss"
-        data_file = self.index_path / "metadata.json"
-
-        if not index_file.exists() or not data_file.exists():
+        if not self.exists():
             return False
 
         # Load FAISS index
-        self.index = self.faiss.read_index(str(index_file))
+        self.index = self.faiss.read_index(str(self._index_file))
 
         # Load metadata and texts
-        with open(data_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            self.metadata = data["metadata"]
-            self.texts = data["texts"]
+        with open(self._data_file, "rb") as f:
+            data = _json_loads(f.read())
+            self._reset_columns()
+            if "columns" in data:
+                self._columns_from_json(data["columns"])
+            else:
+                # Older sidecars kept one model_dump() dict per chunk
+                self._extend_columns([
+                    ChunkMetadata.model_construct(
+                        **{**m, "doc_type": DocumentType(m["doc_type"]) if m.get("doc_type") else None}
+                    )
+                    for m in data["metadata"]
+                ])
+            if "texts" in data:
+                # Older sidecars kept the texts inline
+                self.texts = data["texts"]
+            else:
+                self.texts = _MappedTexts(
+                    self._texts_file,
+                    self._offsets_file,
+                )
             self.dimension = data.get("dimension", self.dimension)
+            # Indexes saved before index_type was recorded are IndexFlatL2
+            self.index_type = data.get("index_type", "Flat")
+            self.normalized = data.get("normalized", False)
+
+        # save() swaps its files in one at a time; a save interrupted midway
+        # leaves parts of two different indexes side by side
+        if not self._parts_agree():
+            print(f"Index files at {self.index_path} are inconsistent; re-run ingestion")
+            self.index = None
+            self.texts = []
+            self._reset_columns()
+            return False
 
+        self.clear_cache()
         print(f"Loaded index with {self.index.ntotal} vectors")
         return True
 
+    def exists(self) -> bool:
+        """Whether a saved index is present at index_path."""
+        if not (os.path.exists(self._index_file) and os.path.exists(self._data_file)):
+            return False
+        # Older sidecars keep the texts inline and have neither text file
+        return os.path.exists(self._texts_file) == os.path.exists(self._offsets_file)
+
+    def _parts_agree(self) -> bool:
+        """Whether the loaded index, texts and metadata describe one corpus."""
+        if isinstance(self.texts, _MappedTexts) and not self.texts.intact():
+            return False
+        return self.index.ntotal == len(self.texts) == len(self._sources)
+
+    def _columns_to_json(self) -> Dict[str, List[Any]]:
+        """Metadata columns as JSON-serializable lists."""
+        return {
+            "source": self._sources.tolist(),
+            "page": [None if p < 0 else p for p in self._pages.tolist()],
+            "chunk_index": self._chunk_index.tolist(),
+            "total_chunks": self._total_chunks.tolist(),
+            "doc_type": [
+                None if c < 0 else _DOC_TYPE_VOCAB[c].value for c in self._doc_types.tolist()
+            ],
+        }
+
+    def _columns_from_json(self, columns: Dict[str, List[Any]]) -> None:
+        """Rebuild the metadata columns saved by _columns_to_json()."""
+        self._sources = np.array([sys.intern(s) for s in columns["source"]], dtype=object)
+        self._pages = np.array(
+            [-1 if p is None else p for p in columns["page"]], dtype=np.int32
+        )
+        self._chunk_index = np.array(columns["chunk_index"], dtype=np.int32)
+        self._total_chunks = np.array(columns["total_chunks"], dtype=np.int32)
+        self._doc_types = np.array(
+            [-1 if t is None else _DOC_TYPE_CODES[DocumentType(t)] for t in columns["doc_type"]],
+            dtype=np.int8,
+        )
+
     @property
     def count(self) -> int:
         """Number of vectors in index."""
@@ -15,11 +15,40 @@ When the agent returns a chart, the response contains a JSON block marked with
 this and render using Recharts.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Final, Optional, List, Dict, Any, Tuple
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from operator import itemgetter
 import json
+import logging
 import re
 
+import numpy as np
+
+# orjson is an optional speedup for serializing chart configs
+try:
+    import orjson
+
+    def _dump_config(config: Dict[str, Any]) -> str:
+        """Serialize a chart config as indented JSON."""
+        try:
+            chart_json = orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:  # orjson.JSONEncodeError, e.g. ints beyond 64 bits
+            return json.dumps(config, indent=2)
+        # orjson writes NaN/Infinity as null and non-ASCII text unescaped;
+        # leave those configs to json.dumps so they keep NaN and \uXXXX
+        if "null" in chart_json or not chart_json.isascii():
+            return json.dumps(config, indent=2)
+        return chart_json
+except ImportError:
+    def _dump_config(config: Dict[str, Any]) -> str:
+        """Serialize a chart config as indented JSON."""
+        return json.dumps(config, indent=2)
+
+
+logger = logging.getLogger("oip_assistant.tools.chart")
+
 
 class ChartType(Enum):
     """Supported chart types for Recharts visualization."""
@@ -36,6 +65,17 @@ class ChartType(Enum):
     SCATTER = "scatter"
 
 
+# Plain-str aliases for the ChartType values used on the hot paths
+_BAR: Final[str] = ChartType.BAR.value
+_LINE: Final[str] = ChartType.LINE.value
+_PIE: Final[str] = ChartType.PIE.value
+_DONUT: Final[str] = ChartType.DONUT.value
+_AREA: Final[str] = ChartType.AREA.value
+_STACKED_BAR: Final[str] = ChartType.STACKED_BAR.value
+_GROUPED_BAR: Final[str] = ChartType.GROUPED_BAR.value
+_GAUGE: Final[str] = ChartType.GAUGE.value
+
+
 # Professional color palette (consistent with OIP branding)
 DEFAULT_COLORS = {
     "blue": "#3b82f6",
@@ -46,6 +86,8 @@ DEFAULT_COLORS = {
     "cyan": "#06b6d4",
     "slate": "#64748b",
 }
+# Default series palette for create_chart, in DEFAULT_COLORS order
+_DEFAULT_COLOR_TUPLE = tuple(DEFAULT_COLORS.values())
 
 # Status-specific colors for ticket data
 STATUS_COLORS = {
@@ -57,6 +99,18 @@ STATUS_COLORS = {
     "total": "#3b82f6",       # Blue
 }
 
+# Series colors for status-named metric keys in create_project_comparison_chart.
+# One lookahead per status, tried in priority order (a key naming several
+# statuses takes the first), so the matched group indexes the color tuple
+_STATUS_COLOR_RE = re.compile(r"(?=.*(open))|(?=.*(complete))|(?=.*(suspend))|(?=.*(pending))")
+_STATUS_COLOR_BY_GROUP = (
+    None,
+    STATUS_COLORS["open"],
+    STATUS_COLORS["completed"],
+    STATUS_COLORS["suspended"],
+    STATUS_COLORS["pending"],
+)
+
 # Extended palette for pie/donut slices (16+ distinct colors)
 PIE_COLORS = [
     "#3b82f6", "#22c55e", "#f59e0b", "#ef4444", "#8b5cf6",
@@ -65,6 +119,28 @@ PIE_COLORS = [
     "#64748b", "#facc15", "#2dd4bf", "#fb923c", "#818cf8",
 ]
 
+# Key-name patterns used by analyze_data_for_chart_type (matched on lowercased keys)
+_TIME_RE = re.compile(r"date|month|year|week|day|time|period|quarter")
+_STATUS_RE = re.compile(r"status|type|category|state")
+
+# Category-name patterns marking a binary "X vs Non-X" split in generate_insights
+_BINARY_RE = re.compile(r"non[-_]|within|remaining|other|rest")
+
+# generate_description() templates; n = data points, s = series
+_DESCRIPTION_TEMPLATES = {
+    _BAR: "Comparison of {n} categories",
+    _LINE: "Trend analysis across {n} data points",
+    _PIE: "Distribution breakdown across {n} segments",
+    _DONUT: "Distribution breakdown across {n} segments",
+    _AREA: "Cumulative trend over {n} periods",
+    _GAUGE: "Current value against target",
+    _STACKED_BAR: "Stacked comparison of {n} categories with {s} series",
+    _GROUPED_BAR: "Grouped comparison of {n} categories",
+}
+
+# From this many data points generate_insights reduces with NumPy
+_VECTORIZE_MIN_POINTS = 64
+
 
 def _humanize_key(key: str) -> str:
     """Convert a CamelCase or snake_case key to a human-readable label.
@@ -81,9 +157,47 @@ def _humanize_key(key: str) -> str:
     return ' '.join(w if w.isupper() else w.capitalize() for w in s.split())
 
 
+@dataclass(slots=True)
+class _DataSchema:
+    """Column layout of a chart payload, derived once from its first row."""
+    keys: Tuple[str, ...]
+    is_numeric: Tuple[bool, ...]
+    numeric_keys: Tuple[str, ...]
+    non_numeric_keys: Tuple[str, ...]
+    n: int
+    first_row: Dict[str, Any]
+    # Sum of numeric_keys[0] over all rows, when the proportion check got
+    # through the whole column without exiting early
+    primary_total: Optional[float] = None
+
+
+def _schema(data: List[Dict], numeric_keys: Optional[Tuple[str, ...]] = None) -> _DataSchema:
+    """Build the _DataSchema shared by the analyzers for one chart.
+
+    numeric_keys, when the caller already scanned the first row for them,
+    replaces the isinstance() pass over its values.
+    """
+    first = data[0] if data else {}
+    keys = tuple(first)
+    if numeric_keys is None:
+        is_numeric = tuple(isinstance(first[k], (int, float)) for k in keys)
+    else:
+        numeric = frozenset(numeric_keys)
+        is_numeric = tuple(k in numeric for k in keys)
+    return _DataSchema(
+        keys=keys,
+        is_numeric=is_numeric,
+        numeric_keys=tuple(k for k, numeric in zip(keys, is_numeric) if numeric),
+        non_numeric_keys=tuple(k for k, numeric in zip(keys, is_numeric) if not numeric),
+        n=len(data),
+        first_row=first,
+    )
+
+
 def analyze_data_for_chart_type(
     data: List[Dict],
-    purpose: Optional[str] = None
+    purpose: Optional[str] = None,
+    schema: Optional[_DataSchema] = None,
 ) -> str:
     """
     Intelligently determine the best chart type based on data characteristics.
@@ -95,65 +209,91 @@ def analyze_data_for_chart_type(
     - Whether values represent parts of a whole
     - Number of numeric series
 
+    Only the proportion check reads rows beyond the first; the rest of the
+    decision depends on the first row's schema and is memoized.
+
     Args:
         data: List of data dictionaries to visualize
         purpose: Optional hint - "comparison", "trend", "composition", "distribution"
+        schema: Optional prebuilt _schema(data), shared with the other analyzers
 
     Returns:
         str: Recommended chart type (bar, line, pie, gauge, area)
     """
     if not data:
-        return ChartType.BAR.value
+        return _BAR
+
+    if schema is None:
+        schema = _schema(data)
+    keys = schema.keys
+    is_numeric = schema.is_numeric
+
+    # Check for percentage/proportion data (should sum to ~100). Every
+    # value is summed: a later negative one can bring a total back into range
+    is_proportion = False
+    if schema.numeric_keys:
+        first_numeric_key = schema.numeric_keys[0]
+        total = sum(d.get(first_numeric_key, 0) for d in data)
+        is_proportion = 95 <= total <= 105  # Roughly adds to 100
+        schema.primary_total = total
+
+    # The decision only distinguishes 1, 2-5 and >5 rows, so cap the count
+    # to let same-schema payloads of any length share a cache entry
+    return _select_chart_type(keys, is_numeric, min(schema.n, 6), is_proportion, purpose)
 
-    num_categories = len(data)
-    keys = list(data[0].keys()) if data else []
-    numeric_keys = [k for k in keys if isinstance(data[0].get(k), (int, float))]
+
+@lru_cache(maxsize=512)
+def _select_chart_type(
+    keys: Tuple[str, ...],
+    is_numeric: Tuple[bool, ...],
+    num_categories: int,
+    is_proportion: bool,
+    purpose: Optional[str],
+) -> str:
+    """Decision tree behind analyze_data_for_chart_type, memoized on the schema."""
+    numeric_keys = [k for k, numeric in zip(keys, is_numeric) if numeric]
 
     # Check for time-based data (indicates trend)
-    time_indicators = ['date', 'month', 'year', 'week', 'day', 'time', 'period', 'quarter']
     has_time_axis = any(
-        any(t in k.lower() for t in time_indicators)
-        for k in keys
-        if not isinstance(data[0].get(k), (int, float))
+        _TIME_RE.search(k.lower())
+        for k, numeric in zip(keys, is_numeric)
+        if not numeric
     )
 
-    # Check for percentage/proportion data (should sum to ~100)
-    if numeric_keys:
-        total = sum(d.get(numeric_keys[0], 0) for d in data)
-        is_proportion = 95 <= total <= 105  # Roughly adds to 100
-    else:
-        is_proportion = False
-
     # Decision tree for chart type selection
 
     # 1. Explicit purpose takes priority
     if purpose == "trend" or has_time_axis:
         if len(numeric_keys) > 1:
-            return ChartType.LINE.value  # Multi-line for multiple metrics
-        return ChartType.LINE.value
+            return _LINE  # Multi-line for multiple metrics
+        return _LINE
 
     if purpose == "composition" or is_proportion:
         if num_categories <= 5:
-            return ChartType.PIE.value
-        return ChartType.BAR.value  # Too many slices for pie
+            return _PIE
+        return _BAR  # Too many slices for pie
 
     # 2. Single value = Gauge
     if num_categories == 1 and len(numeric_keys) == 1:
-        return ChartType.GAUGE.value
+        return _GAUGE
 
     # 3. Small number of categories = Part-to-whole check
     if num_categories <= 5:
         # Check if it looks like a status breakdown
-        status_keywords = ['status', 'type', 'category', 'state']
         non_numeric_key = next((k for k in keys if k not in numeric_keys), None)
-        if non_numeric_key and any(kw in non_numeric_key.lower() for kw in status_keywords):
-            return ChartType.PIE.value
+        if non_numeric_key and _STATUS_RE.search(non_numeric_key.lower()):
+            return _PIE
 
     # 4. Default to bar for categorical comparisons
-    return ChartType.BAR.value
+    return _BAR
 
 
-def generate_insights(data: List[Dict], y_keys: List[str], chart_type: str) -> List[str]:
+def generate_insights(
+    data: List[Dict],
+    y_keys: List[str],
+    chart_type: str,
+    schema: Optional[_DataSchema] = None,
+) -> List[str]:
     """
     Generate automatic insights from the data.
 
@@ -164,6 +304,7 @@ def generate_insights(data: List[Dict], y_keys: List[str], chart_type: str) -> L
         data: The chart data
         y_keys: Keys representing the y-axis values
         chart_type: The type of chart being generated
+        schema: Optional prebuilt _schema(data), shared with the other analyzers
 
     Returns:
         List of insight strings
@@ -174,71 +315,107 @@ def generate_insights(data: List[Dict], y_keys: List[str], chart_type: str) -> L
         return insights
 
     primary_key = y_keys[0]
-    values = [d.get(primary_key, 0) for d in data if d.get(primary_key) is not None]
 
-    if not values:
-        return insights
-
-    max_val = max(values)
-    min_val = min(values)
-    avg_val = sum(values) / len(values)
-    total = sum(values)
-
-    max_idx = values.index(max_val)
-    min_idx = values.index(min_val)
+    # Max/min (first occurrence, as a row index into data), sum and counts,
+    # skipping missing values; first_values feeds the binary split insight
+    if len(data) >= _VECTORIZE_MIN_POINTS:
+        # Long series: reduce one float column in C. The float64 cast maps
+        # None to NaN; rows lacking the key (rare) take the .get() path
+        try:
+            column = np.array(list(map(itemgetter(primary_key), data)), dtype=np.float64)
+        except KeyError:
+            column = np.array([d.get(primary_key) for d in data], dtype=np.float64)
+        present = ~np.isnan(column)
+        num_values = int(np.count_nonzero(present))
+        if not num_values:
+            return insights
+        max_idx = int(np.nanargmax(column))
+        min_idx = int(np.nanargmin(column))
+        max_val = float(column[max_idx])
+        min_val = float(column[min_idx])
+        if (schema is not None and schema.primary_total is not None
+                and schema.numeric_keys[0] == primary_key):
+            total = schema.primary_total  # already summed by the proportion check
+        else:
+            total = float(np.nansum(column))
+        non_zero = int(np.count_nonzero(column > 0))
+        first_values = column[present][:2].tolist()
+    else:
+        # Single pass over the rows
+        max_val, min_val = float("-inf"), float("inf")
+        max_idx = min_idx = 0
+        total = 0
+        num_values = non_zero = 0
+        first_values = []
+        for i, d in enumerate(data):
+            v = d.get(primary_key)
+            if v is None:
+                continue
+            total += v
+            num_values += 1
+            if v > 0:
+                non_zero += 1
+            if v > max_val:
+                max_val, max_idx = v, i
+            if v < min_val:
+                min_val, min_idx = v, i
+            if num_values <= 2:
+                first_values.append(v)
+
+        if not num_values:
+            return insights
+
+    avg_val = total / num_values
 
     # Get category names (x-axis key)
-    x_key = next((k for k in data[0].keys() if k not in y_keys), None)
+    keys = schema.keys if schema is not None else data[0].keys()
+    x_key = next((k for k in keys if k not in y_keys), None)
 
     if x_key:
         max_category = data[max_idx].get(x_key, "Unknown")
         min_category = data[min_idx].get(x_key, "Unknown")
 
         # Format insights based on chart type
-        if chart_type in [ChartType.PIE.value, ChartType.DONUT.value]:
+        if chart_type in [_PIE, _DONUT]:
             # For pie/donut charts, show percentages
             max_pct = (max_val / total * 100) if total > 0 else 0
             insights.append(f"Largest segment: {max_category} ({max_val:,.0f}, {max_pct:.1f}%)")
-            if len(values) > 1 and min_val != max_val:
+            if num_values > 1 and min_val != max_val:
                 min_pct = (min_val / total * 100) if total > 0 else 0
                 insights.append(f"Smallest segment: {min_category} ({min_val:,.0f}, {min_pct:.1f}%)")
             # Add concentration insight
-            if max_pct > 80 and len(values) > 2:
+            if max_pct > 80 and num_values > 2:
                 insights.append(f"{max_category} dominates at {max_pct:.0f}% of total")
             # Add non-zero category count
-            non_zero = sum(1 for v in values if v > 0)
-            if non_zero < len(values):
-                insights.append(f"{non_zero} of {len(values)} categories have activity")
+            if non_zero < num_values:
+                insights.append(f"{non_zero} of {num_values} categories have activity")
         else:
             insights.append(f"Highest: {max_category} ({max_val:,.0f})")
-            if len(values) > 1 and min_val != max_val:
+            if num_values > 1 and min_val != max_val:
                 insights.append(f"Lowest: {min_category} ({min_val:,.0f})")
             # Add range insight for bar/line with 3+ items
-            if len(values) >= 3:
+            if num_values >= 3:
                 spread = max_val - min_val
                 insights.append(f"Range: {spread:,.0f} (from {min_val:,.0f} to {max_val:,.0f})")
 
     # Add summary stats - but only if they make sense
     # Detect binary "X vs Non-X" comparisons where average is meaningless
     is_binary_comparison = False
-    if len(values) == 2 and x_key:
-        categories = [str(d.get(x_key, "")).lower() for d in data]
+    if num_values == 2 and x_key:
         # Check for "non-", "within", "remaining" patterns that indicate binary split
-        binary_indicators = ["non-", "non_", "within", "remaining", "other", "rest"]
         is_binary_comparison = any(
-            any(ind in cat for ind in binary_indicators)
-            for cat in categories
+            _BINARY_RE.search(str(d.get(x_key, "")).lower()) for d in data
         )
 
-    if chart_type in [ChartType.LINE.value, ChartType.BAR.value]:
+    if chart_type in [_LINE, _BAR]:
         if is_binary_comparison and total > 0:
             # For binary comparisons, show ratio instead of average
-            pct1 = (values[0] / total * 100)
-            pct2 = (values[1] / total * 100)
+            pct1 = (first_values[0] / total * 100)
+            pct2 = (first_values[1] / total * 100)
             cat1 = data[0].get(x_key, "First")
             cat2 = data[1].get(x_key, "Second")
             insights.append(f"Split: {pct1:.0f}% / {pct2:.0f}%")
-        elif len(values) >= 2:
+        elif num_values >= 2:
             # For multi-category or same-metric comparisons, average is useful
             insights.append(f"Average: {avg_val:.1f}")
 
@@ -247,7 +424,26 @@ def generate_insights(data: List[Dict], y_keys: List[str], chart_type: str) -> L
     return insights[:5]  # Max 5 insights
 
 
-def generate_description(data: List[Dict], y_keys: List[str], chart_type: str, title: str) -> str:
+def _single_value_insights(row: Dict, y_keys: List[str]) -> List[str]:
+    """generate_insights() for a one-row gauge, without the statistics pass."""
+    if not y_keys:
+        return []
+    value = row.get(y_keys[0])
+    if value is None:
+        return []
+    x_key = next((k for k in row if k not in y_keys), None)
+    insights = [f"Highest: {row.get(x_key, 'Unknown')} ({value:,.0f})"] if x_key else []
+    insights.append(f"Total: {value:,.0f}")
+    return insights
+
+
+def generate_description(
+    data: List[Dict],
+    y_keys: List[str],
+    chart_type: str,
+    title: str,
+    schema: Optional[_DataSchema] = None,
+) -> str:
     """
     Generate a contextual description for the chart.
 
@@ -256,25 +452,14 @@ def generate_description(data: List[Dict], y_keys: List[str], chart_type: str, t
         y_keys: Keys representing the y-axis values
         chart_type: The type of chart
         title: The chart title
+        schema: Optional prebuilt _schema(data), shared with the other analyzers
 
     Returns:
         A descriptive string about the chart
     """
-    num_points = len(data)
-    num_series = len(y_keys)
-
-    type_descriptions = {
-        ChartType.BAR.value: f"Comparison of {num_points} categories",
-        ChartType.LINE.value: f"Trend analysis across {num_points} data points",
-        ChartType.PIE.value: f"Distribution breakdown across {num_points} segments",
-        ChartType.DONUT.value: f"Distribution breakdown across {num_points} segments",
-        ChartType.AREA.value: f"Cumulative trend over {num_points} periods",
-        ChartType.GAUGE.value: "Current value against target",
-        ChartType.STACKED_BAR.value: f"Stacked comparison of {num_points} categories with {num_series} series",
-        ChartType.GROUPED_BAR.value: f"Grouped comparison of {num_points} categories",
-    }
-
-    return type_descriptions.get(chart_type, f"Visualization with {num_points} data points")
+    template = _DESCRIPTION_TEMPLATES.get(chart_type, "Visualization with {n} data points")
+    n = schema.n if schema is not None else len(data)
+    return template.format(n=n, s=len(y_keys))
 
 
 def create_chart(
@@ -337,13 +522,88 @@ def create_chart(
             y_keys=["tickets"]
         )
     """
+    return _create_chart(
+        data, title, x_key, y_keys, chart_type, description, y_labels, colors,
+        figure_number, tool_context,
+    )
+
+
+def _create_chart(
+    data: List[Dict[str, Any]],
+    title: str,
+    x_key: str,
+    y_keys: List[str],
+    chart_type: Optional[str] = None,
+    description: Optional[str] = None,
+    y_labels: Optional[List[str]] = None,
+    colors: Optional[List[str]] = None,
+    figure_number: int = 1,
+    tool_context=None,
+    numeric_keys: Optional[Tuple[str, ...]] = None,
+) -> str:
+    """create_chart() for the helpers below, which may pass the numeric keys
+    they already detected on data[0] (kept off the tool's LLM-facing signature).
+    """
+    figure_number = _claim_figure_number(tool_context, figure_number)
+    chart_json, output = _render_chart(
+        data, title, x_key, y_keys, chart_type, description, y_labels, colors,
+        figure_number, numeric_keys,
+    )
+    _store_chart_output(tool_context, chart_json)
+    return output
+
+
+def _claim_figure_number(tool_context, default: int) -> int:
+    """Take the next figure number from the invocation-scoped chart counter."""
+    if tool_context is None:
+        return default
+    try:
+        # Use temp: prefix for invocation-scoped state (resets each request)
+        figure_number = (tool_context.state.get("temp:chart_count") or 0) + 1
+        tool_context.state["temp:chart_count"] = figure_number
+        return figure_number
+    except Exception:
+        return default
+
+
+def _store_chart_output(tool_context, chart_json: str) -> None:
+    """Keep the rendered chart JSON in session state for follow-up tools."""
+    if tool_context is None:
+        return
+    try:
+        tool_context.state["last_chart_output"] = chart_json
+        # Also accumulate for multi-chart session fallback
+        existing = tool_context.state.get("last_chart_outputs") or []
+        if isinstance(existing, str):
+            existing = [existing]
+        existing.append(chart_json)
+        tool_context.state["last_chart_outputs"] = existing
+    except Exception:
+        pass
+
+
+def _render_chart(
+    data: List[Dict[str, Any]],
+    title: str,
+    x_key: str,
+    y_keys: List[str],
+    chart_type: Optional[str],
+    description: Optional[str],
+    y_labels: Optional[List[str]],
+    colors: Optional[List[str]],
+    figure_number: int,
+    numeric_keys: Optional[Tuple[str, ...]] = None,
+) -> Tuple[str, str]:
+    """Build create_chart()'s config; returns (chart_json, tool output)."""
+    # Derive the column layout once for all the analyzers below
+    schema = _schema(data, numeric_keys)
+
     # Auto-select chart type if not specified
     if chart_type is None:
-        chart_type = analyze_data_for_chart_type(data)
+        chart_type = analyze_data_for_chart_type(data, schema=schema)
 
     # Default colors (professional palette)
-    default_color_list = list(DEFAULT_COLORS.values())
-    colors = colors or default_color_list
+    colors = colors or _DEFAULT_COLOR_TUPLE
 
     # Build series configuration
     series = []
@@ -355,30 +615,38 @@ def create_chart(
             "color": colors[i % len(colors)]
         })
 
-    # Generate insights and description
-    insights = generate_insights(data, y_keys, chart_type)
-    auto_description = description or generate_description(data, y_keys, chart_type, title)
+    # Generate insights and description (single-value gauges, the common
+    # gauge shape, skip the general statistics pass)
+    if chart_type == _GAUGE and len(data) == 1:
+        insights = _single_value_insights(data[0], y_keys)
+        auto_description = description or _DESCRIPTION_TEMPLATES[_GAUGE]
+    else:
+        insights = generate_insights(data, y_keys, chart_type, schema=schema)
+        auto_description = description or generate_description(
+            data, y_keys, chart_type, title, schema=schema
+        )
 
-    # Build the chart configuration (figureLabel set after session state determines number)
+    # Build the chart configuration
+    figure_label = f"Figure {figure_number}: {title}"
     config = {
         "type": chart_type,
         "title": title,
         "description": auto_description,
-        "figureLabel": "",  # set below after accumulator determines figure number
+        "figureLabel": figure_label,
         "data": data,
         "xKey": x_key,
         "series": series,
         "insights": insights,
         "styling": {
             "showGrid": True,
-            "showLegend": len(y_keys) > 1 or chart_type == ChartType.PIE.value,
+            "showLegend": len(y_keys) > 1 or chart_type == _PIE,
             "showTooltip": True,
             "animate": True
         }
     }
 
     # Add chart-specific configurations
-    if chart_type == ChartType.PIE.value:
+    if chart_type == _PIE:
         # True pie chart - solid filled circle with wedge slices (no hole)
         config["type"] = "pie"
         config["innerRadius"] = 0
@@ -390,7 +658,7 @@ def create_chart(
         # Assign distinct colors to each slice
         for i, point in enumerate(config["data"]):
             point["color"] = PIE_COLORS[i % len(PIE_COLORS)]
-    elif chart_type == ChartType.DONUT.value:
+    elif chart_type == _DONUT:
         # Donut chart - ring with hollow center
         config["type"] = "donut"
         config["innerRadius"] = 60
@@ -402,7 +670,7 @@ def create_chart(
         # Assign distinct colors to each slice
         for i, point in enumerate(config["data"]):
             point["color"] = PIE_COLORS[i % len(PIE_COLORS)]
-    elif chart_type == ChartType.GAUGE.value and data:
+    elif chart_type == _GAUGE and data:
         value = data[0].get(y_keys[0], 0) if data else 0
         config["value"] = value
         config["maxValue"] = 100
@@ -413,47 +681,22 @@ def create_chart(
         ]
 
     # Generate the output with chart JSON and text summary
-    chart_json = json.dumps(config, indent=2)
-    print(f"📊 [CHART CONFIG] type={chart_type}, series={[s['key'] for s in series]}, data_points={len(data)}")
-    print(f"📊 [CHART JSON preview] {chart_json[:500]}")
-
-    # Determine figure number from invocation-scoped counter, then store
-    _fig_num = figure_number  # default from parameter
-    if tool_context is not None:
-        try:
-            # Use temp: prefix for invocation-scoped state (resets each request)
-            chart_count = tool_context.state.get("temp:chart_count") or 0
-            _fig_num = chart_count + 1
-            tool_context.state["temp:chart_count"] = _fig_num
-            config["figureLabel"] = f"Figure {_fig_num}: {title}"
-            chart_json = json.dumps(config, indent=2)  # re-serialize with correct label
-            tool_context.state["last_chart_output"] = chart_json
-            # Also accumulate for multi-chart session fallback
-            existing = tool_context.state.get("last_chart_outputs") or []
-            if isinstance(existing, str):
-                existing = [existing]
-            existing.append(chart_json)
-            tool_context.state["last_chart_outputs"] = existing
-        except Exception:
-            pass
-    figure_label = f"Figure {_fig_num}: {title}"
-    if not config.get("figureLabel"):
-        config["figureLabel"] = figure_label
-        chart_json = json.dumps(config, indent=2)
+    chart_json = _dump_config(config)
+    # The series list and the JSON slice are only built when they'd be logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("📊 [CHART CONFIG] type=%s, series=%s, data_points=%s",
+                     chart_type, [s['key'] for s in series], len(data))
+        logger.debug("📊 [CHART JSON preview] %s", chart_json[:500])
 
     # Return chart block + brief context for the LLM to write its own analysis.
     # The chart card already renders figureLabel, description, and insights from JSON.
     # We give the LLM a plain-text context note (not HTML) so it knows what data the
     # chart contains and can write unique analytical commentary.
-    insights_note = "; ".join(insights) if insights else ""
+    insights_note = "; ".join(insights)  # "" when there are no insights
     context_note = f"[Chart rendered: {figure_label}. {auto_description}. {insights_note}]"
 
-    output = f"""<!--CHART_START-->
-{chart_json}
-<!--CHART_END-->
-{context_note}"""
-
-    return output
+    # Joined in one pass; chart_json can be tens of KB for long series
+    return chart_json, "".join(("<!--CHART_START-->\n", chart_json, "\n<!--CHART_END-->\n", context_note))
 
 
 def create_ticket_status_chart(
@@ -471,6 +714,8 @@ def create_ticket_status_chart(
     Specialized helper for visualizing ticket status breakdown.
     Automatically uses pie chart for part-to-whole visualization.
     Uses consistent status colors (blue=open, green=completed, orange=suspended).
+    Rendering is memoized on the counts, so repeat requests for the same
+    breakdown only pay for a cache lookup.
 
     Args:
         open_tickets: Number of tickets in Open status
@@ -491,6 +736,31 @@ def create_ticket_status_chart(
             pending_approval=2
         )
     """
+    counts = (open_tickets, completed_tickets, suspended_tickets, pending_approval)
+    if not any(count > 0 for count in counts):
+        return "<p>No ticket data available to chart.</p>"
+
+    figure_number = _claim_figure_number(tool_context, 1)
+    chart_json, chart_output = _render_ticket_status_chart(*counts, title, figure_number)
+    _store_chart_output(tool_context, chart_json)
+
+    # Add SLA breach warning if applicable
+    if sla_breached > 0:
+        chart_output += f"\n<p><span style='color:#ef4444'>⚠️ {sla_breached} tickets have breached SLA</span></p>"
+
+    return chart_output
+
+
+@lru_cache(maxsize=128, typed=True)  # 80 and 80.0 serialize differently
+def _render_ticket_status_chart(
+    open_tickets: int,
+    completed_tickets: int,
+    suspended_tickets: int,
+    pending_approval: int,
+    title: str,
+    figure_number: int,
+) -> Tuple[str, str]:
+    """Render create_ticket_status_chart(); returns (chart_json, tool output)."""
     data = []
 
     if open_tickets > 0:
@@ -502,28 +772,20 @@ def create_ticket_status_chart(
     if pending_approval > 0:
         data.append({"status": "Pending Approval", "count": pending_approval, "color": STATUS_COLORS["pending"]})
 
-    if not data:
-        return "<p>No ticket data available to chart.</p>"
-
     # Generate the donut chart (default for status distribution)
     # Users can request a true pie chart via create_chart_from_session with chart_type="pie"
-    chart_output = create_chart(
+    return _render_chart(
         data=data,
         title=title,
         x_key="status",
         y_keys=["count"],
         chart_type="donut",
         description="Distribution of tickets by current status",
+        y_labels=None,
         colors=[d["color"] for d in data],
-        tool_context=tool_context,
+        figure_number=figure_number,
     )
 
-    # Add SLA breach warning if applicable
-    if sla_breached > 0:
-        chart_output += f"\n<p><span style='color:#ef4444'>⚠️ {sla_breached} tickets have breached SLA</span></p>"
-
-    return chart_output
-
 
 def create_completion_rate_gauge(
     completion_rate: float,
@@ -548,6 +810,20 @@ def create_completion_rate_gauge(
     Example:
         create_completion_rate_gauge(completion_rate=65.5, target_rate=80.0)
     """
+    figure_number = _claim_figure_number(tool_context, 1)
+    chart_json, output = _render_completion_rate_gauge(completion_rate, target_rate, title, figure_number)
+    _store_chart_output(tool_context, chart_json)
+    return output
+
+
+@lru_cache(maxsize=128, typed=True)  # 80 and 80.0 serialize differently
+def _render_completion_rate_gauge(
+    completion_rate: float,
+    target_rate: float,
+    title: str,
+    figure_number: int,
+) -> Tuple[str, str]:
+    """Render create_completion_rate_gauge(); returns (chart_json, tool output)."""
     # Determine status color and message
     if completion_rate >= 70:
         status_color = "#22c55e"
@@ -559,11 +835,12 @@ def create_completion_rate_gauge(
         status_color = "#ef4444"
         status_msg = "Below target - needs attention"
 
+    figure_label = f"Figure {figure_number}: {title}"
     config = {
         "type": "gauge",
         "title": title,
         "description": f"Current completion rate vs target of {target_rate:.0f}%",
-        "figureLabel": "",  # set below after accumulator determines figure number
+        "figureLabel": figure_label,
         "value": round(completion_rate, 1),
         "maxValue": 100,
         "target": target_rate,
@@ -584,35 +861,12 @@ def create_completion_rate_gauge(
         }
     }
 
-    # Determine figure number from invocation-scoped counter, then store
-    _fig_num = 1
-    if tool_context is not None:
-        try:
-            chart_count = tool_context.state.get("temp:chart_count") or 0
-            _fig_num = chart_count + 1
-            tool_context.state["temp:chart_count"] = _fig_num
-            config["figureLabel"] = f"Figure {_fig_num}: {title}"
-            chart_json = json.dumps(config, indent=2)
-            tool_context.state["last_chart_output"] = chart_json
-            existing = tool_context.state.get("last_chart_outputs") or []
-            if isinstance(existing, str):
-                existing = [existing]
-            existing.append(chart_json)
-            tool_context.state["last_chart_outputs"] = existing
-        except Exception:
-            chart_json = json.dumps(config, indent=2)
-    else:
-        config["figureLabel"] = f"Figure {_fig_num}: {title}"
-        chart_json = json.dumps(config, indent=2)
-    figure_label = f"Figure {_fig_num}: {title}"
+    chart_json = _dump_config(config)
 
     # Return chart block + brief context note for LLM analysis
     context_note = f"[Chart rendered: {figure_label}. Current: {completion_rate:.1f}%, Target: {target_rate:.0f}%. {status_msg}]"
 
-    return f"""<!--CHART_START-->
-{chart_json}
-<!--CHART_END-->
-{context_note}"""
+    return chart_json, "".join(("<!--CHART_START-->\n", chart_json, "\n<!--CHART_END-->\n", context_note))
 
 
 def create_tickets_over_time_chart(
@@ -654,10 +908,9 @@ def create_tickets_over_time_chart(
     # Timeline data uses "Period" as the time key
     time_key = "Period"
 
-    # Auto-detect numeric keys
-    first_item = data[0]
-    value_keys = [k for k, v in first_item.items()
-                  if isinstance(v, (int, float)) and k != time_key]
+    # Auto-detect numeric keys (handed on so create_chart needn't rescan)
+    numeric_keys = tuple(k for k, v in data[0].items() if isinstance(v, (int, float)))
+    value_keys = [k for k in numeric_keys if k != time_key]
 
     if not value_keys:
         return "<p>No numeric data found to visualize.</p>"
@@ -666,9 +919,10 @@ def create_tickets_over_time_chart(
     if chart_type == "auto":
         chart_type = "area" if len(value_keys) == 2 else "line"
 
-    print(f"📊 [TIMELINE CHART] type={chart_type}, keys={value_keys}, points={len(data)}, data[0]={data[0]}")
+    logger.debug("📊 [TIMELINE CHART] type=%s, keys=%s, points=%s, data[0]=%s",
+                 chart_type, value_keys, len(data), data[0])
 
-    return create_chart(
+    return _create_chart(
         data=data,
         title=title,
         x_key=time_key,
@@ -678,6 +932,7 @@ def create_tickets_over_time_chart(
             ", ".join(_humanize_key(k) for k in value_keys)
         ),
         tool_context=tool_context,
+        numeric_keys=numeric_keys,
     )
 
 
@@ -715,11 +970,12 @@ def create_project_comparison_chart(
     if not data:
         return "<p>No project data available to chart.</p>"
 
-    # Auto-detect numeric keys if not provided
+    # Auto-detect numeric keys if not provided (handed on so create_chart
+    # needn't rescan)
+    numeric_keys = None
     if value_keys is None:
-        first_item = data[0]
-        value_keys = [k for k, v in first_item.items()
-                      if isinstance(v, (int, float)) and k != project_key]
+        numeric_keys = tuple(k for k, v in data[0].items() if isinstance(v, (int, float)))
+        value_keys = [k for k in numeric_keys if k != project_key]
 
     if not value_keys:
         return "<p>No numeric data found to visualize.</p>"
@@ -729,20 +985,12 @@ def create_project_comparison_chart(
 
     # Apply status colors if applicable
     colors = []
+    default_color = DEFAULT_COLORS["blue"]
     for key in value_keys:
-        key_lower = key.lower()
-        if "open" in key_lower:
-            colors.append(STATUS_COLORS["open"])
-        elif "complete" in key_lower:
-            colors.append(STATUS_COLORS["completed"])
-        elif "suspend" in key_lower:
-            colors.append(STATUS_COLORS["suspended"])
-        elif "pending" in key_lower:
-            colors.append(STATUS_COLORS["pending"])
-        else:
-            colors.append(DEFAULT_COLORS["blue"])
+        m = _STATUS_COLOR_RE.match(key.lower())
+        colors.append(_STATUS_COLOR_BY_GROUP[m.lastindex] if m else default_color)
 
-    return create_chart(
+    return _create_chart(
         data=data,
         title=title,
         x_key=project_key,
@@ -753,6 +1001,7 @@ def create_project_comparison_chart(
         ),
         colors=colors,
         tool_context=tool_context,
+        numeric_keys=numeric_keys,
     )
 
 
@@ -836,7 +1085,7 @@ def create_breakdown_chart(
         metric_label = metric.replace("Tickets", " Tickets")
         title = f"{metric_label} by {type_label}"
 
-    print(f"📊 [BREAKDOWN CHART] type={key}, metric={metric}, items={len(breakdown_data)}")
+    logger.debug("📊 [BREAKDOWN CHART] type=%s, metric=%s, items=%s", key, metric, len(breakdown_data))
 
     # Transform data for chart
     chart_data = []
@@ -917,7 +1166,7 @@ def create_pm_chart(
     records = last_pm["records"]
     query_mode = last_pm.get("query_mode", "extension")
 
-    print(f"📊 [PM CHART] mode={query_mode}, metric={metric}, type={chart_type}, records={len(records)}")
+    logger.debug("📊 [PM CHART] mode=%s, metric=%s, type=%s, records=%s", query_mode, metric, chart_type, len(records))
 
     chart_data = []
 
@@ -1038,7 +1287,8 @@ def create_engineer_chart(
 
     engineers = last_data["engineers"]
 
-    print(f"📊 [ENGINEER CHART] metric={metric}, group_by={group_by}, type={chart_type}, engineers={len(engineers)}")
+    logger.debug("📊 [ENGINEER CHART] metric=%s, group_by=%s, type=%s, engineers=%s",
+                 metric, group_by, chart_type, len(engineers))
 
     # Metric to column mapping
     metric_map = {
@@ -1110,7 +1360,7 @@ def create_engineer_chart(
         if not title:
             title = f"Daily Activity Log Distribution by {group_by.title()}"
 
-        print(f"📊 [ACTIVITY LOG CHART] {len(chart_data)} engineers, {len(activity_log)} log entries")
+        logger.debug("📊 [ACTIVITY LOG CHART] %s engineers, %s log entries", len(chart_data), len(activity_log))
 
         return create_chart(
             data=chart_data,
@@ -1276,7 +1526,8 @@ def create_inventory_chart(
 
     transactions = last_data["transactions"]
 
-    print(f"📊 [INVENTORY CHART] metric={metric}, group_by={group_by}, type={chart_type}, txns={len(transactions)}")
+    logger.debug("📊 [INVENTORY CHART] metric=%s, group_by=%s, type=%s, txns=%s",
+                 metric, group_by, chart_type, len(transactions))
 
     # Group key mapping
     group_key_map = {
@@ -1322,38 +1573,3 @@ def create_inventory_chart(
         description=f"{title} ({len(chart_data)} items)",
         tool_context=tool_context,
     )
-
-
-# For testing
-if __name__ == "__main__":
-    # Test ticket status chart
-    print("=== Ticket Status Pie Chart ===")
-    result = create_ticket_status_chart(
-        open_tickets=12,
-        completed_tickets=7,
-        suspended_tickets=3,
-        pending_approval=2,
-        sla_breached=5
-    )
-    print(result)
-    print()
-
-    # Test completion rate gauge
-    print("=== Completion Rate Gauge ===")
-    result = create_completion_rate_gauge(65.5, 80.0)
-    print(result)
-    print()
-
-    # Test auto-selection for time series
-    print("=== Auto-Selected Line Chart ===")
-    result = create_chart(
-        data=[
-            {"month": "Jan", "tickets": 15},
-            {"month": "Feb", "tickets": 18},
-            {"month": "Mar", "tickets": 12}
-        ],
-        title="Monthly Ticket Trend",
-        x_key="month",
-        y_keys=["tickets"]
-    )
-    print(result)
@@ -1,59 +1,132 @@
 """
 Chat history persistence for OIP Chatbot.
 Stores chat sessions and messages in SQL Server (ChatbotSessions / ChatbotMessages tables).
+
+Every function is a blocking DB call; the *_async variants at the bottom run
+them on a worker thread for use from FastAPI handlers.
 """
 
+import atexit
 import logging
-from typing import Optional
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import closing
+from functools import lru_cache
+from typing import Iterator, Optional
+
+import pyodbc
 
-from .db_tools import get_db_connection
+from .db_pool import acquire
+from .db_tools import _off_event_loop
 
 logger = logging.getLogger("oip_assistant.chat_history")
 
+# Declared parameter types for cursor.setinputsizes(). pyodbc otherwise
+# binds each str as NVARCHAR(len(value)), so every distinct length is a
+# different parameterized statement to SQL Server and compiles its own plan.
+_INT_PARAM = (pyodbc.SQL_INTEGER, 0, 0)
+_SESSION_ID_PARAM = (pyodbc.SQL_WVARCHAR, 36, 0)     # GUID string
+_ROLE_PARAM = (pyodbc.SQL_WVARCHAR, 20, 0)           # ChatbotMessages.Role
+_TITLE_PARAM = (pyodbc.SQL_WVARCHAR, 200, 0)         # ChatbotSessions.Title
+_USERNAME_PARAM = (pyodbc.SQL_WVARCHAR, 256, 0)
+_NVARCHAR_MAX_PARAM = (pyodbc.SQL_WVARCHAR, 0, 0)    # size 0 = NVARCHAR(MAX)
+_NVARCHAR_4000_PARAM = (pyodbc.SQL_WVARCHAR, 4000, 0)
+
+
+def _content_param(content: Optional[str]) -> tuple:
+    """Bind message text as NVARCHAR(4000) when it fits, else NVARCHAR(MAX).
+
+    MAX parameters are sent as LOB streams; most chat turns are short enough
+    to go in-row. Two fixed sizes still keep each statement to two plans.
+
+    NVARCHAR(4000) counts UTF-16 code units, and characters outside the BMP
+    (emoji) take two, so only text of up to 2000 code points fits for sure;
+    longer text is measured in UTF-16.
+    """
+    if content is None or len(content) <= 2000:
+        return _NVARCHAR_4000_PARAM
+    if len(content) <= 4000 and len(content.encode("utf-16-le")) <= 8000:
+        return _NVARCHAR_4000_PARAM
+    return _NVARCHAR_MAX_PARAM
+
 
 def get_user_id_by_username(username: str) -> Optional[int]:
-    """Look up the Users.Id from a username string."""
+    """Look up the Users.Id from a username string.
+
+    Found IDs are cached per username (a user's Id never changes, and this
+    runs on every chat turn); unknown usernames and DB failures are not, so
+    they are retried next time. Call get_user_id_by_username.cache_clear()
+    after renaming or deleting users.
+    """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT Id FROM dbo.Users WHERE Username = ?", username)
-        row = cursor.fetchone()
-        cursor.close()
-        conn.close()
-        return row[0] if row else None
+        return _lookup_user_id(username)
+    except LookupError:
+        return None
     except Exception as e:
-        logger.error(f"Failed to look up user ID for '{username}': {e}")
+        logger.error("Failed to look up user ID for %r: %s", username, e)
         return None
 
 
+@lru_cache(maxsize=1024)
+def _lookup_user_id(username: str) -> int:
+    """Uncached Users.Id query; raises LookupError (never cached) if absent."""
+    with acquire(autocommit=True) as conn, closing(conn.cursor()) as cursor:
+        cursor.setinputsizes([_USERNAME_PARAM])
+        cursor.execute("SELECT Id FROM dbo.Users WHERE Username = ?", username)
+        row = cursor.fetchone()
+    if not row:
+        raise LookupError(username)
+    return row[0]
+
+
+get_user_id_by_username.cache_clear = _lookup_user_id.cache_clear
+
+
+# Session IDs this process has already created or found in ChatbotSessions;
+# ensure_session() answers for them without a round-trip. Rows are never
+# hard-deleted, so membership can't go stale; the cap just bounds memory
+_known_sessions: set[str] = set()
+_KNOWN_SESSIONS_MAX = 100_000
+
+
 def ensure_session(session_id: str, user_id: int, title: Optional[str] = None) -> bool:
     """
     Create a ChatbotSession row if it doesn't already exist (atomic).
     Returns True if session was created, False if it already existed.
     """
+    if session_id in _known_sessions:
+        return False
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        # Atomic insert — avoids race condition between check and insert
-        cursor.execute(
-            """INSERT INTO dbo.ChatbotSessions (Id, UserId, Title, CreatedAt, UpdatedAt, IsActive, IsDeleted)
-               SELECT ?, ?, ?, SYSDATETIMEOFFSET(), SYSDATETIMEOFFSET(), 1, 0
-               WHERE NOT EXISTS (SELECT 1 FROM dbo.ChatbotSessions WHERE Id = ?)""",
-            session_id,
-            user_id,
-            title,
-            session_id,
-        )
-        created = cursor.rowcount > 0
-        conn.commit()
-        cursor.close()
-        conn.close()
-        if created:
-            logger.info(f"Created session {session_id} for user {user_id}")
-        return created
+        with acquire() as conn, closing(conn.cursor()) as cursor:
+            # Atomic insert — avoids race condition between check and insert.
+            # UPDLOCK/HOLDLOCK keep the key range locked from the check to the
+            # insert, so two concurrent first messages can't both pass the
+            # NOT EXISTS and collide on the primary key
+            cursor.setinputsizes([_SESSION_ID_PARAM, _INT_PARAM, _TITLE_PARAM, _SESSION_ID_PARAM])
+            cursor.execute(
+                """INSERT INTO dbo.ChatbotSessions (Id, UserId, Title, CreatedAt, UpdatedAt, IsActive, IsDeleted)
+                   SELECT ?, ?, ?, SYSDATETIMEOFFSET(), SYSDATETIMEOFFSET(), 1, 0
+                   WHERE NOT EXISTS (
+                       SELECT 1 FROM dbo.ChatbotSessions WITH (UPDLOCK, HOLDLOCK) WHERE Id = ?
+                   )""",
+                session_id,
+                user_id,
+                title,
+                session_id,
+            )
+            created = cursor.rowcount > 0
+            conn.commit()
+            if len(_known_sessions) >= _KNOWN_SESSIONS_MAX:
+                _known_sessions.clear()
+            _known_sessions.add(session_id)
+            if created:
+                logger.info("Created session %s for user %s", session_id, user_id)
+            return created
     except Exception as e:
-        logger.error(f"Failed to ensure session {session_id}: {e}")
+        logger.error("Failed to ensure session %s: %s", session_id, e)
         return False
 
 
@@ -75,148 +148,552 @@ def save_message(
         report_model_json: JSON-serialized report model (stored in ReportModelJson column).
 
     Returns the new message Id, or None on failure.
+
+    The row is written by the background message writer, which coalesces
+    messages saved concurrently into one INSERT; this call blocks until
+    its batch is committed.
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        return _message_writer.submit(
+            (session_id, role, content, report_html, report_model_json)
+        ).result()
+    except Exception as e:
+        logger.error("Failed to save message in session %s: %s", session_id, e)
+        return None
 
-        # Insert message with optional report columns
+
+def record_chat_message(
+    session_id: str,
+    user_id: int,
+    role: str,
+    content: str,
+    title: Optional[str] = None,
+    report_html: Optional[str] = None,
+    report_model_json: Optional[str] = None,
+) -> Optional[int]:
+    """ensure_session() + save_message() in as few round-trips as possible.
+
+    For a session this process hasn't seen yet, one usp_Chatbot_RecordMessage
+    call creates the session row if needed (with title) and inserts the
+    message in a single transaction. Known sessions go straight to the
+    batched save_message().
+
+    If the call fails (e.g. the procedure hasn't been deployed yet, see
+    scripts/sql/usp_Chatbot_RecordMessage.sql), falls back to the two
+    separate calls.
+
+    Returns the new message Id, or None on failure.
+    """
+    if session_id in _known_sessions:
+        return save_message(session_id, role, content, report_html, report_model_json)
+    try:
+        with acquire() as conn, closing(conn.cursor()) as cursor:
+            cursor.setinputsizes([
+                _SESSION_ID_PARAM, _INT_PARAM, _ROLE_PARAM, _content_param(content),
+                _TITLE_PARAM, _NVARCHAR_MAX_PARAM, _NVARCHAR_MAX_PARAM,
+            ])
+            cursor.execute(
+                """EXEC usp_Chatbot_RecordMessage
+                   @SessionId=?, @UserId=?, @Role=?, @Content=?,
+                   @Title=?, @ReportHtml=?, @ReportModelJson=?""",
+                session_id,
+                user_id,
+                role,
+                content,
+                title,
+                report_html,
+                report_model_json,
+            )
+            msg_id, session_created = cursor.fetchone()
+            conn.commit()
+    except Exception as e:
+        logger.warning(
+            "usp_Chatbot_RecordMessage failed for session %s, "
+            "falling back to ensure_session + save_message: %s",
+            session_id, e,
+        )
+        ensure_session(session_id, user_id, title=title)
+        return save_message(session_id, role, content, report_html, report_model_json)
+
+    if len(_known_sessions) >= _KNOWN_SESSIONS_MAX:
+        _known_sessions.clear()
+    _known_sessions.add(session_id)
+    _bump_messages_version(session_id)
+    if session_created:
+        logger.info("Created session %s for user %s", session_id, user_id)
+    return msg_id
+
+
+# One row of the message writer's VALUES list: batch ordinal, SessionId,
+# Role, Content, ReportHtml, ReportModelJson. The casts pin the column types
+# (a NULL parameter would otherwise be typed per row)
+_MESSAGE_VALUES_ROW = "(?, ?, ?, CAST(? AS NVARCHAR(MAX)), CAST(? AS NVARCHAR(MAX)), CAST(? AS NVARCHAR(MAX)))"
+_MESSAGE_ROW_PARAMS = [
+    _INT_PARAM, _SESSION_ID_PARAM, _ROLE_PARAM,
+    _NVARCHAR_MAX_PARAM, _NVARCHAR_MAX_PARAM, _NVARCHAR_MAX_PARAM,
+]
+
+# Most messages drained into one INSERT (6 parameters each, well under
+# SQL Server's 2100-parameter limit)
+_MESSAGE_BATCH_SIZE = 50
+
+
+def _insert_messages(rows: list[tuple]) -> list[int]:
+    """Insert message rows in one batch; returns their Ids in row order.
+
+    MERGE ... ON 1 = 0 inserts every source row and, unlike INSERT, lets
+    OUTPUT return the source ordinal next to each new Id. A lone row (the
+    usual case outside bursts) takes a plain INSERT + SCOPE_IDENTITY()
+    instead. The sessions' UpdatedAt is left to _session_touches, which
+    writes it in the background.
+    """
+    session_ids = list(dict.fromkeys(row[0] for row in rows))
+    if len(rows) == 1:
+        ids = [_insert_message(rows[0])]
+    else:
+        ids = _merge_messages(rows)
+    _session_touches.touch(session_ids)
+    for session_id in session_ids:
+        _bump_messages_version(session_id)
+    return ids
+
+
+def _insert_message(row: tuple) -> int:
+    """Insert one message row; returns its Id."""
+    with acquire() as conn, closing(conn.cursor()) as cursor:
+        cursor.setinputsizes([
+            _SESSION_ID_PARAM, _ROLE_PARAM, _content_param(row[2]),
+            _NVARCHAR_MAX_PARAM, _NVARCHAR_MAX_PARAM,
+        ])
+        # NOCOUNT leaves the SCOPE_IDENTITY() row as the only result set
         cursor.execute(
-            """INSERT INTO dbo.ChatbotMessages
+            """SET NOCOUNT ON;
+               INSERT INTO dbo.ChatbotMessages
                (SessionId, Role, Content, ReportHtml, ReportModelJson, CreatedAt)
-               OUTPUT INSERTED.Id
-               VALUES (?, ?, ?, ?, ?, SYSDATETIMEOFFSET())""",
-            session_id,
-            role,
-            content,
-            report_html,
-            report_model_json,
+               VALUES (?, ?, ?, ?, ?, SYSDATETIMEOFFSET());
+               SELECT CAST(SCOPE_IDENTITY() AS INT);""",
+            row,
         )
-        row = cursor.fetchone()
-        msg_id = row[0] if row else None
+        msg_id = cursor.fetchone()[0]
+        conn.commit()
+    return msg_id
 
-        # Update session timestamp
-        cursor.execute(
-            "UPDATE dbo.ChatbotSessions SET UpdatedAt = SYSDATETIMEOFFSET() WHERE Id = ?",
-            session_id,
-        )
 
+def _merge_messages(rows: list[tuple]) -> list[int]:
+    """Insert several message rows with one MERGE; returns Ids in row order."""
+    params = [value for ordinal, row in enumerate(rows) for value in (ordinal, *row)]
+
+    with acquire() as conn, closing(conn.cursor()) as cursor:
+        cursor.setinputsizes(_MESSAGE_ROW_PARAMS * len(rows))
+        cursor.execute(_merge_messages_sql(len(rows)), params)
+        ids = [None] * len(rows)
+        for ordinal, msg_id in cursor.fetchall():
+            ids[ordinal] = msg_id
         conn.commit()
-        cursor.close()
-        conn.close()
-        return msg_id
-    except Exception as e:
-        logger.error(f"Failed to save message in session {session_id}: {e}")
-        return None
+    return ids
+
+
+@lru_cache(maxsize=_MESSAGE_BATCH_SIZE)
+def _merge_messages_sql(num_rows: int) -> str:
+    """_merge_messages() statement for num_rows rows, built once per size."""
+    return f"""SET NOCOUNT ON;
+        MERGE INTO dbo.ChatbotMessages AS target
+        USING (VALUES {", ".join([_MESSAGE_VALUES_ROW] * num_rows)})
+            AS src (Ordinal, SessionId, Role, Content, ReportHtml, ReportModelJson)
+        ON 1 = 0
+        WHEN NOT MATCHED THEN
+            INSERT (SessionId, Role, Content, ReportHtml, ReportModelJson, CreatedAt)
+            VALUES (src.SessionId, src.Role, src.Content, src.ReportHtml,
+                    src.ReportModelJson, SYSDATETIMEOFFSET())
+        OUTPUT src.Ordinal, INSERTED.Id;"""
+
+
+class _MessageWriter:
+    """Background thread that writes queued messages in batches.
+
+    It blocks for the next message, then drains whatever else is already
+    queued (up to _MESSAGE_BATCH_SIZE) into the same INSERT. A lone message
+    is written immediately; under load, concurrent saves share a round-trip
+    and a commit.
+    """
+
+    def __init__(self):
+        self._queue: "queue.SimpleQueue[tuple[tuple, Future]]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, row: tuple) -> Future:
+        """Queue a message row; the future resolves to its new Id."""
+        future: Future = Future()
+        self._queue.put((row, future))
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="chat-message-writer", daemon=True
+                    )
+                    self._thread.start()
+        return future
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < _MESSAGE_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                ids = _insert_messages([row for row, _ in batch])
+            except Exception as e:
+                if len(batch) == 1:
+                    batch[0][1].set_exception(e)
+                    continue
+                # One bad row (e.g. an unknown session) fails the whole
+                # statement; retry row by row so the others still land
+                for row, future in batch:
+                    try:
+                        future.set_result(_insert_messages([row])[0])
+                    except Exception as row_error:
+                        future.set_exception(row_error)
+            else:
+                for (_, future), msg_id in zip(batch, ids):
+                    future.set_result(msg_id)
+
+
+_message_writer = _MessageWriter()
+
+
+# Seconds a session's UpdatedAt may lag its newest message
+_TOUCH_FLUSH_SECONDS = 5.0
+
+# Sessions per UPDATE (3 parameters each, under the 2100-parameter limit)
+_TOUCH_FLUSH_BATCH = 500
+
+
+class _SessionTouches:
+    """Debounced ChatbotSessions.UpdatedAt writes.
+
+    UpdatedAt only orders the sidebar list, yet touching it per message was
+    the most frequent write in the system. Touches are recorded in memory
+    and written every _TOUCH_FLUSH_SECONDS as one UPDATE ... CASE Id; the
+    timestamp is back-dated on the server by how long each touch waited, so
+    it still reflects when the message was saved. get_sessions() flushes
+    first, and a flush waits for any write already in flight, so this
+    process never lists stale ordering. Touches still pending when the
+    process crashes (atexit doesn't run) are lost; those sessions keep
+    their previous UpdatedAt.
+    """
+
+    def __init__(self):
+        self._pending: dict[str, float] = {}  # session_id -> monotonic touch time
+        self._lock = threading.Lock()
+        # Held for a whole flush, so a flush that finds nothing pending
+        # still returns only after an in-flight write has committed
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def touch(self, session_ids) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for session_id in session_ids:
+                self._pending[session_id] = now
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="chat-session-touch", daemon=True
+                )
+                self._thread.start()
+
+    def flush(self) -> None:
+        """Write all pending touches now."""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            items = list(pending.items())
+            for start in range(0, len(items), _TOUCH_FLUSH_BATCH):
+                self._write(items[start:start + _TOUCH_FLUSH_BATCH])
+
+    def _write(self, items: list[tuple[str, float]]) -> None:
+        now = time.monotonic()
+        params = []
+        for session_id, touched_at in items:
+            params += [session_id, int((now - touched_at) * 1000)]
+        params += [session_id for session_id, _ in items]
+        try:
+            with acquire() as conn, closing(conn.cursor()) as cursor:
+                cursor.setinputsizes(
+                    [_SESSION_ID_PARAM, _INT_PARAM] * len(items)
+                    + [_SESSION_ID_PARAM] * len(items)
+                )
+                cursor.execute(_touch_sessions_sql(len(items)), params)
+                conn.commit()
+        except Exception as e:
+            logger.error("Failed to update UpdatedAt for %d sessions: %s", len(items), e)
+            # Keep them for the next flush, unless touched again meanwhile
+            with self._lock:
+                for session_id, touched_at in items:
+                    self._pending.setdefault(session_id, touched_at)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(_TOUCH_FLUSH_SECONDS)
+            self.flush()
+
+
+@lru_cache(maxsize=64)
+def _touch_sessions_sql(num_sessions: int) -> str:
+    """_SessionTouches UPDATE for num_sessions sessions, built once per size."""
+    return f"""UPDATE dbo.ChatbotSessions
+        SET UpdatedAt = CASE Id
+            {" ".join(["WHEN ? THEN DATEADD(MILLISECOND, -?, SYSDATETIMEOFFSET())"] * num_sessions)}
+            ELSE UpdatedAt END
+        WHERE Id IN ({", ".join(["?"] * num_sessions)})"""
+
+
+_session_touches = _SessionTouches()
+atexit.register(_session_touches.flush)
 
 
 def update_session_title(session_id: str, title: str) -> bool:
-    """Update session title (e.g. auto-generated from first user message)."""
+    """Update session title (e.g. auto-generated from first user message).
+
+    An unchanged title is not rewritten; that still counts as success.
+    """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "UPDATE dbo.ChatbotSessions SET Title = ? WHERE Id = ?",
-            title,
-            session_id,
-        )
-        conn.commit()
-        cursor.close()
-        conn.close()
-        return True
+        with acquire() as conn, closing(conn.cursor()) as cursor:
+            # Binary collation so a case-only rename still counts as a change
+            cursor.setinputsizes([_TITLE_PARAM, _SESSION_ID_PARAM, _TITLE_PARAM])
+            cursor.execute(
+                """UPDATE dbo.ChatbotSessions SET Title = ?
+                   WHERE Id = ? AND (Title IS NULL OR Title <> ? COLLATE Latin1_General_BIN2)""",
+                title,
+                session_id,
+                title,
+            )
+            conn.commit()
+            return True
     except Exception as e:
-        logger.error(f"Failed to update session title: {e}")
+        logger.error("Failed to update session title: %s", e)
         return False
 
 
-def get_sessions(user_id: int, limit: int = 50) -> list[dict]:
+_SQL_SESSIONS = """SELECT TOP (?) CAST(Id AS NVARCHAR(36)) AS Id, Title,
+           CONVERT(VARCHAR(30), CreatedAt, 127) AS CreatedAt,
+           CONVERT(VARCHAR(30), UpdatedAt, 127) AS UpdatedAt
+    FROM dbo.ChatbotSessions
+    WHERE UserId = ? AND IsDeleted = 0{before}
+    ORDER BY UpdatedAt DESC, Id DESC"""
+_SQL_SESSIONS_FIRST_PAGE = _SQL_SESSIONS.format(before="")
+# UpdatedAt isn't unique (one debounced touch flush stamps many sessions
+# alike), so the cursor is (UpdatedAt, Id) and ties continue by Id
+_SQL_SESSIONS_BEFORE = _SQL_SESSIONS.format(before="""
+      AND (UpdatedAt < CAST(? AS DATETIMEOFFSET)
+           OR (UpdatedAt = CAST(? AS DATETIMEOFFSET) AND Id < CAST(? AS UNIQUEIDENTIFIER)))""")
+
+
+def get_sessions(
+    user_id: int,
+    limit: int = 50,
+    before: Optional[str] = None,
+    before_id: Optional[str] = None,
+) -> list[dict]:
     """
     Return the user's chat sessions ordered by most recent first.
     Only returns non-deleted sessions.
+
+    Args:
+        user_id: Users.Id of the session owner.
+        limit: Page size.
+        before: For "load more" — the UpdatedAt string of the last session
+                on the previous page; returns the sessions after it in
+                (UpdatedAt, Id) order.
+        before_id: The Id of that last session; required with before.
+
+    Served by IX_ChatbotSessions_User_Updated (filtered on IsDeleted = 0;
+    see scripts/sql/migrate_add_chat_history_indexes.sql), which is why
+    IsDeleted = 0 stays a literal rather than a parameter. Each page is a
+    keyset seek on that index, however deep the user pages.
     """
+    if (before is None) != (before_id is None):
+        raise ValueError("before and before_id must be given together")
+    # Write debounced UpdatedAt touches first so the ordering is current
+    _session_touches.flush()
+    if before is None:
+        sql, params = _SQL_SESSIONS_FIRST_PAGE, [limit, user_id]
+    else:
+        sql, params = _SQL_SESSIONS_BEFORE, [limit, user_id, before, before, before_id]
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """SELECT TOP (?) CAST(Id AS NVARCHAR(36)) AS Id, Title,
-                      CONVERT(VARCHAR(30), CreatedAt, 127) AS CreatedAt,
-                      CONVERT(VARCHAR(30), UpdatedAt, 127) AS UpdatedAt
-               FROM dbo.ChatbotSessions
-               WHERE UserId = ? AND IsDeleted = 0
-               ORDER BY UpdatedAt DESC""",
-            limit,
-            user_id,
-        )
-        columns = [col[0] for col in cursor.description]
-        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
-        cursor.close()
-        conn.close()
-
-        return rows
+        with acquire(autocommit=True) as conn, closing(conn.cursor()) as cursor:
+            cursor.execute(sql, params)
+            # Columns in SELECT order; dates arrive pre-formatted (CONVERT 127)
+            rows = [
+                {"Id": r[0], "Title": r[1], "CreatedAt": r[2], "UpdatedAt": r[3]}
+                for r in cursor.fetchall()
+            ]
+
+            return rows
     except Exception as e:
-        logger.error(f"Failed to fetch sessions for user {user_id}: {e}")
+        logger.error("Failed to fetch sessions for user %s: %s", user_id, e)
         return []
 
 
-def get_session_messages(session_id: str) -> list[dict]:
-    """Return all messages for a session in chronological order.
+def get_session_messages(
+    session_id: str,
+    after_id: int = 0,
+    limit: Optional[int] = None,
+) -> list[dict]:
+    """Return a session's messages in chronological order.
 
     Each dict includes Id, Role, Content, CreatedAt, and optionally
     ReportHtml / ReportModelJson (NULL when no report is attached).
+
+    Args:
+        session_id: Chat session UUID.
+        after_id: Only return messages with Id greater than this (for paging).
+        limit: Return at most this many messages (default: all).
+
+    Results are cached per session until one of its messages is written,
+    so reloading a conversation doesn't re-query it; callers get fresh
+    dicts they may mutate.
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """SELECT Id, Role, Content, ReportHtml, ReportModelJson,
-                      CONVERT(VARCHAR(30), CreatedAt, 127) AS CreatedAt
-               FROM dbo.ChatbotMessages
-               WHERE SessionId = ?
-               ORDER BY Id ASC""",
-            session_id,
-        )
-        columns = [col[0] for col in cursor.description]
-        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
-        cursor.close()
-        conn.close()
-
-        return rows
+        rows = _fetch_session_messages(session_id, after_id, limit)
+        return [dict(row) for row in rows]
     except Exception as e:
-        logger.error(f"Failed to fetch messages for session {session_id}: {e}")
+        logger.error("Failed to fetch messages for session %s: %s", session_id, e)
         return []
 
 
+# Per-session write counter; part of the _fetch_session_messages cache key,
+# so bumping it after a write makes that session's cached pages unreachable.
+# Bumped from the writer thread and from to_thread workers, hence the lock
+_messages_version: dict[str, int] = {}
+_messages_lock = threading.Lock()
+
+# Cached pages are bounded by count and by total text length, since rows
+# carry whole ReportHtml / ReportModelJson blobs; a page above a quarter of
+# the budget is not cached at all
+_MESSAGES_CACHE_MAX = 256
+_MESSAGES_CACHE_MAX_CHARS = 16_000_000
+
+# (session_id, version, after_id, limit) -> (rows, chars), least recently used first
+_messages_cache: "OrderedDict[tuple, tuple[tuple[dict, ...], int]]" = OrderedDict()
+_messages_cache_chars = 0
+
+
+def _bump_messages_version(session_id: str) -> None:
+    """Invalidate cached get_session_messages() results for a session."""
+    global _messages_cache_chars
+    with _messages_lock:
+        _messages_version[session_id] = _messages_version.get(session_id, 0) + 1
+        for key in [k for k in _messages_cache if k[0] == session_id]:
+            _messages_cache_chars -= _messages_cache.pop(key)[1]
+
+
+def _fetch_session_messages(
+    session_id: str,
+    after_id: int,
+    limit: Optional[int],
+) -> tuple[dict, ...]:
+    """Query one page of a session's messages (cached by get_session_messages)."""
+    global _messages_cache_chars
+    with _messages_lock:
+        key = (session_id, _messages_version.get(session_id, 0), after_id, limit)
+        entry = _messages_cache.get(key)
+        if entry is not None:
+            _messages_cache.move_to_end(key)
+            return entry[0]
+
+    rows = tuple(iter_session_messages(session_id, after_id, limit))
+    chars = sum(len(v) for row in rows for v in row.values() if isinstance(v, str))
+    if chars > _MESSAGES_CACHE_MAX_CHARS // 4:
+        return rows
+
+    with _messages_lock:
+        # A write may have landed while querying; its bump makes this key
+        # unreachable, so the page is simply not cached
+        if key[1] == _messages_version.get(session_id, 0) and key not in _messages_cache:
+            _messages_cache[key] = (rows, chars)
+            _messages_cache_chars += chars
+            while (len(_messages_cache) > _MESSAGES_CACHE_MAX
+                   or _messages_cache_chars > _MESSAGES_CACHE_MAX_CHARS):
+                _messages_cache_chars -= _messages_cache.popitem(last=False)[1][1]
+    return rows
+
+
+_SQL_SESSION_MESSAGES_COLUMNS = """Id, Role, Content, ReportHtml, ReportModelJson,
+           CONVERT(VARCHAR(30), CreatedAt, 127) AS CreatedAt
+    FROM dbo.ChatbotMessages
+    WHERE SessionId = ? AND Id > ?
+    ORDER BY Id ASC"""
+_SQL_SESSION_MESSAGES = "SELECT " + _SQL_SESSION_MESSAGES_COLUMNS
+_SQL_SESSION_MESSAGES_TOP = "SELECT TOP (?) " + _SQL_SESSION_MESSAGES_COLUMNS
+
+
+def iter_session_messages(
+    session_id: str,
+    after_id: int = 0,
+    limit: Optional[int] = None,
+    chunk_size: int = 500,
+) -> Iterator[dict]:
+    """Stream a session's messages in chronological order, uncached.
+
+    Rows are pulled chunk_size at a time with fetchmany(), so a long history
+    is never buffered whole; the pooled connection is held until the
+    generator is exhausted or closed. Yields the same dicts as
+    get_session_messages(); DB errors propagate to the caller.
+    """
+    if limit is None:
+        sql, params = _SQL_SESSION_MESSAGES, [session_id, after_id]
+    else:
+        sql, params = _SQL_SESSION_MESSAGES_TOP, [limit, session_id, after_id]
+    with acquire(autocommit=True) as conn, closing(conn.cursor()) as cursor:
+        cursor.execute(sql, params)
+        while True:
+            chunk = cursor.fetchmany(chunk_size)
+            if not chunk:
+                break
+            # Columns in SELECT order; CreatedAt arrives pre-formatted (CONVERT 127)
+            for r in chunk:
+                yield {
+                    "Id": r[0],
+                    "Role": r[1],
+                    "Content": r[2],
+                    "ReportHtml": r[3],
+                    "ReportModelJson": r[4],
+                    "CreatedAt": r[5],
+                }
+
+
 def delete_messages_from(session_id: str, message_id: int) -> int:
     """Delete a message and all messages after it in a session.
 
     Returns the number of rows deleted, or -1 on failure.
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "DELETE FROM dbo.ChatbotMessages WHERE SessionId = ? AND Id >= ?",
-            session_id,
-            message_id,
-        )
-        deleted = cursor.rowcount
-
-        # Touch session timestamp
-        cursor.execute(
-            "UPDATE dbo.ChatbotSessions SET UpdatedAt = SYSDATETIMEOFFSET() WHERE Id = ?",
-            session_id,
-        )
-
-        conn.commit()
-        cursor.close()
-        conn.close()
-        logger.info(
-            "Deleted %d messages from session %s (from messageId %d)",
-            deleted, session_id, message_id,
-        )
-        return deleted
+        with acquire() as conn, closing(conn.cursor()) as cursor:
+            cursor.execute(
+                "DELETE FROM dbo.ChatbotMessages WHERE SessionId = ? AND Id >= ?",
+                session_id,
+                message_id,
+            )
+            deleted = cursor.rowcount
+
+            # Touch session timestamp
+            cursor.execute(
+                "UPDATE dbo.ChatbotSessions SET UpdatedAt = SYSDATETIMEOFFSET() WHERE Id = ?",
+                session_id,
+            )
+
+            conn.commit()
+            _bump_messages_version(session_id)
+            logger.info(
+                "Deleted %d messages from session %s (from messageId %d)",
+                deleted, session_id, message_id,
+            )
+            return deleted
     except Exception as e:
-        logger.error(f"Failed to delete messages from session {session_id}: {e}")
+        logger.error("Failed to delete messages from session %s: %s", session_id, e)
         return -1
 
 
@@ -227,28 +704,25 @@ def get_report_model_from_db(session_id: str) -> tuple:
     Used as fallback when in-memory ADK session has been lost (server restart).
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """SELECT TOP 1 ReportHtml, ReportModelJson
-               FROM dbo.ChatbotMessages
-               WHERE SessionId = ? AND ReportModelJson IS NOT NULL
-               ORDER BY Id DESC""",
-            session_id,
-        )
-        row = cursor.fetchone()
-        cursor.close()
-        conn.close()
-
-        if row and row[1]:
-            import json
-            model = json.loads(row[1])
-            html = row[0] or ""
-            logger.info(f"Restored report_model from DB for session {session_id}")
-            return model, html
-        return None, None
+        with acquire(autocommit=True) as conn, closing(conn.cursor()) as cursor:
+            cursor.execute(
+                """SELECT TOP 1 ReportHtml, ReportModelJson
+                   FROM dbo.ChatbotMessages
+                   WHERE SessionId = ? AND ReportModelJson IS NOT NULL
+                   ORDER BY Id DESC""",
+                session_id,
+            )
+            row = cursor.fetchone()
+
+            if row and row[1]:
+                import json
+                model = json.loads(row[1])
+                html = row[0] or ""
+                logger.info("Restored report_model from DB for session %s", session_id)
+                return model, html
+            return None, None
     except Exception as e:
-        logger.error(f"Failed to load report_model from DB for session {session_id}: {e}")
+        logger.error("Failed to load report_model from DB for session %s: %s", session_id, e)
         return None, None
 
 
@@ -259,45 +733,62 @@ def update_report_in_message(session_id: str, report_html: str, report_model_jso
     existing report message instead of creating a new chat message.
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """UPDATE dbo.ChatbotMessages
-               SET ReportHtml = ?, ReportModelJson = ?
-               WHERE Id = (
-                   SELECT MAX(Id) FROM dbo.ChatbotMessages
-                   WHERE SessionId = ? AND ReportHtml IS NOT NULL
-               )""",
-            report_html,
-            report_model_json,
-            session_id,
-        )
-        affected = cursor.rowcount
-        conn.commit()
-        cursor.close()
-        conn.close()
-        if affected > 0:
-            logger.info(f"Updated report in session {session_id} (HTML={len(report_html)} chars)")
-        return affected > 0
+        with acquire() as conn, closing(conn.cursor()) as cursor:
+            cursor.setinputsizes([_NVARCHAR_MAX_PARAM, _NVARCHAR_MAX_PARAM, _SESSION_ID_PARAM])
+            cursor.execute(
+                """UPDATE dbo.ChatbotMessages
+                   SET ReportHtml = ?, ReportModelJson = ?
+                   WHERE Id = (
+                       SELECT MAX(Id) FROM dbo.ChatbotMessages
+                       WHERE SessionId = ? AND ReportHtml IS NOT NULL
+                   )""",
+                report_html,
+                report_model_json,
+                session_id,
+            )
+            affected = cursor.rowcount
+            conn.commit()
+            _bump_messages_version(session_id)
+            if affected > 0:
+                logger.info("Updated report in session %s (HTML=%d chars)", session_id, len(report_html))
+            return affected > 0
     except Exception as e:
-        logger.error(f"Failed to update report in session {session_id}: {e}")
+        logger.error("Failed to update report in session %s: %s", session_id, e)
         return False
 
 
 def delete_session(session_id: str) -> bool:
-    """Soft-delete a session (set IsDeleted=1)."""
+    """Soft-delete a session (set IsDeleted=1).
+
+    Returns False if the session doesn't exist or is already deleted.
+    """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "UPDATE dbo.ChatbotSessions SET IsDeleted = 1 WHERE Id = ?",
-            session_id,
-        )
-        affected = cursor.rowcount
-        conn.commit()
-        cursor.close()
-        conn.close()
-        return affected > 0
+        with acquire() as conn, closing(conn.cursor()) as cursor:
+            cursor.execute(
+                "UPDATE dbo.ChatbotSessions SET IsDeleted = 1 WHERE Id = ? AND IsDeleted = 0",
+                session_id,
+            )
+            affected = cursor.rowcount
+            conn.commit()
+            _known_sessions.discard(session_id)
+            return affected > 0
     except Exception as e:
-        logger.error(f"Failed to delete session {session_id}: {e}")
+        logger.error("Failed to delete session %s: %s", session_id, e)
         return False
+
+
+# =============================================================================
+# ASYNC VARIANTS — same calls on a worker thread, so awaiting them from an
+# async handler doesn't stall the event loop for the DB round-trip
+# =============================================================================
+get_user_id_by_username_async = _off_event_loop(get_user_id_by_username)
+ensure_session_async = _off_event_loop(ensure_session)
+save_message_async = _off_event_loop(save_message)
+record_chat_message_async = _off_event_loop(record_chat_message)
+update_session_title_async = _off_event_loop(update_session_title)
+get_sessions_async = _off_event_loop(get_sessions)
+get_session_messages_async = _off_event_loop(get_session_messages)
+delete_messages_from_async = _off_event_loop(delete_messages_from)
+get_report_model_from_db_async = _off_event_loop(get_report_model_from_db)
+update_report_in_message_async = _off_event_loop(update_report_in_message)
+delete_session_async = _off_event_loop(delete_session)
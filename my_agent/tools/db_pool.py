@@ -0,0 +1,117 @@
+"""
+Bounded pool of SQL Server connections for OIP Chatbot.
+
+Chat history and the db_tools queries run on every chat turn; opening a
+fresh pyodbc connection for each one re-authenticates against SQL Server
+every time. acquire() hands out an idle pooled connection (opening one only
+when none is free) and takes it back afterwards.
+
+Usage:
+    with acquire() as conn:
+        cursor = conn.cursor()
+        ...
+        conn.commit()
+"""
+
+import logging
+import os
+import queue
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import pyodbc
+
+# Module import: db_tools imports this module too, and borrows from acquire()
+from . import db_tools
+
+logger = logging.getLogger("oip_assistant.tools.db_pool")
+
+# Idle connections kept open; callers beyond this still get a connection,
+# it just isn't kept once released
+POOL_SIZE = int(os.getenv("SQL_POOL_SIZE", "8"))
+
+# Connections idle for longer than this are probed with SELECT 1 on checkout
+# (the server or a firewall may have dropped them); fresher ones skip the
+# extra round-trip
+VALIDATE_AFTER_SECONDS = float(os.getenv("SQL_POOL_VALIDATE_AFTER", "30"))
+
+# (connection, released_at) pairs; LIFO so the warmest connection is reused
+_idle: "queue.LifoQueue[tuple[pyodbc.Connection, float]]" = queue.LifoQueue(maxsize=POOL_SIZE)
+
+
+def _open() -> pyodbc.Connection:
+    """Open a new connection (get_db_connection retries transient failures)."""
+    conn = db_tools.get_db_connection()
+    if isinstance(conn, dict):
+        # retry_on_db_error returns an error dict once retries are exhausted
+        raise ConnectionError(conn.get("error_detail") or conn.get("Message"))
+    return conn
+
+
+def _is_alive(conn: pyodbc.Connection) -> bool:
+    """Cheap liveness probe for a connection that sat idle in the pool."""
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+        cursor.close()
+        if not conn.autocommit:
+            # Don't leave the probe's implicit transaction open on the connection
+            conn.rollback()
+        return True
+    except pyodbc.Error:
+        return False
+
+
+def _discard(conn: pyodbc.Connection) -> None:
+    try:
+        conn.close()
+    except pyodbc.Error:
+        pass
+
+
+def _checkout() -> pyodbc.Connection:
+    while True:
+        try:
+            conn, released_at = _idle.get_nowait()
+        except queue.Empty:
+            return _open()
+        if time.monotonic() - released_at < VALIDATE_AFTER_SECONDS or _is_alive(conn):
+            return conn
+        logger.info("Discarding stale pooled DB connection")
+        _discard(conn)
+
+
+def _release(conn: pyodbc.Connection) -> None:
+    try:
+        _idle.put_nowait((conn, time.monotonic()))
+    except queue.Full:
+        _discard(conn)
+
+
+@contextmanager
+def acquire(autocommit: bool = False) -> Iterator[pyodbc.Connection]:
+    """Borrow a pooled connection for the duration of a with-block.
+
+    Uncommitted work is rolled back if the block raises; a connection that
+    fails the rollback is closed instead of being returned to the pool.
+
+    Read-only callers pass autocommit=True so their queries don't open an
+    implicit transaction that stays open on the pooled connection until the
+    next commit or rollback.
+    """
+    conn = _checkout()
+    if conn.autocommit != autocommit:
+        conn.autocommit = autocommit
+    try:
+        yield conn
+    except BaseException:
+        try:
+            conn.rollback()
+        except pyodbc.Error:
+            _discard(conn)
+            raise
+        _release(conn)
+        raise
+    _release(conn)
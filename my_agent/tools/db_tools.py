@@ -8,14 +8,27 @@ Integrates with Google ADK ToolContext for session state access.
 Supports multiple project/team selections via comma-separated values.
 """
 
+import asyncio
+import copy
 import os
 import logging
+import re
 import struct
+import threading
 import time
+import traceback
 import functools
+from collections import OrderedDict
 import pyodbc
+from contextlib import closing
 from typing import Optional, List, Union
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+# Module import (not `from .db_pool import acquire`): db_pool opens its
+# connections through get_db_connection below
+from . import db_pool
+from .chart_tools import create_chart, create_completion_rate_gauge
 
 # Configure logger for this module
 logger = logging.getLogger("oip_assistant.tools.db")
@@ -44,11 +57,9 @@ def retry_on_db_error(max_retries: int = 2, backoff_seconds: float = 1.0):
                         wait = backoff_seconds * (2 ** attempt)
                         logger.warning(f"🔄 DB retry {attempt + 1}/{max_retries} for {func.__name__}: "
                                        f"{type(e).__name__}: {e} — waiting {wait}s")
-                        print(f"🔄 [RETRY] {func.__name__} attempt {attempt + 2}/{max_retries + 1} in {wait}s")
                         time.sleep(wait)
                     else:
                         logger.error(f"❌ DB failed after {max_retries + 1} attempts for {func.__name__}: {e}")
-                        print(f"❌ [DB FAIL] {func.__name__} failed after {max_retries + 1} attempts: {e}")
             # All retries exhausted
             return {
                 "status": "error",
@@ -65,16 +76,12 @@ except ImportError:
     ToolContext = None
 
 
-@retry_on_db_error(max_retries=2, backoff_seconds=1.0)
-def get_db_connection():
-    """
-    Create SQL Server connection using environment variables or defaults.
-
-    Returns:
-        pyodbc.Connection: Active database connection
+@functools.cache
+def _connection_string() -> str:
+    """Build the SQL Server connection string from env vars (read once, on first use).
 
-    Raises:
-        pyodbc.Error: If connection fails
+    The pool opens connections repeatedly; call _connection_string.cache_clear()
+    if the SQL_SERVER_* variables are changed at runtime.
     """
     # Build connection string from env vars or use defaults
     server = os.getenv("SQL_SERVER_HOST", "LAPTOP-3BGTAL2E\\SQLEXPRESS")
@@ -95,19 +102,55 @@ def get_db_connection():
         user = os.getenv("SQL_SERVER_USER", "")
         password = os.getenv("SQL_SERVER_PASSWORD", "")
         connection_string += f"UID={user};PWD={password};"
+    return connection_string
 
-    conn = pyodbc.connect(connection_string)
+
+def _handle_datetimeoffset(dto_value):
+    """Output converter for SQL Server's datetimeoffset type (ODBC type -155)."""
+    tup = struct.unpack("<6hI2h", dto_value)
+    return datetime(tup[0], tup[1], tup[2], tup[3], tup[4], tup[5], tup[6] // 1000)
+
+
+@retry_on_db_error(max_retries=2, backoff_seconds=1.0)
+def get_db_connection():
+    """
+    Create SQL Server connection using environment variables or defaults.
+
+    Returns:
+        pyodbc.Connection: Active database connection
+
+    Raises:
+        pyodbc.Error: If connection fails
+    """
+    conn = pyodbc.connect(_connection_string())
 
     # Register converter for SQL Server's datetimeoffset type (ODBC type -155)
     # which pyodbc doesn't support natively. Converts to Python datetime.
-    def _handle_datetimeoffset(dto_value):
-        tup = struct.unpack("<6hI2h", dto_value)
-        return datetime(tup[0], tup[1], tup[2], tup[3], tup[4], tup[5], tup[6] // 1000)
-
     conn.add_output_converter(-155, _handle_datetimeoffset)
     return conn
 
 
+# Rows per fetchmany() call when streaming a result set
+_FETCH_BATCH = 500
+
+
+def _iter_rows(cursor):
+    """Yield the current result set's rows, fetched _FETCH_BATCH at a time.
+
+    Unlike fetchall(), the whole rowset is never held as a list alongside
+    the dicts built from it.
+    """
+    while True:
+        batch = cursor.fetchmany(_FETCH_BATCH)
+        if not batch:
+            return
+        yield from batch
+
+
+# (day, get_current_date() result) — the answer only changes at midnight
+_current_date_info: tuple[Optional[date], dict] = (None, {})
+
+
 def get_current_date() -> dict:
     """
     Get current date information for context.
@@ -125,73 +168,158 @@ def get_current_date() -> dict:
             - last_month_name: Previous month name
             - last_month_year: Year of the previous month
     """
-    now = datetime.now()
-    last_month = now.month - 1 if now.month > 1 else 12
-    last_month_year = now.year if now.month > 1 else now.year - 1
+    global _current_date_info
+    today = date.today()
+    cached_day, info = _current_date_info
+    if cached_day != today:
+        info = _date_info(today)
+        _current_date_info = (today, info)
+    return dict(info)
+
+
+# English month names, independent of the process locale (strftime("%B") isn't)
+_MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+
+def _date_info(today: date) -> dict:
+    """Build get_current_date()'s dict for the given day."""
+    last_month = today.month - 1 if today.month > 1 else 12
+    last_month_year = today.year if today.month > 1 else today.year - 1
 
     return {
-        "today": now.strftime("%Y-%m-%d"),
-        "current_month": now.month,
-        "current_month_name": now.strftime("%B"),
-        "current_year": now.year,
+        "today": today.strftime("%Y-%m-%d"),
+        "current_month": today.month,
+        "current_month_name": _MONTH_NAMES[today.month - 1],
+        "current_year": today.year,
         "last_month": last_month,
-        "last_month_name": datetime(last_month_year, last_month, 1).strftime("%B"),
+        "last_month_name": _MONTH_NAMES[last_month - 1],
         "last_month_year": last_month_year,
     }
 
 
-def get_lookups(
-    lookup_type: Optional[str] = None,
-    tool_context: "ToolContext" = None,
-) -> dict:
+# =============================================================================
+# LOOKUP CACHE
+# =============================================================================
+# Regions/projects/teams/statuses change rarely but get_lookups runs on most
+# questions; results are kept per (lookup_type, username) for this long
+LOOKUP_TTL_SECONDS = float(os.getenv("LOOKUP_TTL_SECONDS", "300"))
+_LOOKUP_CACHE_MAX = 256
+
+# (lookup_type or "All", username) -> (stored_at, result)
+_lookup_cache: dict[tuple, tuple[float, dict]] = {}
+_lookup_cache_lock = threading.Lock()
+
+
+def _cached_lookups(key: tuple) -> Optional[dict]:
+    """Return a copy of a cached lookup result, or None if absent/expired."""
+    with _lookup_cache_lock:
+        entry = _lookup_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at >= LOOKUP_TTL_SECONDS:
+            del _lookup_cache[key]
+            return None
+    # Copy so a caller (or session state) mutating it can't change the cache
+    return copy.deepcopy(result)
+
+
+def _store_lookups(key: tuple, result: dict) -> None:
+    with _lookup_cache_lock:
+        if len(_lookup_cache) >= _LOOKUP_CACHE_MAX:
+            # Drop the oldest entry (dicts keep insertion order)
+            _lookup_cache.pop(next(iter(_lookup_cache)))
+        _lookup_cache[key] = (time.monotonic(), copy.deepcopy(result))
+
+
+def invalidate_lookups(username: Optional[str] = None) -> None:
+    """Drop cached lookups for one user, or for everyone when username is None.
+
+    Call after changing regions/projects/teams/statuses or a user's access.
     """
-    Get lookup data from the database (regions, projects, teams, statuses, task types).
-
-    This tool retrieves reference data for dropdowns, validation, and queries.
-    Use this when users ask "what regions are there?" or "list all teams" or "what task types exist?".
-
-    IMPORTANT: lookup_type values are CASE-SENSITIVE and must be EXACTLY one of:
-    - "Regions" (capital R, plural) - Get all regions/provinces
-    - "Projects" (capital P, plural) - Get all projects
-    - "Teams" (capital T, plural) - Get all teams with their project and region
-    - "Statuses" (capital S, plural) - Get ticket statuses
-    - "TaskTypes" (capital T, capital T) - Get ticket task types (PM, TR, Other)
-    - "All" (capital A) - Get all lookup types
-    - None - Same as "All", gets everything
-
-    Args:
-        lookup_type: MUST be exactly one of: "Regions", "Projects", "Teams", "Statuses", "TaskTypes", "All"
-                     DO NOT use lowercase like "region" or "teams" - it will return empty!
+    with _lookup_cache_lock:
+        if username is None:
+            _lookup_cache.clear()
+            return
+        for key in [k for k in _lookup_cache if k[1] == username]:
+            del _lookup_cache[key]
 
-    Returns:
-        dict: Lookup data containing requested types:
-            - regions: List of {RegionId, RegionName, RegionCode}
-            - projects: List of {ProjectId, ProjectName}
-            - teams: List of {TeamId, TeamName, ProjectName, RegionName}
-            - statuses: List of {StatusId, StatusCode, StatusName, StatusColor}
-            - task_types: List of {TaskTypeId, TaskTypeName}
-            - Message: "Success" or error description
 
-    Example tool calls:
-        - "What regions are available?" -> get_lookups(lookup_type="Regions")
-        - "List all teams" -> get_lookups(lookup_type="Teams")
-        - "What projects can I filter by?" -> get_lookups(lookup_type="Projects")
-        - "Show me ticket statuses" -> get_lookups(lookup_type="Statuses")
-        - "What task types are there?" -> get_lookups(lookup_type="TaskTypes")
-        - "Show all lookup data" -> get_lookups(lookup_type="All")
+# =============================================================================
+# TICKET SUMMARY CACHE
+# =============================================================================
+# The agent often re-issues an identical summary call within seconds (retries,
+# or a follow-up like "chart the above" that asks the same question again);
+# such a repeat within this window reuses the previous result instead of
+# another SP round-trip
+SUMMARY_TTL_SECONDS = float(os.getenv("SUMMARY_TTL_SECONDS", "30"))
+_SUMMARY_CACHE_MAX = 256
+
+# (sql, params) -> (stored_at, result), oldest first; params[0] is the username
+_summary_cache: "OrderedDict[tuple, tuple[float, dict]]" = OrderedDict()
+_summary_cache_lock = threading.Lock()
+
+
+def _cached_summary(key: tuple) -> Optional[dict]:
+    """Return a copy of a result cached within SUMMARY_TTL_SECONDS, or None."""
+    with _summary_cache_lock:
+        entry = _summary_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at >= SUMMARY_TTL_SECONDS:
+            del _summary_cache[key]
+            return None
+    logger.debug("🔍 [SUMMARY CACHE] reusing result of an identical call")
+    return copy.deepcopy(result)
+
+
+def _store_summary(key: tuple, result: dict) -> None:
+    with _summary_cache_lock:
+        _summary_cache[key] = (time.monotonic(), copy.deepcopy(result))
+        _summary_cache.move_to_end(key)
+        while len(_summary_cache) > _SUMMARY_CACHE_MAX:
+            _summary_cache.popitem(last=False)
+
+
+def invalidate_ticket_summaries(username: Optional[str] = None) -> None:
+    """Drop cached ticket summaries for one user, or for everyone when username is None.
+
+    Call after changing ticket data outside the usual sync, or a user's access.
     """
-    try:
-        logger.info(f"📋 Fetching lookups: {lookup_type or 'All'}")
-        print(f"🔍 [LOOKUPS] lookup_type={lookup_type}")
-
-        # Get username from session state for permission filtering
-        username = None
-        if tool_context is not None:
-            username = tool_context.state.get("username")
+    with _summary_cache_lock:
+        if username is None:
+            _summary_cache.clear()
+            return
+        for key in [k for k in _summary_cache if k[1][0] == username]:
+            del _summary_cache[key]
+
+
+# usp_Chatbot_GetLookups result sets, recognised by their Id column. Teams
+# also carry ProjectName/RegionName, so only the Id columns are unambiguous
+_LOOKUP_SET_KEYS = (
+    ("RegionId", "regions"),
+    ("ProjectId", "projects"),
+    ("TeamId", "teams"),
+    ("StatusId", "statuses"),
+    ("TaskTypeId", "task_types"),
+)
+
+
+def _classify_lookup_set(colset: frozenset) -> Optional[str]:
+    """Return the lookup key for a result set's columns, or None if unknown."""
+    for id_column, key in _LOOKUP_SET_KEYS:
+        if id_column in colset:
+            return key
+    return None
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
 
+def _fetch_lookups(lookup_type: Optional[str], username: Optional[str]) -> dict:
+    """Run usp_Chatbot_GetLookups and sort its result sets into a lookup dict."""
+    with db_pool.acquire(autocommit=True) as conn, closing(conn.cursor()) as cursor:
         # Build parameter list
         params = []
         param_markers = []
@@ -226,34 +354,80 @@ def get_lookups(
                 data = [dict(zip(columns, row)) for row in rows]
 
                 # Determine which result set this is based on columns
-                if "RegionId" in columns or "RegionName" in columns:
-                    result["regions"] = data
-                elif "ProjectId" in columns and "TeamId" not in columns:
-                    result["projects"] = data
-                elif "TeamId" in columns:
-                    result["teams"] = data
-                elif "StatusId" in columns:
-                    result["statuses"] = data
-                elif "TaskTypeId" in columns:
-                    result["task_types"] = data
-                else:
+                key = _classify_lookup_set(frozenset(columns))
+                if key is not None:
+                    result[key] = data
+                elif result_index < len(result_names):
                     # Fallback: use index-based naming
-                    if result_index < len(result_names):
-                        result[result_names[result_index]] = data
+                    result[result_names[result_index]] = data
 
                 result_index += 1
 
             # Try to move to next result set
             if not cursor.nextset():
                 break
+    return result
 
-        cursor.close()
-        conn.close()
+
+def get_lookups(
+    lookup_type: Optional[str] = None,
+    tool_context: "ToolContext" = None,
+) -> dict:
+    """
+    Get lookup data from the database (regions, projects, teams, statuses, task types).
+
+    This tool retrieves reference data for dropdowns, validation, and queries.
+    Use this when users ask "what regions are there?" or "list all teams" or "what task types exist?".
+
+    IMPORTANT: lookup_type values are CASE-SENSITIVE and must be EXACTLY one of:
+    - "Regions" (capital R, plural) - Get all regions/provinces
+    - "Projects" (capital P, plural) - Get all projects
+    - "Teams" (capital T, plural) - Get all teams with their project and region
+    - "Statuses" (capital S, plural) - Get ticket statuses
+    - "TaskTypes" (capital T, capital T) - Get ticket task types (PM, TR, Other)
+    - "All" (capital A) - Get all lookup types
+    - None - Same as "All", gets everything
+
+    Args:
+        lookup_type: MUST be exactly one of: "Regions", "Projects", "Teams", "Statuses", "TaskTypes", "All"
+                     DO NOT use lowercase like "region" or "teams" - it will return empty!
+
+    Returns:
+        dict: Lookup data containing requested types:
+            - regions: List of {RegionId, RegionName, RegionCode}
+            - projects: List of {ProjectId, ProjectName}
+            - teams: List of {TeamId, TeamName, ProjectName, RegionName}
+            - statuses: List of {StatusId, StatusCode, StatusName, StatusColor}
+            - task_types: List of {TaskTypeId, TaskTypeName}
+            - Message: "Success" or error description
+
+    Example tool calls:
+        - "What regions are available?" -> get_lookups(lookup_type="Regions")
+        - "List all teams" -> get_lookups(lookup_type="Teams")
+        - "What projects can I filter by?" -> get_lookups(lookup_type="Projects")
+        - "Show me ticket statuses" -> get_lookups(lookup_type="Statuses")
+        - "What task types are there?" -> get_lookups(lookup_type="TaskTypes")
+        - "Show all lookup data" -> get_lookups(lookup_type="All")
+    """
+    try:
+        logger.info(f"📋 Fetching lookups: {lookup_type or 'All'}")
+        logger.debug("🔍 [LOOKUPS] lookup_type=%s", lookup_type)
+
+        # Get username from session state for permission filtering
+        username = None
+        if tool_context is not None:
+            username = tool_context.state.get("username")
+
+        cache_key = (lookup_type or "All", username)
+        result = _cached_lookups(cache_key)
+        if result is None:
+            result = _fetch_lookups(lookup_type, username)
+            _store_lookups(cache_key, result)
 
         # Log what we got
         for key in ["regions", "projects", "teams", "statuses", "task_types"]:
             if key in result:
-                print(f"📋 [LOOKUPS] {key}: {len(result[key])} items")
+                logger.debug("📋 [LOOKUPS] %s: %s items", key, len(result[key]))
 
         # Store in session for future reference
         if tool_context is not None:
@@ -264,16 +438,144 @@ def get_lookups(
 
     except pyodbc.Error as db_error:
         print(f"❌ [DB ERROR] {db_error}")
-        import traceback
         traceback.print_exc()
         return {"Message": f"Database error: {str(db_error)}"}
     except Exception as e:
         print(f"❌ [ERROR] {type(e).__name__}: {e}")
-        import traceback
         traceback.print_exc()
         return {"Message": f"Error: {type(e).__name__}: {str(e)}"}
 
 
+_TICKET_SUMMARY_SQL = (
+    "EXEC usp_Chatbot_GetTicketSummary @Username=?, @ProjectNames=?, @TeamNames=?, "
+    "@RegionNames=?, @Month=?, @Year=?, @DateFrom=?, @DateTo=?, @IncludeBreakdown=?, "
+    "@TaskTypeNames=?, @StatusNames=?"
+)
+
+
+def _ticket_summary_exec(
+    username: str,
+    project_names: Optional[str] = None,
+    team_names: Optional[str] = None,
+    region_names: Optional[str] = None,
+    month: Optional[int] = None,
+    year: Optional[int] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    include_breakdown: bool = False,
+    task_type_names: Optional[str] = None,
+    status_names: Optional[str] = None,
+) -> tuple[str, list]:
+    """Build the usp_Chatbot_GetTicketSummary EXEC statement and its parameters.
+
+    Every parameter is always sent (NULL = no filter, as the SP defaults),
+    so all filter combinations share one statement text and cached plan.
+    """
+    # Default year to current if month provided without year
+    if month is not None and year is None:
+        year = datetime.now().year
+
+    # Empty strings mean "no filter", same as omitting the parameter
+    params = [
+        username,
+        project_names or None,
+        team_names or None,
+        region_names or None,
+        month,
+        year,
+        date_from or None,
+        date_to or None,
+        1 if include_breakdown else 0,
+        task_type_names or None,
+        status_names or None,
+    ]
+    return _TICKET_SUMMARY_SQL, params
+
+
+_SUMMARY_INT_FIELDS = frozenset((
+    "TotalTickets", "OpenTickets", "SuspendedTickets",
+    "CompletedTickets", "PendingApproval", "SLABreached", "CMSTickets",
+))
+
+
+def _read_ticket_summary(cursor, username: str) -> dict:
+    """Read the summary row from the cursor's current result set."""
+    row = cursor.fetchone()
+    if not row:
+        return {
+            "TotalTickets": 0,
+            "OpenTickets": 0,
+            "SuspendedTickets": 0,
+            "CompletedTickets": 0,
+            "PendingApproval": 0,
+            "SLABreached": 0,
+            "CompletionRate": 0.0,
+            "Username": username,
+            "UserRole": "Unknown",
+            "Message": "No tickets found matching the criteria"
+        }
+
+    # Ensure numeric fields are proper types for JSON serialization, in the
+    # same pass that names the columns
+    result = {}
+    for column, val in zip(cursor.description, row):
+        name = column[0]
+        if val is not None:
+            if name in _SUMMARY_INT_FIELDS:
+                val = int(val)
+            elif name == "CompletionRate":
+                val = round(float(val), 2)
+        result[name] = val
+    return result
+
+
+def _int_if_whole(val: float):
+    return int(val) if val.is_integer() else val
+
+
+def _to_float_if_numeric(val):
+    try:
+        return float(val)
+    except (ValueError, TypeError):
+        return val
+
+
+def _breakdown_converter(name: str, type_code):
+    """Pick the JSON-friendly converter for a breakdown column, or None.
+
+    type_code is the Python type pyodbc reports in cursor.description.
+    """
+    if type_code is Decimal:
+        return float
+    if type_code is int or type_code is bool:
+        return int
+    if type_code is float:
+        return _int_if_whole
+    if 'Tickets' in name:
+        # Count column the driver didn't report as numeric
+        return _to_float_if_numeric
+    return None
+
+
+# BreakdownType -> (result key, dimension columns kept on its rows)
+_BREAKDOWN_KINDS = {
+    "region": ("by_region", ("RegionName",)),
+    "project": ("by_project", ("ProjectName",)),
+    "team": ("by_team", ("TeamName", "RegionName", "ProjectName")),
+}
+_BREAKDOWN_DIMENSIONS = ("TeamName", "RegionName", "ProjectName")
+
+
+def _split_breakdowns(rows: list[dict], result: dict) -> None:
+    """Sort the combined breakdown rows into by_region/by_project/by_team."""
+    for row in rows:
+        key, kept = _BREAKDOWN_KINDS[row.pop("BreakdownType")]
+        for dimension in _BREAKDOWN_DIMENSIONS:
+            if dimension not in kept:
+                del row[dimension]
+        result.setdefault(key, []).append(row)
+
+
 def get_ticket_summary(
     project_names: Optional[str] = None,
     team_names: Optional[str] = None,
@@ -395,7 +697,12 @@ def get_ticket_summary(
     try:
         logger.info("📊 Checking your ticket status...")
         # Debug: Log incoming parameters
-        print(f"🔍 [TOOL PARAMS] project_names={project_names}, team_names={team_names}, region_names={region_names}, month={month}, year={year}, include_breakdown={include_breakdown}, task_type_names={task_type_names}, status_names={status_names}")
+        logger.debug(
+            "🔍 [TOOL PARAMS] project_names=%s, team_names=%s, region_names=%s, month=%s, year=%s, "
+            "include_breakdown=%s, task_type_names=%s, status_names=%s",
+            project_names, team_names, region_names, month, year,
+            include_breakdown, task_type_names, status_names,
+        )
 
         # Get username from session state via tool_context
         username = None
@@ -410,10 +717,10 @@ def get_ticket_summary(
             # The LLM reads these tags and passes the correct team_names/project_names to this tool
             # This avoids ADK session state timing issues
 
-            print(f"🔍 [LLM PARAMS] project_names={project_names}, team_names={team_names}, region_names={region_names}")
+            logger.debug("🔍 [LLM PARAMS] project_names=%s, team_names=%s, region_names=%s", project_names, team_names, region_names)
 
         # Log final values used for query
-        print(f"🔍 [QUERY] username={username}, project_names={project_names}, team_names={team_names}, region_names={region_names}")
+        logger.debug("🔍 [QUERY] username=%s, project_names=%s, team_names=%s, region_names=%s", username, project_names, team_names, region_names)
 
         # Username is required - error if not found
         if not username:
@@ -423,137 +730,77 @@ def get_ticket_summary(
                 "Message": "Error: Username not found in session. Please ensure you are logged in."
             }
 
-        logger.info(f"👤 Retrieving data for {username}...")
-
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        # Build parameter list for stored procedure
-        params = [username]
-        param_markers = ['@Username=?']
-
-        if project_names:
-            params.append(project_names)
-            param_markers.append('@ProjectNames=?')
-
-        if team_names:
-            params.append(team_names)
-            param_markers.append('@TeamNames=?')
-
-        if region_names:
-            params.append(region_names)
-            param_markers.append('@RegionNames=?')
-
-        if month is not None:
-            params.append(month)
-            param_markers.append('@Month=?')
-            # Default year to current if month provided without year
-            if year is None:
-                year = datetime.now().year
-
-        if year is not None:
-            params.append(year)
-            param_markers.append('@Year=?')
-
-        if date_from:
-            params.append(date_from)
-            param_markers.append('@DateFrom=?')
-
-        if date_to:
-            params.append(date_to)
-            param_markers.append('@DateTo=?')
-
-        if include_breakdown:
-            params.append(1)
-            param_markers.append('@IncludeBreakdown=?')
-
-        if task_type_names:
-            params.append(task_type_names)
-            param_markers.append('@TaskTypeNames=?')
-
-        if status_names:
-            params.append(status_names)
-            param_markers.append('@StatusNames=?')
-
-        # Execute stored procedure
-        sql = f"EXEC usp_Chatbot_GetTicketSummary {', '.join(param_markers)}"
-        logger.info("🔄 Analyzing ticket data...")
-        cursor.execute(sql, params)
-
-        # Fetch result (first result set is always the summary)
-        row = cursor.fetchone()
-        logger.info("✅ Ticket summary ready")
-
-        if row:
-            columns = [column[0] for column in cursor.description]
-            result = dict(zip(columns, row))
-
-            # Ensure numeric fields are proper types for JSON serialization
-            numeric_fields = ['TotalTickets', 'OpenTickets', 'SuspendedTickets',
-                            'CompletedTickets', 'PendingApproval', 'SLABreached', 'CMSTickets']
-            for field in numeric_fields:
-                if field in result and result[field] is not None:
-                    result[field] = int(result[field])
-
-            # Handle completion rate
-            if 'CompletionRate' in result and result['CompletionRate'] is not None:
-                result['CompletionRate'] = round(float(result['CompletionRate']), 2)
-        else:
-            result = {
-                "TotalTickets": 0,
-                "OpenTickets": 0,
-                "SuspendedTickets": 0,
-                "CompletedTickets": 0,
-                "PendingApproval": 0,
-                "SLABreached": 0,
-                "CompletionRate": 0.0,
-                "Username": username,
-                "UserRole": "Unknown",
-                "Message": "No tickets found matching the criteria"
-            }
-
-        # If include_breakdown=True, fetch additional result sets
-        # SP returns in fixed order: by_region, by_project, by_team
-        if include_breakdown:
-            breakdown_order = ["by_region", "by_project", "by_team"]
-            breakdown_index = 0
-
-            while cursor.nextset():
-                rows = cursor.fetchall()
-                if rows and cursor.description:
-                    columns = [column[0] for column in cursor.description]
-                    data = []
-                    for r in rows:
-                        row_dict = dict(zip(columns, r))
-                        # Convert numeric fields and Decimal to proper types
-                        for key in row_dict:
-                            val = row_dict[key]
-                            if val is not None:
-                                # Handle Decimal type
-                                if hasattr(val, 'as_tuple'):  # Decimal check
-                                    row_dict[key] = float(val)
-                                elif isinstance(val, (int, float)) or 'Tickets' in key:
-                                    try:
-                                        row_dict[key] = int(val) if isinstance(val, int) or (isinstance(val, float) and val.is_integer()) else float(val)
-                                    except (ValueError, TypeError):
-                                        pass
-                        data.append(row_dict)
-
-                    # Use fixed order from SP
-                    if breakdown_index < len(breakdown_order):
-                        key = breakdown_order[breakdown_index]
-                        result[key] = data
-                        print(f"📊 [BREAKDOWN] {key}: {len(data)} items")
-
-                    breakdown_index += 1
+        logger.info("👤 Retrieving data for %s...", username)
+
+        sql, params = _ticket_summary_exec(
+            username,
+            project_names=project_names,
+            team_names=team_names,
+            region_names=region_names,
+            month=month,
+            year=year,
+            date_from=date_from,
+            date_to=date_to,
+            include_breakdown=include_breakdown,
+            task_type_names=task_type_names,
+            status_names=status_names,
+        )
 
-        cursor.close()
-        conn.close()
+        # Identical calls within SUMMARY_TTL_SECONDS skip the round-trip
+        cache_key = (sql, tuple(params))
+        result = _cached_summary(cache_key)
+        if result is None:
+            with db_pool.acquire(autocommit=True) as conn, closing(conn.cursor()) as cursor:
+                logger.info("🔄 Analyzing ticket data...")
+                cursor.execute(sql, params)
+
+                # First result set is always the summary
+                result = _read_ticket_summary(cursor, username)
+                logger.info("✅ Ticket summary ready")
+
+                # If include_breakdown=True, fetch the breakdown result set: one
+                # set tagged by BreakdownType, or (SP versions before the combined
+                # breakdown) three sets in fixed order by_region, by_project, by_team
+                if include_breakdown:
+                    breakdown_order = ["by_region", "by_project", "by_team"]
+                    breakdown_index = 0
+
+                    while cursor.nextset():
+                        if not cursor.description:
+                            continue
+                        columns = [column[0] for column in cursor.description]
+                        # Convert numeric fields and Decimal to proper types; the
+                        # converter is picked once per column from its declared type
+                        converted = [
+                            (i, column[0], conv)
+                            for i, column in enumerate(cursor.description)
+                            if (conv := _breakdown_converter(column[0], column[1])) is not None
+                        ]
+                        data = []
+                        for r in _iter_rows(cursor):
+                            row_dict = dict(zip(columns, r))
+                            for i, key, conv in converted:
+                                val = r[i]
+                                if val is not None:
+                                    row_dict[key] = conv(val)
+                            data.append(row_dict)
+
+                        if data and columns[0] == "BreakdownType":
+                            _split_breakdowns(data, result)
+                            for key in breakdown_order:
+                                logger.debug("📊 [BREAKDOWN] %s: %s items", key, len(result.get(key, [])))
+                        elif data:
+                            # Use fixed order from SP
+                            if breakdown_index < len(breakdown_order):
+                                key = breakdown_order[breakdown_index]
+                                result[key] = data
+                                logger.debug("📊 [BREAKDOWN] %s: %s items", key, len(data))
+
+                            breakdown_index += 1
+            _store_summary(cache_key, result)
 
         # IMPORTANT: Store result in session state for "chart the above" requests
         if tool_context is not None:
-            tool_context.state["last_ticket_data"] = result
-            tool_context.state["last_query_type"] = "ticket_summary"
             # Store the query context for follow-up chart requests
             # Build context string from the filters used
             query_context_parts = []
@@ -567,14 +814,17 @@ def get_ticket_summary(
                 query_context_parts.append(f"month {month}")
             if task_type_names:
                 query_context_parts.append(f"task type {task_type_names}")
-            tool_context.state["last_query_context"] = " ".join(query_context_parts) if query_context_parts else "all tickets"
+            tool_context.state.update({
+                "last_ticket_data": result,
+                "last_query_type": "ticket_summary",
+                "last_query_context": " ".join(query_context_parts) if query_context_parts else "all tickets",
+            })
             logger.info("📝 Ticket data stored in session for chart requests")
 
         return result
 
     except pyodbc.Error as db_error:
         print(f"❌ [DB ERROR] {db_error}")
-        import traceback
         traceback.print_exc()
         return {
             "TotalTickets": 0,
@@ -582,7 +832,6 @@ def get_ticket_summary(
         }
     except Exception as e:
         print(f"❌ [ERROR] {type(e).__name__}: {e}")
-        import traceback
         traceback.print_exc()
         return {
             "TotalTickets": 0,
@@ -590,6 +839,103 @@ def get_ticket_summary(
         }
 
 
+# Filter keys get_ticket_summary_batch accepts per comparison item
+_SUMMARY_BATCH_FILTERS = (
+    "project_names", "team_names", "region_names", "month", "year",
+    "date_from", "date_to", "task_type_names", "status_names",
+)
+_SUMMARY_BATCH_MAX = 10
+
+
+def get_ticket_summary_batch(
+    filters: List[dict],
+    tool_context: "ToolContext" = None,
+) -> dict:
+    """
+    Get several ticket summaries in one database round-trip, for comparisons.
+
+    Use this instead of calling get_ticket_summary repeatedly when the user
+    compares groups side by side, e.g. "ANB vs Barclays" or "Riyadh vs Jeddah
+    this month". Each item in filters is one group to summarize.
+
+    Args:
+        filters: List of 2-10 filter dicts. Each dict may contain any of the
+                 get_ticket_summary filters: project_names, team_names,
+                 region_names, month, year, date_from, date_to,
+                 task_type_names, status_names. Unknown keys are ignored.
+                 Example: [{"project_names": "ANB"}, {"project_names": "Barclays"}]
+
+    Returns:
+        dict containing:
+            - results: One ticket summary per filter dict, in the same order
+                       (same fields as get_ticket_summary, plus "Filters"
+                       echoing the filter dict it answers)
+            - count: Number of summaries returned
+            - Message: "Success" or error description
+
+    Example queries:
+        - "Compare ANB and Barclays tickets"
+          -> get_ticket_summary_batch(filters=[{"project_names": "ANB"}, {"project_names": "Barclays"}])
+        - "Riyadh vs Jeddah in January"
+          -> get_ticket_summary_batch(filters=[{"region_names": "Riyadh", "month": 1}, {"region_names": "Jeddah", "month": 1}])
+
+    For breakdowns by region/project/team use get_ticket_summary(include_breakdown=True).
+    """
+    try:
+        logger.info("📊 Comparing %s ticket summaries...", len(filters))
+        logger.debug("🔍 [BATCH PARAMS] filters=%s", filters)
+
+        username = None
+        if tool_context is not None:
+            username = tool_context.state.get("username")
+
+        if not username:
+            return {"results": [], "count": 0,
+                    "Message": "Error: Username not found in session. Please ensure you are logged in."}
+        if not filters:
+            return {"results": [], "count": 0, "Message": "Error: No filters given."}
+        if len(filters) > _SUMMARY_BATCH_MAX:
+            return {"results": [], "count": 0,
+                    "Message": f"Error: At most {_SUMMARY_BATCH_MAX} filters per call."}
+
+        item_filters = [
+            {key: f[key] for key in _SUMMARY_BATCH_FILTERS if f.get(key) is not None}
+            for f in filters
+        ]
+
+        # One EXEC per filter in a single batch; without a breakdown each
+        # EXEC returns exactly one result set, read back in order
+        statements = []
+        params = []
+        for item in item_filters:
+            sql, item_params = _ticket_summary_exec(username, **item)
+            statements.append(sql)
+            params.extend(item_params)
+
+        with db_pool.acquire(autocommit=True) as conn, closing(conn.cursor()) as cursor:
+            cursor.execute(";\n".join(statements), params)
+            results = []
+            for i, item in enumerate(item_filters):
+                if i and not cursor.nextset():
+                    break
+                summary = _read_ticket_summary(cursor, username)
+                summary["Filters"] = item
+                results.append(summary)
+
+        logger.debug("📊 [BATCH] %s summaries", len(results))
+
+        # Session state is left alone: "chart that" and the follow-up
+        # suggestions read last_ticket_data, which a comparison doesn't replace
+        return {"results": results, "count": len(results), "Message": "Success"}
+
+    except pyodbc.Error as db_error:
+        logger.exception("❌ [DB ERROR] Ticket summary batch failed: %s", db_error)
+        return {"results": [], "count": 0, "Message": f"Database error: {str(db_error)}"}
+    except Exception as e:
+        logger.exception("❌ [ERROR] Ticket summary batch failed: %s: %s", type(e).__name__, e)
+        return {"results": [], "count": 0, "Message": f"Error: {type(e).__name__}: {str(e)}"}
+
+
 def get_ticket_timeline(
     period: str = "month",
     project_names: Optional[str] = None,
@@ -647,7 +993,10 @@ def get_ticket_timeline(
     """
     try:
         logger.info("📈 Fetching ticket timeline...")
-        print(f"🔍 [TIMELINE] period={period}, projects={project_names}, teams={team_names}, regions={region_names}, from={date_from}, to={date_to}, task_types={task_type_names}")
+        logger.debug(
+            "🔍 [TIMELINE] period=%s, projects=%s, teams=%s, regions=%s, from=%s, to=%s, task_types=%s",
+            period, project_names, team_names, region_names, date_from, date_to, task_type_names,
+        )
 
         # Get username from session state
         username = None
@@ -657,65 +1006,60 @@ def get_ticket_timeline(
         if not username:
             return {"timeline": [], "Message": "Error: Username not found in session. Please ensure you are logged in."}
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with db_pool.acquire(autocommit=True) as conn, closing(conn.cursor()) as cursor:
+            # Build parameter list
+            params = [username]
+            param_markers = ['@Username=?']
 
-        # Build parameter list
-        params = [username]
-        param_markers = ['@Username=?']
-
-        if project_names:
-            params.append(project_names)
-            param_markers.append('@ProjectNames=?')
-
-        if team_names:
-            params.append(team_names)
-            param_markers.append('@TeamNames=?')
+            if project_names:
+                params.append(project_names)
+                param_markers.append('@ProjectNames=?')
 
-        if region_names:
-            params.append(region_names)
-            param_markers.append('@RegionNames=?')
+            if team_names:
+                params.append(team_names)
+                param_markers.append('@TeamNames=?')
 
-        if period:
-            params.append(period)
-            param_markers.append('@Period=?')
+            if region_names:
+                params.append(region_names)
+                param_markers.append('@RegionNames=?')
 
-        if date_from:
-            params.append(date_from)
-            param_markers.append('@DateFrom=?')
+            if period:
+                params.append(period)
+                param_markers.append('@Period=?')
 
-        if date_to:
-            params.append(date_to)
-            param_markers.append('@DateTo=?')
+            if date_from:
+                params.append(date_from)
+                param_markers.append('@DateFrom=?')
 
-        if task_type_names:
-            params.append(task_type_names)
-            param_markers.append('@TaskTypeNames=?')
+            if date_to:
+                params.append(date_to)
+                param_markers.append('@DateTo=?')
 
-        sql = f"EXEC usp_Chatbot_GetTicketTimeline {', '.join(param_markers)}"
-        logger.info("🔄 Querying ticket timeline...")
-        cursor.execute(sql, params)
+            if task_type_names:
+                params.append(task_type_names)
+                param_markers.append('@TaskTypeNames=?')
 
-        rows = cursor.fetchall()
-        timeline = []
+            sql = f"EXEC usp_Chatbot_GetTicketTimeline {', '.join(param_markers)}"
+            logger.info("🔄 Querying ticket timeline...")
+            cursor.execute(sql, params)
 
-        if rows and cursor.description:
-            columns = [col[0] for col in cursor.description]
-            for row in rows:
-                row_dict = dict(zip(columns, row))
-                # Ensure numeric values are proper types
-                for key in row_dict:
-                    val = row_dict[key]
-                    if val is not None and isinstance(val, (int, float)):
-                        row_dict[key] = int(val) if isinstance(val, int) or (isinstance(val, float) and val.is_integer()) else float(val)
-                    elif val is not None and hasattr(val, 'as_tuple'):
-                        row_dict[key] = float(val)
-                timeline.append(row_dict)
+            rows = cursor.fetchall()
+            timeline = []
 
-        cursor.close()
-        conn.close()
+            if rows and cursor.description:
+                columns = [col[0] for col in cursor.description]
+                for row in rows:
+                    row_dict = dict(zip(columns, row))
+                    # Ensure numeric values are proper types
+                    for key in row_dict:
+                        val = row_dict[key]
+                        if val is not None and isinstance(val, (int, float)):
+                            row_dict[key] = int(val) if isinstance(val, int) or (isinstance(val, float) and val.is_integer()) else float(val)
+                        elif val is not None and hasattr(val, 'as_tuple'):
+                            row_dict[key] = float(val)
+                    timeline.append(row_dict)
 
-        print(f"📈 [TIMELINE] Got {len(timeline)} periods")
+        logger.debug("📈 [TIMELINE] Got %s periods", len(timeline))
 
         result = {
             "timeline": timeline,
@@ -738,12 +1082,10 @@ def get_ticket_timeline(
 
     except pyodbc.Error as db_error:
         print(f"❌ [DB ERROR] {db_error}")
-        import traceback
         traceback.print_exc()
         return {"timeline": [], "Message": f"Database error: {str(db_error)}"}
     except Exception as e:
         print(f"❌ [ERROR] {type(e).__name__}: {e}")
-        import traceback
         traceback.print_exc()
         return {"timeline": [], "Message": f"Error: {type(e).__name__}: {str(e)}"}
 
@@ -760,55 +1102,56 @@ def calculate_date_range(period: str) -> tuple[Optional[str], Optional[str]]:
     Returns:
         tuple: (date_from, date_to) in YYYY-MM-DD format, or (None, None) if not recognized
     """
-    today = datetime.now().date()
-
-    period_lower = period.lower().strip()
-
-    if period_lower in ("last week", "past week"):
-        date_to = today
-        date_from = today - timedelta(days=7)
-        return (date_from.strftime("%Y-%m-%d"), date_to.strftime("%Y-%m-%d"))
-
-    if period_lower in ("last 7 days", "past 7 days"):
-        date_to = today
-        date_from = today - timedelta(days=7)
-        return (date_from.strftime("%Y-%m-%d"), date_to.strftime("%Y-%m-%d"))
-
-    if period_lower in ("last 30 days", "past 30 days", "past month"):
-        date_to = today
-        date_from = today - timedelta(days=30)
-        return (date_from.strftime("%Y-%m-%d"), date_to.strftime("%Y-%m-%d"))
-
-    if period_lower in ("this week",):
+    return _date_range(period.lower().strip(), date.today())
+
+
+# Trailing windows ending today, in days back from today
+_TRAILING_RANGES = {
+    "last week": 7,
+    "past week": 7,
+    "last 7 days": 7,
+    "past 7 days": 7,
+    "last 30 days": 30,
+    "past 30 days": 30,
+    "past month": 30,
+}
+
+# (marker, first day, last day) — matched as substrings, so "Q4 2025" works
+_QUARTERS = (
+    ("q1", "01-01", "03-31"),
+    ("q2", "04-01", "06-30"),
+    ("q3", "07-01", "09-30"),
+    ("q4", "10-01", "12-31"),
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _date_range(period_lower: str, today: date) -> tuple[Optional[str], Optional[str]]:
+    """calculate_date_range() for a normalized period, memoized per day."""
+    days_back = _TRAILING_RANGES.get(period_lower)
+    if days_back is not None:
+        date_from = today - timedelta(days=days_back)
+        return (date_from.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d"))
+
+    if period_lower == "this week":
         # Start of current week (Monday)
         date_from = today - timedelta(days=today.weekday())
-        date_to = today
-        return (date_from.strftime("%Y-%m-%d"), date_to.strftime("%Y-%m-%d"))
+        return (date_from.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d"))
 
-    # Quarter handling
-    if "q1" in period_lower:
-        year = _extract_year(period_lower) or today.year
-        return (f"{year}-01-01", f"{year}-03-31")
+    for marker, first_day, last_day in _QUARTERS:
+        if marker in period_lower:
+            year = _extract_year(period_lower) or today.year
+            return (f"{year}-{first_day}", f"{year}-{last_day}")
 
-    if "q2" in period_lower:
-        year = _extract_year(period_lower) or today.year
-        return (f"{year}-04-01", f"{year}-06-30")
-
-    if "q3" in period_lower:
-        year = _extract_year(period_lower) or today.year
-        return (f"{year}-07-01", f"{year}-09-30")
+    return (None, None)
 
-    if "q4" in period_lower:
-        year = _extract_year(period_lower) or today.year
-        return (f"{year}-10-01", f"{year}-12-31")
 
-    return (None, None)
+_YEAR_RE = re.compile(r'20\d{2}')
 
 
 def _extract_year(text: str) -> Optional[int]:
     """Extract 4-digit year from text."""
-    import re
-    match = re.search(r'20\d{2}', text)
+    match = _YEAR_RE.search(text)
     if match:
         return int(match.group())
     return None
@@ -899,11 +1242,14 @@ def get_pm_checklist_data(
     """
     try:
         logger.info("🔧 Fetching PM checklist data...")
-        print(f"🔍 [PM] site={site_name}, field_name={field_name}, field_value={field_value}, "
-              f"sub_cat={sub_category_name}, pm_code={pm_code}, status={ticket_status}, "
-              f"category={category_name}, projects={project_names}, teams={team_names}, "
-              f"regions={region_names}, cities={city_names}, "
-              f"date_from={date_from}, date_to={date_to}, latest={latest_only}")
+        logger.debug(
+            "🔍 [PM] site=%s, field_name=%s, field_value=%s, sub_cat=%s, pm_code=%s, "
+            "status=%s, category=%s, projects=%s, teams=%s, regions=%s, cities=%s, "
+            "date_from=%s, date_to=%s, latest=%s",
+            site_name, field_name, field_value, sub_category_name, pm_code,
+            ticket_status, category_name, project_names, team_names, region_names,
+            city_names, date_from, date_to, latest_only,
+        )
 
         # Get username from session state
         username = None
@@ -914,101 +1260,96 @@ def get_pm_checklist_data(
             return {"records": [], "summary": {}, "query_mode": "unknown", "count": 0,
                     "Message": "Error: Username not found in session. Please ensure you are logged in."}
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with db_pool.acquire(autocommit=True) as conn, closing(conn.cursor()) as cursor:
+            # Build parameter list
+            params = [username]
+            param_markers = ['@Username=?']
 
-        # Build parameter list
-        params = [username]
-        param_markers = ['@Username=?']
-
-        if site_name:
-            params.append(site_name)
-            param_markers.append('@SiteName=?')
-        if field_name:
-            params.append(field_name)
-            param_markers.append('@FieldName=?')
-        if field_value:
-            params.append(field_value)
-            param_markers.append('@FieldValue=?')
-        if sub_category_name:
-            params.append(sub_category_name)
-            param_markers.append('@SubCategoryName=?')
-        if pm_code:
-            params.append(pm_code)
-            param_markers.append('@PMCode=?')
-        if ticket_status:
-            params.append(ticket_status)
-            param_markers.append('@TicketStatus=?')
-        if category_name:
-            params.append(category_name)
-            param_markers.append('@CategoryName=?')
-        if project_names:
-            params.append(project_names)
-            param_markers.append('@ProjectNames=?')
-        if team_names:
-            params.append(team_names)
-            param_markers.append('@TeamNames=?')
-        if region_names:
-            params.append(region_names)
-            param_markers.append('@RegionNames=?')
-        if city_names:
-            params.append(city_names)
-            param_markers.append('@CityNames=?')
-        if date_from:
-            params.append(date_from)
-            param_markers.append('@DateFrom=?')
-        if date_to:
-            params.append(date_to)
-            param_markers.append('@DateTo=?')
-        if not latest_only:
-            params.append(0)
-            param_markers.append('@LatestOnly=?')
-
-        sql = f"EXEC usp_Chatbot_GetPMChecklistData {', '.join(param_markers)}"
-        logger.info("🔄 Querying PM checklist data...")
-        cursor.execute(sql, params)
-
-        # Result Set 1: Detail rows
-        rows = cursor.fetchall()
-        records = []
-        sp_early_return = None
-        if rows and cursor.description:
-            columns = [col[0] for col in cursor.description]
-            # Detect SP early-return error (e.g. "No matching projects found", "User not found")
-            if columns == ['TotalResults', 'Message']:
-                sp_early_return = dict(zip(columns, rows[0]))
-                print(f"⚠️ [PM] SP early return: {sp_early_return}")
-            else:
-                for row in rows:
-                    row_dict = dict(zip(columns, row))
-                    # Convert datetime/Decimal to serializable types
-                    for key in row_dict:
-                        val = row_dict[key]
+            if site_name:
+                params.append(site_name)
+                param_markers.append('@SiteName=?')
+            if field_name:
+                params.append(field_name)
+                param_markers.append('@FieldName=?')
+            if field_value:
+                params.append(field_value)
+                param_markers.append('@FieldValue=?')
+            if sub_category_name:
+                params.append(sub_category_name)
+                param_markers.append('@SubCategoryName=?')
+            if pm_code:
+                params.append(pm_code)
+                param_markers.append('@PMCode=?')
+            if ticket_status:
+                params.append(ticket_status)
+                param_markers.append('@TicketStatus=?')
+            if category_name:
+                params.append(category_name)
+                param_markers.append('@CategoryName=?')
+            if project_names:
+                params.append(project_names)
+                param_markers.append('@ProjectNames=?')
+            if team_names:
+                params.append(team_names)
+                param_markers.append('@TeamNames=?')
+            if region_names:
+                params.append(region_names)
+                param_markers.append('@RegionNames=?')
+            if city_names:
+                params.append(city_names)
+                param_markers.append('@CityNames=?')
+            if date_from:
+                params.append(date_from)
+                param_markers.append('@DateFrom=?')
+            if date_to:
+                params.append(date_to)
+                param_markers.append('@DateTo=?')
+            if not latest_only:
+                params.append(0)
+                param_markers.append('@LatestOnly=?')
+
+            sql = f"EXEC usp_Chatbot_GetPMChecklistData {', '.join(param_markers)}"
+            logger.info("🔄 Querying PM checklist data...")
+            cursor.execute(sql, params)
+
+            # Result Set 1: Detail rows
+            rows = cursor.fetchall()
+            records = []
+            sp_early_return = None
+            if rows and cursor.description:
+                columns = [col[0] for col in cursor.description]
+                # Detect SP early-return error (e.g. "No matching projects found", "User not found")
+                if columns == ['TotalResults', 'Message']:
+                    sp_early_return = dict(zip(columns, rows[0]))
+                    logger.warning("⚠️ [PM] SP early return: %s", sp_early_return)
+                else:
+                    for row in rows:
+                        row_dict = dict(zip(columns, row))
+                        # Convert datetime/Decimal to serializable types
+                        for key in row_dict:
+                            val = row_dict[key]
+                            if val is not None:
+                                if hasattr(val, 'isoformat'):  # datetime
+                                    row_dict[key] = val.isoformat()
+                                elif hasattr(val, 'as_tuple'):  # Decimal
+                                    row_dict[key] = float(val)
+                        records.append(row_dict)
+
+            # Result Set 2: Summary
+            summary = {}
+            if cursor.nextset():
+                summary_rows = cursor.fetchall()
+                if summary_rows and cursor.description:
+                    summary_cols = [col[0] for col in cursor.description]
+                    summary = dict(zip(summary_cols, summary_rows[0]))
+                    # Convert Decimal/datetime in summary
+                    for key in summary:
+                        val = summary[key]
                         if val is not None:
-                            if hasattr(val, 'isoformat'):  # datetime
-                                row_dict[key] = val.isoformat()
-                            elif hasattr(val, 'as_tuple'):  # Decimal
-                                row_dict[key] = float(val)
-                    records.append(row_dict)
-
-        # Result Set 2: Summary
-        summary = {}
-        if cursor.nextset():
-            summary_rows = cursor.fetchall()
-            if summary_rows and cursor.description:
-                summary_cols = [col[0] for col in cursor.description]
-                summary = dict(zip(summary_cols, summary_rows[0]))
-                # Convert Decimal/datetime in summary
-                for key in summary:
-                    val = summary[key]
-                    if val is not None:
-                        if hasattr(val, 'isoformat'):
-                            summary[key] = val.isoformat()
-                        elif hasattr(val, 'as_tuple'):
-                            summary[key] = float(val)
-
-        cursor.close()
-        conn.close()
+                            if hasattr(val, 'isoformat'):
+                                summary[key] = val.isoformat()
+                            elif hasattr(val, 'as_tuple'):
+                                summary[key] = float(val)
 
         # Determine query mode
         if field_name or field_value:
@@ -1018,7 +1359,7 @@ def get_pm_checklist_data(
         else:
             query_mode = "overview"
 
-        print(f"🔧 [PM] mode={query_mode}, records={len(records)}, summary={summary}")
+        logger.debug("🔧 [PM] mode=%s, records=%s, summary=%s", query_mode, len(records), summary)
 
         # Cross-project hint: if 0 records with site_name + project filter,
         # check if the site exists in a different project the user has access to
@@ -1028,49 +1369,48 @@ def get_pm_checklist_data(
         )
         if not records and site_name and project_names:
             try:
-                hint_conn = get_db_connection()
-                hint_cursor = hint_conn.cursor()
-                # Re-run without project filter to see if site exists elsewhere
-                hint_params = [username, site_name]
-                hint_markers = ['@Username=?', '@SiteName=?']
-                if field_name:
-                    hint_params.append(field_name)
-                    hint_markers.append('@FieldName=?')
-                hint_sql = f"EXEC usp_Chatbot_GetPMChecklistData {', '.join(hint_markers)}"
-                hint_cursor.execute(hint_sql, hint_params)
-                hint_rows = hint_cursor.fetchall()
-                if hint_rows and hint_cursor.description:
-                    hint_cols = [c[0] for c in hint_cursor.description]
-                    # Check if we got actual data rows (not "User not found" etc.)
-                    if 'SiteName' in hint_cols:
-                        # Find which project(s) the site belongs to
-                        found_projects = set()
-                        for r in hint_rows:
-                            rd = dict(zip(hint_cols, r))
-                            # Look up project name from ticket
-                            found_projects.add(rd.get('SiteName', ''))
-                        # Get the actual project name via a quick query
-                        hint_cursor.close()
-                        hint_cursor = hint_conn.cursor()
-                        hint_cursor.execute(
-                            "SELECT DISTINCT p.Name FROM Tickets t "
-                            "INNER JOIN Projects p ON p.Id = t.ProjectId "
-                            "WHERE t.SiteName LIKE '%' + ? + '%' AND t.IsActive = 1",
-                            [site_name]
-                        )
-                        proj_rows = hint_cursor.fetchall()
-                        if proj_rows:
-                            actual_projects = [r[0] for r in proj_rows]
-                            no_results_message = (
-                                f"Site '{site_name}' was not found in the currently selected project "
-                                f"({project_names}). This site exists in: {', '.join(actual_projects)}. "
-                                f"Please select the correct project or remove the project filter to see results."
+                with db_pool.acquire(autocommit=True) as hint_conn:
+                    hint_cursor = hint_conn.cursor()
+                    # Re-run without project filter to see if site exists elsewhere
+                    hint_params = [username, site_name]
+                    hint_markers = ['@Username=?', '@SiteName=?']
+                    if field_name:
+                        hint_params.append(field_name)
+                        hint_markers.append('@FieldName=?')
+                    hint_sql = f"EXEC usp_Chatbot_GetPMChecklistData {', '.join(hint_markers)}"
+                    hint_cursor.execute(hint_sql, hint_params)
+                    hint_rows = hint_cursor.fetchall()
+                    if hint_rows and hint_cursor.description:
+                        hint_cols = [c[0] for c in hint_cursor.description]
+                        # Check if we got actual data rows (not "User not found" etc.)
+                        if 'SiteName' in hint_cols:
+                            # Find which project(s) the site belongs to
+                            found_projects = set()
+                            for r in hint_rows:
+                                rd = dict(zip(hint_cols, r))
+                                # Look up project name from ticket
+                                found_projects.add(rd.get('SiteName', ''))
+                            # Get the actual project name via a quick query
+                            hint_cursor.close()
+                            hint_cursor = hint_conn.cursor()
+                            hint_cursor.execute(
+                                "SELECT DISTINCT p.Name FROM Tickets t "
+                                "INNER JOIN Projects p ON p.Id = t.ProjectId "
+                                "WHERE t.SiteName LIKE '%' + ? + '%' AND t.IsActive = 1",
+                                [site_name]
                             )
-                            print(f"🔍 [PM HINT] Site found in other project(s): {actual_projects}")
-                hint_cursor.close()
-                hint_conn.close()
+                            proj_rows = hint_cursor.fetchall()
+                            if proj_rows:
+                                actual_projects = [r[0] for r in proj_rows]
+                                no_results_message = (
+                                    f"Site '{site_name}' was not found in the currently selected project "
+                                    f"({project_names}). This site exists in: {', '.join(actual_projects)}. "
+                                    f"Please select the correct project or remove the project filter to see results."
+                                )
+                                logger.debug("🔍 [PM HINT] Site found in other project(s): %s", actual_projects)
+                    hint_cursor.close()
             except Exception as hint_err:
-                print(f"⚠️ [PM HINT] Cross-project check failed: {hint_err}")
+                logger.warning("⚠️ [PM HINT] Cross-project check failed: %s", hint_err)
 
         result = {
             "records": records,
@@ -1101,18 +1441,47 @@ def get_pm_checklist_data(
 
     except pyodbc.Error as db_error:
         print(f"❌ [DB ERROR] {db_error}")
-        import traceback
         traceback.print_exc()
         return {"records": [], "summary": {}, "query_mode": "unknown", "count": 0,
                 "Message": f"Database error: {str(db_error)}"}
     except Exception as e:
         print(f"❌ [ERROR] {type(e).__name__}: {e}")
-        import traceback
         traceback.print_exc()
         return {"records": [], "summary": {}, "query_mode": "unknown", "count": 0,
                 "Message": f"Error: {type(e).__name__}: {str(e)}"}
 
 
+# create_chart_from_session metrics: display label/color, plus either the
+# last_ticket_data field it reads or the (minuend, subtrahend) metrics it
+# is derived from
+_SESSION_METRICS = {
+    "open": {"label": "Open", "color": "#3b82f6", "field": "OpenTickets"},
+    "completed": {"label": "Completed", "color": "#22c55e", "field": "CompletedTickets"},
+    "suspended": {"label": "Suspended", "color": "#f59e0b", "field": "SuspendedTickets"},
+    "pending": {"label": "Pending Approval", "color": "#8b5cf6", "field": "PendingApproval"},
+    "breached": {"label": "SLA Breached", "color": "#ef4444", "field": "SLABreached"},
+    "within_sla": {"label": "Within SLA", "color": "#22c55e", "derived": ("total", "breached")},
+    "non_suspended": {"label": "Non-Suspended", "color": "#22c55e", "derived": ("total", "suspended")},
+    "non_open": {"label": "Non-Open", "color": "#22c55e", "derived": ("total", "open")},
+    "remaining": {"label": "Remaining", "color": "#f59e0b", "derived": ("total", "completed")},
+    "total": {"label": "Total", "color": "#3b82f6", "field": "TotalTickets"},
+    "completion_rate": {"label": "Completion Rate", "color": "#3b82f6", "field": "CompletionRate"},
+    "cms": {"label": "CMS", "color": "#06b6d4", "field": "CMSTickets"},
+}
+
+# "Within SLA" / "within-sla" -> "within_sla" (after lower())
+_METRIC_KEY_TABLE = str.maketrans(" -", "__")
+
+
+def _session_metric(last_data: dict, metric_key: str):
+    """Value of one _SESSION_METRICS metric from the stored ticket summary."""
+    config = _SESSION_METRICS[metric_key]
+    if "field" in config:
+        return last_data.get(config["field"], 0)
+    minuend, subtrahend = config["derived"]
+    return _session_metric(last_data, minuend) - _session_metric(last_data, subtrahend)
+
+
 def create_chart_from_session(
     metrics: List[str],
     chart_type: str,
@@ -1188,12 +1557,6 @@ def create_chart_from_session(
             title="Open vs Completed Tickets"
         )
     """
-    # Import chart tools here to avoid circular imports
-    from .chart_tools import (
-        create_completion_rate_gauge,
-        create_chart
-    )
-
     # Check if we have session context
     if tool_context is None:
         return "<p><span style='color:#dc2626'>Error: No session context available.</span></p>"
@@ -1205,83 +1568,55 @@ def create_chart_from_session(
         return """<p><span style='color:#f59e0b'>⚠️ No previous ticket data found in this session.</span></p>
 <p>Please ask for ticket data first (e.g., "What are my tickets?"), then I can create a chart for you.</p>"""
 
-    print(f"📊 [CHART] Creating chart - Metrics: {metrics}, Type: {chart_type}, Title: {title}")
-    logger.info(f"📊 Creating chart - Metrics: {metrics}, Type: {chart_type}, Title: {title}")
-
-    # Extract raw values from stored data
-    raw_data = {
-        "open": last_data.get("OpenTickets", 0),
-        "completed": last_data.get("CompletedTickets", 0),
-        "suspended": last_data.get("SuspendedTickets", 0),
-        "pending": last_data.get("PendingApproval", 0),
-        "breached": last_data.get("SLABreached", 0),
-        "total": last_data.get("TotalTickets", 0),
-        "completion_rate": last_data.get("CompletionRate", 0),
-        "cms": last_data.get("CMSTickets", 0),
-    }
-
-    # Calculate derived metrics
-    raw_data["within_sla"] = raw_data["total"] - raw_data["breached"]
-    raw_data["non_suspended"] = raw_data["total"] - raw_data["suspended"]
-    raw_data["non_open"] = raw_data["total"] - raw_data["open"]
-    raw_data["remaining"] = raw_data["total"] - raw_data["completed"]
-
-    # Metric display labels and colors
-    metric_config = {
-        "open": {"label": "Open", "color": "#3b82f6"},
-        "completed": {"label": "Completed", "color": "#22c55e"},
-        "suspended": {"label": "Suspended", "color": "#f59e0b"},
-        "pending": {"label": "Pending Approval", "color": "#8b5cf6"},
-        "breached": {"label": "SLA Breached", "color": "#ef4444"},
-        "within_sla": {"label": "Within SLA", "color": "#22c55e"},
-        "non_suspended": {"label": "Non-Suspended", "color": "#22c55e"},
-        "non_open": {"label": "Non-Open", "color": "#22c55e"},
-        "remaining": {"label": "Remaining", "color": "#f59e0b"},
-        "total": {"label": "Total", "color": "#3b82f6"},
-        "completion_rate": {"label": "Completion Rate", "color": "#3b82f6"},
-        "cms": {"label": "CMS", "color": "#06b6d4"},
-    }
+    logger.debug("📊 [CHART] Creating chart - Metrics: %s, Type: %s, Title: %s", metrics, chart_type, title)
+    logger.info("📊 Creating chart - Metrics: %s, Type: %s, Title: %s", metrics, chart_type, title)
 
     # Handle gauge chart for completion_rate
-    if chart_type == "gauge" or (len(metrics) == 1 and metrics[0] == "completion_rate"):
+    if chart_type == "gauge" or (
+        len(metrics) == 1 and metrics[0].lower().translate(_METRIC_KEY_TABLE) == "completion_rate"
+    ):
         return create_completion_rate_gauge(
-            completion_rate=raw_data["completion_rate"],
+            completion_rate=last_data.get("CompletionRate", 0),
             target_rate=80.0,
             title=title,
             tool_context=tool_context,
         )
 
-    # Build chart data from requested metrics
+    # Build chart data from requested metrics; only those are computed
     chart_data = []
     colors = []
 
     for metric in metrics:
-        metric_lower = metric.lower().replace(" ", "_").replace("-", "_")
-        if metric_lower in raw_data:
-            config = metric_config.get(metric_lower, {"label": metric.title(), "color": "#64748b"})
-            value = raw_data[metric_lower]
-            chart_data.append({
-                "category": config["label"],
-                "count": value,
-                "color": config["color"]
-            })
-            colors.append(config["color"])
-        else:
-            logger.warning(f"Unknown metric: {metric}")
+        metric_key = metric.lower().translate(_METRIC_KEY_TABLE)
+        config = _SESSION_METRICS.get(metric_key)
+        if config is None:
+            logger.warning("Unknown metric: %s", metric)
+            continue
+        chart_data.append({
+            "category": config["label"],
+            "count": _session_metric(last_data, metric_key),
+            "color": config["color"]
+        })
+        colors.append(config["color"])
 
     if not chart_data:
         return "<p><span style='color:#dc2626'>Error: No valid metrics specified.</span></p>"
 
     # Generate description
-    total = raw_data["total"]
+    total = last_data.get("TotalTickets", 0)
     if len(chart_data) == 2:
-        m1, m2 = chart_data[0], chart_data[1]
-        description = f"{m1['category']}: {m1['count']} ({m1['count']/total*100:.1f}%) vs {m2['category']}: {m2['count']} ({m2['count']/total*100:.1f}%)" if total > 0 else "No data"
+        if total > 0:
+            m1, m2 = chart_data
+            p1, p2 = m1['count'] * 100 / total, m2['count'] * 100 / total
+            description = (f"{m1['category']}: {m1['count']} ({p1:.1f}%) vs "
+                           f"{m2['category']}: {m2['count']} ({p2:.1f}%)")
+        else:
+            description = "No data"
     else:
         description = f"Distribution across {len(chart_data)} categories (Total: {total})"
 
-    print(f"📊 [CHART] Chart data prepared: {len(chart_data)} categories")
-    logger.info(f"📊 Chart data prepared: {chart_data}")
+    logger.debug("📊 [CHART] Chart data prepared: %s categories", len(chart_data))
+    logger.info("📊 Chart data prepared: %s", chart_data)
 
     chart_output = create_chart(
         data=chart_data,
@@ -1294,7 +1629,33 @@ def create_chart_from_session(
         tool_context=tool_context,
     )
 
-    # Log first 200 chars of output to verify format
-    print(f"📊 [CHART] Output preview: {chart_output[:200]}...")
+    # Log first 200 chars of output to verify format (the slice is skipped
+    # unless debug logging is on)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("📊 [CHART] Output preview: %s...", chart_output[:200])
 
     return chart_output
+
+
+# =============================================================================
+# ASYNC TOOL VARIANTS
+# =============================================================================
+def _off_event_loop(func):
+    """Wrap a blocking DB tool as a coroutine that runs it on a worker thread.
+
+    functools.wraps keeps the name, signature and docstring ADK builds the
+    tool declaration from, so the LLM sees the same tool either way.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return wrapper
+
+
+# Registered on the agents in place of the blocking versions, so a slow
+# stored procedure doesn't stall other sessions on the event loop
+get_lookups_async = _off_event_loop(get_lookups)
+get_ticket_summary_async = _off_event_loop(get_ticket_summary)
+get_ticket_summary_batch_async = _off_event_loop(get_ticket_summary_batch)
+get_ticket_timeline_async = _off_event_loop(get_ticket_timeline)
+get_pm_checklist_data_async = _off_event_loop(get_pm_checklist_data)
@@ -6,9 +6,10 @@ and certification status tracking.
 
 import logging
 from typing import Optional
+from contextlib import closing
 from datetime import datetime
 
-from .db_tools import get_db_connection
+from . import db_pool
 
 # Configure logger
 logger = logging.getLogger("oip_assistant.tools.engineer")
@@ -97,101 +98,96 @@ def get_engineer_performance(
         print(f"🔍 [ENGINEER PERF] username={username}, employees={employee_names}, "
               f"projects={project_names}, teams={team_names}, month={month}, year={year}")
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        # Build parameter list
-        params = [username]
-        param_markers = ['@Username=?']
-
-        if employee_names:
-            params.append(employee_names)
-            param_markers.append('@EmployeeNames=?')
-        if project_names:
-            params.append(project_names)
-            param_markers.append('@ProjectNames=?')
-        if team_names:
-            params.append(team_names)
-            param_markers.append('@TeamNames=?')
-        if region_names:
-            params.append(region_names)
-            param_markers.append('@RegionNames=?')
-        if month is not None:
-            params.append(month)
-            param_markers.append('@Month=?')
-        if year is not None:
-            params.append(year)
-            param_markers.append('@Year=?')
-        if date_from:
-            params.append(date_from)
-            param_markers.append('@DateFrom=?')
-        if date_to:
-            params.append(date_to)
-            param_markers.append('@DateTo=?')
-        if include_activity:
-            params.append(1)
-            param_markers.append('@IncludeActivity=?')
-        if role_names:
-            params.append(role_names)
-            param_markers.append('@RoleNames=?')
-
-        sql = f"EXEC usp_Chatbot_GetEngineerPerformance {', '.join(param_markers)}"
-        logger.info(f"🔄 Executing: {sql}")
-        cursor.execute(sql, params)
-
-        # Result Set 1: Engineer rows
-        engineers = []
-        rows = cursor.fetchall()
-        if rows and cursor.description:
-            columns = [col[0] for col in cursor.description]
-            for row in rows:
-                eng = {}
-                for i, col in enumerate(columns):
-                    val = row[i]
-                    if isinstance(val, datetime):
-                        val = val.strftime("%Y-%m-%d")
-                    elif hasattr(val, 'as_tuple'):  # Decimal
-                        val = float(val)
-                    eng[col] = val
-                engineers.append(eng)
-
-        # Result Set 2: Summary
-        summary = {}
-        if cursor.nextset():
+        with db_pool.acquire(autocommit=True) as conn, closing(conn.cursor()) as cursor:
+            # Build parameter list
+            params = [username]
+            param_markers = ['@Username=?']
+
+            if employee_names:
+                params.append(employee_names)
+                param_markers.append('@EmployeeNames=?')
+            if project_names:
+                params.append(project_names)
+                param_markers.append('@ProjectNames=?')
+            if team_names:
+                params.append(team_names)
+                param_markers.append('@TeamNames=?')
+            if region_names:
+                params.append(region_names)
+                param_markers.append('@RegionNames=?')
+            if month is not None:
+                params.append(month)
+                param_markers.append('@Month=?')
+            if year is not None:
+                params.append(year)
+                param_markers.append('@Year=?')
+            if date_from:
+                params.append(date_from)
+                param_markers.append('@DateFrom=?')
+            if date_to:
+                params.append(date_to)
+                param_markers.append('@DateTo=?')
+            if include_activity:
+                params.append(1)
+                param_markers.append('@IncludeActivity=?')
+            if role_names:
+                params.append(role_names)
+                param_markers.append('@RoleNames=?')
+
+            sql = f"EXEC usp_Chatbot_GetEngineerPerformance {', '.join(param_markers)}"
+            logger.info(f"🔄 Executing: {sql}")
+            cursor.execute(sql, params)
+
+            # Result Set 1: Engineer rows
+            engineers = []
             rows = cursor.fetchall()
             if rows and cursor.description:
                 columns = [col[0] for col in cursor.description]
-                row = rows[0]
-                for i, col in enumerate(columns):
-                    val = row[i]
-                    if hasattr(val, 'as_tuple'):
-                        val = float(val)
-                    summary[col] = val
-
-        # Check for early exit (error message from SP)
-        if not engineers and summary.get("Message") and summary.get("Message") != "Success":
-            return {"status": "error", "Message": summary["Message"], "engineers": [], "summary": summary, "count": 0}
-
-        # Result Set 3: Activity log (only if include_activity=True)
-        activity_log = []
-        if include_activity:
+                for row in rows:
+                    eng = {}
+                    for i, col in enumerate(columns):
+                        val = row[i]
+                        if isinstance(val, datetime):
+                            val = val.strftime("%Y-%m-%d")
+                        elif hasattr(val, 'as_tuple'):  # Decimal
+                            val = float(val)
+                        eng[col] = val
+                    engineers.append(eng)
+
+            # Result Set 2: Summary
+            summary = {}
             if cursor.nextset():
                 rows = cursor.fetchall()
                 if rows and cursor.description:
                     columns = [col[0] for col in cursor.description]
-                    for row in rows:
-                        entry = {}
-                        for i, col in enumerate(columns):
-                            val = row[i]
-                            if isinstance(val, datetime):
-                                val = val.strftime("%Y-%m-%d")
-                            elif hasattr(val, 'as_tuple'):
-                                val = float(val)
-                            entry[col] = val
-                        activity_log.append(entry)
-
-        cursor.close()
-        conn.close()
+                    row = rows[0]
+                    for i, col in enumerate(columns):
+                        val = row[i]
+                        if hasattr(val, 'as_tuple'):
+                            val = float(val)
+                        summary[col] = val
+
+            # Check for early exit (error message from SP)
+            if not engineers and summary.get("Message") and summary.get("Message") != "Success":
+                return {"status": "error", "Message": summary["Message"], "engineers": [], "summary": summary, "count": 0}
+
+            # Result Set 3: Activity log (only if include_activity=True)
+            activity_log = []
+            if include_activity:
+                if cursor.nextset():
+                    rows = cursor.fetchall()
+                    if rows and cursor.description:
+                        columns = [col[0] for col in cursor.description]
+                        for row in rows:
+                            entry = {}
+                            for i, col in enumerate(columns):
+                                val = row[i]
+                                if isinstance(val, datetime):
+                                    val = val.strftime("%Y-%m-%d")
+                                elif hasattr(val, 'as_tuple'):
+                                    val = float(val)
+                                entry[col] = val
+                            activity_log.append(entry)
 
         result = {
             "status": "success",
@@ -275,60 +271,55 @@ def get_certification_status(
         print(f"🔍 [CERTS] username={username}, projects={project_names}, "
               f"employees={employee_names}, days={expiring_within_days}")
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        params = [username]
-        param_markers = ['@Username=?']
-
-        if project_names:
-            params.append(project_names)
-            param_markers.append('@ProjectNames=?')
-        if employee_names:
-            params.append(employee_names)
-            param_markers.append('@EmployeeNames=?')
-        if expiring_within_days != 90:
-            params.append(expiring_within_days)
-            param_markers.append('@ExpiringWithinDays=?')
-        if show_all:
-            params.append(1)
-            param_markers.append('@ShowAll=?')
-
-        sql = f"EXEC usp_Chatbot_GetCertificationStatus {', '.join(param_markers)}"
-        logger.info(f"🔄 Executing: {sql}")
-        cursor.execute(sql, params)
-
-        # Result Set 1: Certification records
-        certifications = []
-        rows = cursor.fetchall()
-        if rows and cursor.description:
-            columns = [col[0] for col in cursor.description]
-            for row in rows:
-                cert = {}
-                for i, col in enumerate(columns):
-                    val = row[i]
-                    if isinstance(val, datetime):
-                        val = val.strftime("%Y-%m-%d")
-                    elif hasattr(val, 'as_tuple'):
-                        val = float(val)
-                    cert[col] = val
-                certifications.append(cert)
-
-        # Result Set 2: Summary
-        summary = {}
-        if cursor.nextset():
+        with db_pool.acquire(autocommit=True) as conn, closing(conn.cursor()) as cursor:
+            params = [username]
+            param_markers = ['@Username=?']
+
+            if project_names:
+                params.append(project_names)
+                param_markers.append('@ProjectNames=?')
+            if employee_names:
+                params.append(employee_names)
+                param_markers.append('@EmployeeNames=?')
+            if expiring_within_days != 90:
+                params.append(expiring_within_days)
+                param_markers.append('@ExpiringWithinDays=?')
+            if show_all:
+                params.append(1)
+                param_markers.append('@ShowAll=?')
+
+            sql = f"EXEC usp_Chatbot_GetCertificationStatus {', '.join(param_markers)}"
+            logger.info(f"🔄 Executing: {sql}")
+            cursor.execute(sql, params)
+
+            # Result Set 1: Certification records
+            certifications = []
             rows = cursor.fetchall()
             if rows and cursor.description:
                 columns = [col[0] for col in cursor.description]
-                row = rows[0]
-                for i, col in enumerate(columns):
-                    val = row[i]
-                    if hasattr(val, 'as_tuple'):
-                        val = float(val)
-                    summary[col] = val
-
-        cursor.close()
-        conn.close()
+                for row in rows:
+                    cert = {}
+                    for i, col in enumerate(columns):
+                        val = row[i]
+                        if isinstance(val, datetime):
+                            val = val.strftime("%Y-%m-%d")
+                        elif hasattr(val, 'as_tuple'):
+                            val = float(val)
+                        cert[col] = val
+                    certifications.append(cert)
+
+            # Result Set 2: Summary
+            summary = {}
+            if cursor.nextset():
+                rows = cursor.fetchall()
+                if rows and cursor.description:
+                    columns = [col[0] for col in cursor.description]
+                    row = rows[0]
+                    for i, col in enumerate(columns):
+                        val = row[i]
+                        if hasattr(val, 'as_tuple'):
+                            val = float(val)
+                        summary[col] = val
 
         # Handle empty certification table gracefully
         total_certs = summary.get("TotalCertifications", 0)
@@ -6,9 +6,10 @@ consumption tracking, and invoicing site lists.
 
 import logging
 from typing import Optional
+from contextlib import closing
 from datetime import datetime
 
-from .db_tools import get_db_connection
+from . import db_pool
 
 # Configure logger
 logger = logging.getLogger("oip_assistant.tools.inventory")
@@ -83,75 +84,70 @@ def get_inventory_consumption(
         print(f"🔍 [INVENTORY] username={username}, item={item_name}, code={item_code}, "
               f"projects={project_names}, month={month}, year={year}, type={transaction_type}")
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        params = [username]
-        param_markers = ['@Username=?']
-
-        if project_names:
-            params.append(project_names)
-            param_markers.append('@ProjectNames=?')
-        if item_name:
-            params.append(item_name)
-            param_markers.append('@ItemName=?')
-        if item_code:
-            params.append(item_code)
-            param_markers.append('@ItemCode=?')
-        if category_name:
-            params.append(category_name)
-            param_markers.append('@CategoryName=?')
-        if month is not None:
-            params.append(month)
-            param_markers.append('@Month=?')
-        if year is not None:
-            params.append(year)
-            param_markers.append('@Year=?')
-        if date_from:
-            params.append(date_from)
-            param_markers.append('@DateFrom=?')
-        if date_to:
-            params.append(date_to)
-            param_markers.append('@DateTo=?')
-        if transaction_type and transaction_type != "OUT":
-            params.append(transaction_type)
-            param_markers.append('@TransactionType=?')
-
-        sql = f"EXEC usp_Chatbot_GetInventoryConsumption {', '.join(param_markers)}"
-        logger.info(f"🔄 Executing: {sql}")
-        cursor.execute(sql, params)
-
-        # Result Set 1: Transaction detail
-        transactions = []
-        rows = cursor.fetchall()
-        if rows and cursor.description:
-            columns = [col[0] for col in cursor.description]
-            for row in rows:
-                txn = {}
-                for i, col in enumerate(columns):
-                    val = row[i]
-                    if isinstance(val, datetime):
-                        val = val.strftime("%Y-%m-%d")
-                    elif hasattr(val, 'as_tuple'):
-                        val = float(val)
-                    txn[col] = val
-                transactions.append(txn)
-
-        # Result Set 2: Summary
-        summary = {}
-        if cursor.nextset():
+        with db_pool.acquire(autocommit=True) as conn, closing(conn.cursor()) as cursor:
+            params = [username]
+            param_markers = ['@Username=?']
+
+            if project_names:
+                params.append(project_names)
+                param_markers.append('@ProjectNames=?')
+            if item_name:
+                params.append(item_name)
+                param_markers.append('@ItemName=?')
+            if item_code:
+                params.append(item_code)
+                param_markers.append('@ItemCode=?')
+            if category_name:
+                params.append(category_name)
+                param_markers.append('@CategoryName=?')
+            if month is not None:
+                params.append(month)
+                param_markers.append('@Month=?')
+            if year is not None:
+                params.append(year)
+                param_markers.append('@Year=?')
+            if date_from:
+                params.append(date_from)
+                param_markers.append('@DateFrom=?')
+            if date_to:
+                params.append(date_to)
+                param_markers.append('@DateTo=?')
+            if transaction_type and transaction_type != "OUT":
+                params.append(transaction_type)
+                param_markers.append('@TransactionType=?')
+
+            sql = f"EXEC usp_Chatbot_GetInventoryConsumption {', '.join(param_markers)}"
+            logger.info(f"🔄 Executing: {sql}")
+            cursor.execute(sql, params)
+
+            # Result Set 1: Transaction detail
+            transactions = []
             rows = cursor.fetchall()
             if rows and cursor.description:
                 columns = [col[0] for col in cursor.description]
-                row = rows[0]
-                for i, col in enumerate(columns):
-                    val = row[i]
-                    if hasattr(val, 'as_tuple'):
-                        val = float(val)
-                    summary[col] = val
-
-        cursor.close()
-        conn.close()
+                for row in rows:
+                    txn = {}
+                    for i, col in enumerate(columns):
+                        val = row[i]
+                        if isinstance(val, datetime):
+                            val = val.strftime("%Y-%m-%d")
+                        elif hasattr(val, 'as_tuple'):
+                            val = float(val)
+                        txn[col] = val
+                    transactions.append(txn)
+
+            # Result Set 2: Summary
+            summary = {}
+            if cursor.nextset():
+                rows = cursor.fetchall()
+                if rows and cursor.description:
+                    columns = [col[0] for col in cursor.description]
+                    row = rows[0]
+                    for i, col in enumerate(columns):
+                        val = row[i]
+                        if hasattr(val, 'as_tuple'):
+                            val = float(val)
+                        summary[col] = val
 
         # Check for early error
         if not transactions and summary.get("Message") and summary.get("Message") != "Success":
@@ -1,9 +1,10 @@
 """RAG tool for Google ADK agent - searches OIP knowledge base"""
+import functools
 import logging
 from typing import Optional
 from ..rag.vector_store import FAISSVectorStore
 from ..helpers.openrouter import OpenRouterClient
-from ..prompts.templates import Prompts
+from ..prompts.templates import error_response, format_rag_context, no_results_response
 from ..config import RAGConfig
 
 # Configure logger for this module
@@ -37,6 +38,12 @@ def _get_openrouter() -> OpenRouterClient:
     return _openrouter
 
 
+@functools.lru_cache(maxsize=256)
+def _query_embedding(query: str) -> tuple:
+    """Embed a search query; repeats (retries, re-asked questions) skip the API call."""
+    return tuple(_get_openrouter().get_embedding(query))
+
+
 # =============================================================================
 # RAG TOOL FUNCTION (for Google ADK)
 # =============================================================================
@@ -62,16 +69,26 @@ def search_oip_documents(query: str, top_k: int = 5) -> dict:
     try:
         logger.info("🔍 Looking up OIP documentation...")
 
+        # Nothing to embed for an empty query
+        normalized_query = query.strip()
+        if not normalized_query:
+            return {
+                "status": "no_results",
+                "query": query,
+                "results": [],
+                "context": "",
+                "message": no_results_response(query),
+            }
+
         # Validate top_k
         top_k = min(max(1, top_k), 10)
 
         # Get instances
         vector_store = _get_vector_store()
-        openrouter = _get_openrouter()
 
         # Generate query embedding
         logger.info("📖 Analyzing your question...")
-        query_embedding = openrouter.get_embedding(query)
+        query_embedding = _query_embedding(normalized_query)
 
         # Search FAISS index
         logger.info("📚 Finding relevant information...")
@@ -89,24 +106,24 @@ def search_oip_documents(query: str, top_k: int = 5) -> dict:
                 "query": query,
                 "results": [],
                 "context": "",
-                "message": Prompts.no_results_response(query),
+                "message": no_results_response(query),
             }
 
         # Format results for output
-        formatted_results = []
-        for i, result in enumerate(results, 1):
-            formatted_results.append({
+        formatted_results = [
+            {
                 "rank": i,
                 "text": result.text,
                 "score": round(result.score, 3),
                 "source": result.metadata.source,
                 "chunk_index": result.metadata.chunk_index,
-            })
+            }
+            for i, result in enumerate(results, 1)
+        ]
 
         # Use prompt template for structured context formatting
-        context = Prompts.format_rag_context(
+        context = format_rag_context(
             results=formatted_results,
-            query=query,
             include_scores=True,
         )
 
@@ -137,7 +154,7 @@ def search_oip_documents(query: str, top_k: int = 5) -> dict:
             "query": query,
             "results": [],
             "context": "",
-            "message": Prompts.error_response("Search Error", str(e)),
+            "message": error_response("Search Error", str(e)),
         }
 
 
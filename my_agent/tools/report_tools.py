@@ -11,9 +11,11 @@ import logging
 import base64
 import os
 from typing import Optional
+from contextlib import closing
 from datetime import datetime
 
-from .db_tools import get_db_connection
+from . import db_pool
+from .db_tools import _split_breakdowns
 
 # Configure logger
 logger = logging.getLogger("oip_assistant.tools.report")
@@ -169,174 +171,177 @@ def collect_report_data(
             }
             section_list = defaults.get(report_type, ["tickets"])
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        report_data = {
-            "report_type": report_type,
-            "project_names": project_names,
-            "team_names": team_names,
-            "region_names": region_names,
-            "employee_names": employee_names,
-            "month": month,
-            "year": year,
-            "date_from": date_from,
-            "date_to": date_to,
-            "sections_collected": [],
-        }
+        with db_pool.acquire(autocommit=True) as conn, closing(conn.cursor()) as cursor:
+            report_data = {
+                "report_type": report_type,
+                "project_names": project_names,
+                "team_names": team_names,
+                "region_names": region_names,
+                "employee_names": employee_names,
+                "month": month,
+                "year": year,
+                "date_from": date_from,
+                "date_to": date_to,
+                "sections_collected": [],
+            }
 
-        # Common filter kwargs for SPs
-        common_filters = {}
-        if project_names:
-            common_filters["ProjectNames"] = project_names
-        if team_names:
-            common_filters["TeamNames"] = team_names
-        if region_names:
-            common_filters["RegionNames"] = region_names
-        if month is not None:
-            common_filters["Month"] = month
-        if year is not None:
-            common_filters["Year"] = year
-        if date_from:
-            common_filters["DateFrom"] = date_from
-        if date_to:
-            common_filters["DateTo"] = date_to
-
-        # ── Ticket Summary ──
-        if "tickets" in section_list:
-            try:
-                rs = _exec_sp(cursor, "usp_Chatbot_GetTicketSummary", username,
-                              IncludeBreakdown=1, **common_filters)
-                report_data["ticket_summary"] = rs[0] if len(rs) > 0 else []
-                report_data["ticket_breakdown"] = rs[1] if len(rs) > 1 else []
-                # Summary row is ALWAYS rs[0] (first result set from SP)
-                # rs[1..3] are breakdowns by region/project/team — each row also
-                # has "TotalTickets" but those are per-group subtotals, not the grand total.
-                if rs[0] and any("TotalTickets" in r for r in rs[0]):
-                    report_data["ticket_totals"] = rs[0][0]
-                else:
-                    report_data["ticket_totals"] = {}
-                report_data["sections_collected"].append("tickets")
-                print(f"  [REPORT] tickets: {len(report_data.get('ticket_summary', []))} rows")
-            except Exception as e:
-                logger.warning(f"[REPORT] ticket_summary failed: {e}")
-                report_data["ticket_summary_error"] = str(e)
-
-        # ── Ticket Types (PM/TR/Other) ──
-        if "ticket_types" in section_list:
-            try:
-                rs_pm = _exec_sp(cursor, "usp_Chatbot_GetTicketSummary", username,
-                                 TaskTypeNames="PM", **common_filters)
-                rs_tr = _exec_sp(cursor, "usp_Chatbot_GetTicketSummary", username,
-                                 TaskTypeNames="TR", **common_filters)
-                rs_other = _exec_sp(cursor, "usp_Chatbot_GetTicketSummary", username,
-                                    TaskTypeNames="Other", **common_filters)
-
-                type_data = []
-                for label, rs in [("PM", rs_pm), ("TR", rs_tr), ("Other", rs_other)]:
+            # Common filter kwargs for SPs
+            common_filters = {}
+            if project_names:
+                common_filters["ProjectNames"] = project_names
+            if team_names:
+                common_filters["TeamNames"] = team_names
+            if region_names:
+                common_filters["RegionNames"] = region_names
+            if month is not None:
+                common_filters["Month"] = month
+            if year is not None:
+                common_filters["Year"] = year
+            if date_from:
+                common_filters["DateFrom"] = date_from
+            if date_to:
+                common_filters["DateTo"] = date_to
+
+            # ── Ticket Summary ──
+            if "tickets" in section_list:
+                try:
+                    rs = _exec_sp(cursor, "usp_Chatbot_GetTicketSummary", username,
+                                  IncludeBreakdown=1, **common_filters)
+                    report_data["ticket_summary"] = rs[0] if len(rs) > 0 else []
                     # Summary row is ALWAYS rs[0] (first result set from SP)
-                    totals = rs[0][0] if rs and rs[0] and any("TotalTickets" in r for r in rs[0]) else {}
-                    type_data.append({
-                        "TaskType": label,
-                        "TotalTickets": totals.get("TotalTickets", 0),
-                        "OpenTickets": totals.get("OpenTickets", 0),
-                        "CompletedTickets": totals.get("CompletedTickets", 0),
-                        "SuspendedTickets": totals.get("SuspendedTickets", 0),
-                    })
-
-                report_data["ticket_types"] = type_data
-                report_data["sections_collected"].append("ticket_types")
-                print(f"  [REPORT] ticket_types: PM={type_data[0]['TotalTickets']}, "
-                      f"TR={type_data[1]['TotalTickets']}, Other={type_data[2]['TotalTickets']}")
-            except Exception as e:
-                logger.warning(f"[REPORT] ticket_types failed: {e}")
-                report_data["ticket_types_error"] = str(e)
-
-        # ── Timeline ──
-        if "timeline" in section_list:
-            try:
-                timeline_filters = {}
-                if project_names:
-                    timeline_filters["ProjectNames"] = project_names
-                if team_names:
-                    timeline_filters["TeamNames"] = team_names
-                if region_names:
-                    timeline_filters["RegionNames"] = region_names
-                if date_from:
-                    timeline_filters["DateFrom"] = date_from
-                if date_to:
-                    timeline_filters["DateTo"] = date_to
-                if not date_from and month is not None and year is not None:
-                    import calendar
-                    last_day = calendar.monthrange(year, month)[1]
-                    timeline_filters["DateFrom"] = f"{year}-{month:02d}-01"
-                    timeline_filters["DateTo"] = f"{year}-{month:02d}-{last_day:02d}"
-                elif not date_from and year is not None:
-                    timeline_filters["DateFrom"] = f"{year}-01-01"
-                    timeline_filters["DateTo"] = f"{year}-12-31"
-                rs = _exec_sp(cursor, "usp_Chatbot_GetTicketTimeline", username,
-                              Period="month", **timeline_filters)
-                report_data["timeline"] = rs[0] if len(rs) > 0 else []
-                report_data["sections_collected"].append("timeline")
-                print(f"  [REPORT] timeline: {len(report_data['timeline'])} periods")
-            except Exception as e:
-                logger.warning(f"[REPORT] timeline failed: {e}")
-                report_data["timeline_error"] = str(e)
-
-        # ── Engineers ──
-        if "engineers" in section_list:
-            try:
-                eng_filters = dict(common_filters)
-                if employee_names:
-                    eng_filters["EmployeeNames"] = employee_names
-                # Pass RoleNames="All" for reports — we want all roles, SP now returns RoleName column
-                eng_filters["RoleNames"] = "All"
-                rs = _exec_sp(cursor, "usp_Chatbot_GetEngineerPerformance", username,
-                              **eng_filters)
-                report_data["engineers"] = rs[0] if len(rs) > 0 else []
-                report_data["engineer_summary"] = rs[1][0] if len(rs) > 1 and rs[1] else {}
-                report_data["sections_collected"].append("engineers")
-                # Debug: show roles returned
-                roles_found = set(e.get("RoleName", "N/A") for e in report_data["engineers"])
-                print(f"  [REPORT] engineers: {len(report_data['engineers'])} rows, roles={roles_found}")
-            except Exception as e:
-                logger.warning(f"[REPORT] engineers failed: {e}")
-                report_data["engineers_error"] = str(e)
-
-        # ── Certifications ──
-        if "certifications" in section_list:
-            try:
-                cert_filters = {}
-                if project_names:
-                    cert_filters["ProjectNames"] = project_names
-                if employee_names:
-                    cert_filters["EmployeeNames"] = employee_names
-                rs = _exec_sp(cursor, "usp_Chatbot_GetCertificationStatus", username,
-                              ShowAll=1, **cert_filters)
-                report_data["certifications"] = rs[0] if len(rs) > 0 else []
-                report_data["cert_summary"] = rs[1][0] if len(rs) > 1 and rs[1] else {}
-                report_data["sections_collected"].append("certifications")
-                print(f"  [REPORT] certifications: {len(report_data['certifications'])} rows")
-            except Exception as e:
-                logger.warning(f"[REPORT] certifications failed: {e}")
-                report_data["certifications_error"] = str(e)
-
-        # ── Inventory ──
-        if "inventory" in section_list:
-            try:
-                inv_filters = dict(common_filters)
-                rs = _exec_sp(cursor, "usp_Chatbot_GetInventoryConsumption", username,
-                              **inv_filters)
-                report_data["inventory"] = rs[0] if len(rs) > 0 else []
-                report_data["inventory_summary"] = rs[1][0] if len(rs) > 1 and rs[1] else {}
-                report_data["sections_collected"].append("inventory")
-                print(f"  [REPORT] inventory: {len(report_data['inventory'])} rows")
-            except Exception as e:
-                logger.warning(f"[REPORT] inventory failed: {e}")
-                report_data["inventory_error"] = str(e)
-
-        cursor.close()
-        conn.close()
+                    # rs[1] holds the region/project/team breakdowns tagged by
+                    # BreakdownType (older SP versions: rs[1..3], one set each) —
+                    # each row also has "TotalTickets" but those are per-group
+                    # subtotals, not the grand total. ticket_breakdown is by region.
+                    breakdown_rows = rs[1] if len(rs) > 1 else []
+                    if breakdown_rows and "BreakdownType" in breakdown_rows[0]:
+                        breakdowns = {}
+                        _split_breakdowns(breakdown_rows, breakdowns)
+                    else:
+                        breakdowns = {"by_region": breakdown_rows}
+                    report_data["ticket_breakdown"] = breakdowns.get("by_region", [])
+                    if rs[0] and any("TotalTickets" in r for r in rs[0]):
+                        report_data["ticket_totals"] = rs[0][0]
+                    else:
+                        report_data["ticket_totals"] = {}
+                    report_data["sections_collected"].append("tickets")
+                    print(f"  [REPORT] tickets: {len(report_data.get('ticket_summary', []))} rows")
+                except Exception as e:
+                    logger.warning(f"[REPORT] ticket_summary failed: {e}")
+                    report_data["ticket_summary_error"] = str(e)
+
+            # ── Ticket Types (PM/TR/Other) ──
+            if "ticket_types" in section_list:
+                try:
+                    rs_pm = _exec_sp(cursor, "usp_Chatbot_GetTicketSummary", username,
+                                     TaskTypeNames="PM", **common_filters)
+                    rs_tr = _exec_sp(cursor, "usp_Chatbot_GetTicketSummary", username,
+                                     TaskTypeNames="TR", **common_filters)
+                    rs_other = _exec_sp(cursor, "usp_Chatbot_GetTicketSummary", username,
+                                        TaskTypeNames="Other", **common_filters)
+
+                    type_data = []
+                    for label, rs in [("PM", rs_pm), ("TR", rs_tr), ("Other", rs_other)]:
+                        # Summary row is ALWAYS rs[0] (first result set from SP)
+                        totals = rs[0][0] if rs and rs[0] and any("TotalTickets" in r for r in rs[0]) else {}
+                        type_data.append({
+                            "TaskType": label,
+                            "TotalTickets": totals.get("TotalTickets", 0),
+                            "OpenTickets": totals.get("OpenTickets", 0),
+                            "CompletedTickets": totals.get("CompletedTickets", 0),
+                            "SuspendedTickets": totals.get("SuspendedTickets", 0),
+                        })
+
+                    report_data["ticket_types"] = type_data
+                    report_data["sections_collected"].append("ticket_types")
+                    print(f"  [REPORT] ticket_types: PM={type_data[0]['TotalTickets']}, "
+                          f"TR={type_data[1]['TotalTickets']}, Other={type_data[2]['TotalTickets']}")
+                except Exception as e:
+                    logger.warning(f"[REPORT] ticket_types failed: {e}")
+                    report_data["ticket_types_error"] = str(e)
+
+            # ── Timeline ──
+            if "timeline" in section_list:
+                try:
+                    timeline_filters = {}
+                    if project_names:
+                        timeline_filters["ProjectNames"] = project_names
+                    if team_names:
+                        timeline_filters["TeamNames"] = team_names
+                    if region_names:
+                        timeline_filters["RegionNames"] = region_names
+                    if date_from:
+                        timeline_filters["DateFrom"] = date_from
+                    if date_to:
+                        timeline_filters["DateTo"] = date_to
+                    if not date_from and month is not None and year is not None:
+                        import calendar
+                        last_day = calendar.monthrange(year, month)[1]
+                        timeline_filters["DateFrom"] = f"{year}-{month:02d}-01"
+                        timeline_filters["DateTo"] = f"{year}-{month:02d}-{last_day:02d}"
+                    elif not date_from and year is not None:
+                        timeline_filters["DateFrom"] = f"{year}-01-01"
+                        timeline_filters["DateTo"] = f"{year}-12-31"
+                    rs = _exec_sp(cursor, "usp_Chatbot_GetTicketTimeline", username,
+                                  Period="month", **timeline_filters)
+                    report_data["timeline"] = rs[0] if len(rs) > 0 else []
+                    report_data["sections_collected"].append("timeline")
+                    print(f"  [REPORT] timeline: {len(report_data['timeline'])} periods")
+                except Exception as e:
+                    logger.warning(f"[REPORT] timeline failed: {e}")
+                    report_data["timeline_error"] = str(e)
+
+            # ── Engineers ──
+            if "engineers" in section_list:
+                try:
+                    eng_filters = dict(common_filters)
+                    if employee_names:
+                        eng_filters["EmployeeNames"] = employee_names
+                    # Pass RoleNames="All" for reports — we want all roles, SP now returns RoleName column
+                    eng_filters["RoleNames"] = "All"
+                    rs = _exec_sp(cursor, "usp_Chatbot_GetEngineerPerformance", username,
+                                  **eng_filters)
+                    report_data["engineers"] = rs[0] if len(rs) > 0 else []
+                    report_data["engineer_summary"] = rs[1][0] if len(rs) > 1 and rs[1] else {}
+                    report_data["sections_collected"].append("engineers")
+                    # Debug: show roles returned
+                    roles_found = set(e.get("RoleName", "N/A") for e in report_data["engineers"])
+                    print(f"  [REPORT] engineers: {len(report_data['engineers'])} rows, roles={roles_found}")
+                except Exception as e:
+                    logger.warning(f"[REPORT] engineers failed: {e}")
+                    report_data["engineers_error"] = str(e)
+
+            # ── Certifications ──
+            if "certifications" in section_list:
+                try:
+                    cert_filters = {}
+                    if project_names:
+                        cert_filters["ProjectNames"] = project_names
+                    if employee_names:
+                        cert_filters["EmployeeNames"] = employee_names
+                    rs = _exec_sp(cursor, "usp_Chatbot_GetCertificationStatus", username,
+                                  ShowAll=1, **cert_filters)
+                    report_data["certifications"] = rs[0] if len(rs) > 0 else []
+                    report_data["cert_summary"] = rs[1][0] if len(rs) > 1 and rs[1] else {}
+                    report_data["sections_collected"].append("certifications")
+                    print(f"  [REPORT] certifications: {len(report_data['certifications'])} rows")
+                except Exception as e:
+                    logger.warning(f"[REPORT] certifications failed: {e}")
+                    report_data["certifications_error"] = str(e)
+
+            # ── Inventory ──
+            if "inventory" in section_list:
+                try:
+                    inv_filters = dict(common_filters)
+                    rs = _exec_sp(cursor, "usp_Chatbot_GetInventoryConsumption", username,
+                                  **inv_filters)
+                    report_data["inventory"] = rs[0] if len(rs) > 0 else []
+                    report_data["inventory_summary"] = rs[1][0] if len(rs) > 1 and rs[1] else {}
+                    report_data["sections_collected"].append("inventory")
+                    print(f"  [REPORT] inventory: {len(report_data['inventory'])} rows")
+                except Exception as e:
+                    logger.warning(f"[REPORT] inventory failed: {e}")
+                    report_data["inventory_error"] = str(e)
 
         # Store full data in session for builder
         if tool_context is not None:
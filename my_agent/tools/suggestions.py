@@ -204,7 +204,7 @@ async def _generate_suggestions_llm(
             OPENROUTER_BASE_URL,
             SuggestionsConfig,
         )
-        from ..prompts.templates import Prompts
+        from ..prompts.templates import suggestions_prompt
 
         if not SuggestionsConfig.USE_LLM:
             return None
@@ -243,7 +243,7 @@ async def _generate_suggestions_llm(
             litellm.acompletion(
                 model=f"openrouter/{SuggestionsConfig.LLM_MODEL}",
                 messages=[
-                    {"role": "system", "content": Prompts.suggestions_prompt()},
+                    {"role": "system", "content": suggestions_prompt()},
                     {"role": "user", "content": user_prompt},
                 ],
                 api_key=OPENROUTER_API_KEY,
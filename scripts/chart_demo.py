@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""Developer utility: print sample chart tool output.
+
+Usage:
+    python scripts/chart_demo.py
+
+Renders a ticket status pie, a completion gauge and an auto-selected line
+chart to stdout, for eyeballing the JSON the frontend receives.
+
+NOT for agent use — developer reference only.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from my_agent.tools.chart_tools import (
+    create_chart,
+    create_completion_rate_gauge,
+    create_ticket_status_chart,
+)
+
+
+def main():
+    # Ticket status chart
+    print("=== Ticket Status Pie Chart ===")
+    result = create_ticket_status_chart(
+        open_tickets=12,
+        completed_tickets=7,
+        suspended_tickets=3,
+        pending_approval=2,
+        sla_breached=5
+    )
+    print(result)
+    print()
+
+    # Completion rate gauge
+    print("=== Completion Rate Gauge ===")
+    result = create_completion_rate_gauge(65.5, 80.0)
+    print(result)
+    print()
+
+    # Auto-selection for time series
+    print("=== Auto-Selected Line Chart ===")
+    result = create_chart(
+        data=[
+            {"month": "Jan", "tickets": 15},
+            {"month": "Feb", "tickets": 18},
+            {"month": "Mar", "tickets": 12}
+        ],
+        title="Monthly Ticket Trend",
+        x_key="month",
+        y_keys=["tickets"]
+    )
+    print(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ This script:
 3. Generates embeddings via OpenRouter
 4. Stores in FAISS index
 """
+import asyncio
 import sys
 from pathlib import Path
 
@@ -70,28 +71,23 @@ def main():
     all_chunks = chunker.chunk_documents(documents)
     print(f"  Created {len(all_chunks)} chunks")
 
-    # Generate embeddings
+    # Generate embeddings and add to vector store
     print("\n[5/5] Generating embeddings...")
     batch_size = RAGConfig.EMBEDDING_BATCH_SIZE
     total_batches = (len(all_chunks) + batch_size - 1) // batch_size
-
-    for i in range(0, len(all_chunks), batch_size):
-        batch = all_chunks[i : i + batch_size]
-        texts = [chunk.text for chunk in batch]
-
-        # Get embeddings from OpenRouter
-        embeddings = openrouter.get_embeddings(texts)
-
-        # Assign embeddings to chunks
-        for chunk, embedding in zip(batch, embeddings):
-            chunk.embedding = embedding
-
-        batch_num = (i // batch_size) + 1
-        print(f"  Batch {batch_num}/{total_batches} complete")
-
-    # Add to vector store
-    print("\nAdding to FAISS index...")
-    count = vector_store.add_documents(all_chunks)
+    completed = 0
+
+    def on_batch(_size: int) -> None:
+        nonlocal completed
+        completed += 1
+        print(f"  Batch {completed}/{total_batches} complete")
+
+    # Embedding calls run concurrently; vectors stream into FAISS as they arrive
+    count = asyncio.run(
+        vector_store.ingest(
+            all_chunks, openrouter.get_embeddings, batch_size, on_batch=on_batch
+        )
+    )
     print(f"  Added {count} vectors")
 
     # Save index
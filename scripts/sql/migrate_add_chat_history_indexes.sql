@@ -0,0 +1,69 @@
+-- Migration: Add covering indexes for chat history reads
+-- Date: 2026-10-14
+-- Purpose: Let get_sessions() and get_session_messages() (chat_history.py)
+--          seek straight to a user's / session's rows in the order they are
+--          returned, instead of scanning and sorting.
+
+-- Filtered indexes can only be created (and the table written to afterwards)
+-- with these ON; sqlcmd defaults QUOTED_IDENTIFIER to OFF
+SET ANSI_NULLS ON;
+SET QUOTED_IDENTIFIER ON;
+GO
+
+-- Sidebar list: WHERE UserId = ? AND IsDeleted = 0 ORDER BY UpdatedAt DESC, Id DESC.
+-- Filtered to live sessions; the TOP (?) query reads the first N index rows
+-- with no sort and no key lookups (IsDeleted included for the filter match).
+-- Id is a key column because it breaks UpdatedAt ties in the page cursor
+IF NOT EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'IX_ChatbotSessions_User_Updated'
+      AND object_id = OBJECT_ID('dbo.ChatbotSessions')
+)
+BEGIN
+    CREATE INDEX IX_ChatbotSessions_User_Updated
+        ON dbo.ChatbotSessions (UserId, UpdatedAt DESC, Id DESC)
+        INCLUDE (Title, CreatedAt, IsDeleted)
+        WHERE IsDeleted = 0;
+    PRINT 'Created IX_ChatbotSessions_User_Updated';
+END
+ELSE IF NOT EXISTS (
+    -- Created by an earlier version of this script, without the Id key
+    SELECT 1
+    FROM sys.indexes i
+    JOIN sys.index_columns ic ON ic.object_id = i.object_id AND ic.index_id = i.index_id
+    JOIN sys.columns c ON c.object_id = ic.object_id AND c.column_id = ic.column_id
+    WHERE i.name = 'IX_ChatbotSessions_User_Updated'
+      AND i.object_id = OBJECT_ID('dbo.ChatbotSessions')
+      AND c.name = 'Id'
+      AND ic.key_ordinal > 0
+)
+BEGIN
+    CREATE INDEX IX_ChatbotSessions_User_Updated
+        ON dbo.ChatbotSessions (UserId, UpdatedAt DESC, Id DESC)
+        INCLUDE (Title, CreatedAt, IsDeleted)
+        WHERE IsDeleted = 0
+        WITH (DROP_EXISTING = ON);
+    PRINT 'Rebuilt IX_ChatbotSessions_User_Updated with Id';
+END
+ELSE
+    PRINT 'IX_ChatbotSessions_User_Updated already exists';
+GO
+
+-- Message history: WHERE SessionId = ? AND Id > ? ORDER BY Id, plus the
+-- latest-report lookup (ORDER BY Id DESC). Both read Content / report
+-- columns, which are NVARCHAR(MAX) and deliberately not included: copying
+-- every message body into the index would double the table's size just to
+-- save the clustered lookups, so the index only orders the seek
+IF NOT EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'IX_ChatbotMessages_Session_Id'
+      AND object_id = OBJECT_ID('dbo.ChatbotMessages')
+)
+BEGIN
+    CREATE INDEX IX_ChatbotMessages_Session_Id
+        ON dbo.ChatbotMessages (SessionId, Id);
+    PRINT 'Created IX_ChatbotMessages_Session_Id';
+END
+ELSE
+    PRINT 'IX_ChatbotMessages_Session_Id already exists';
+GO
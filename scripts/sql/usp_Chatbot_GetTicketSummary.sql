@@ -263,48 +263,16 @@ BEGIN
     -- =========================================
     IF @IncludeBreakdown = 1
     BEGIN
-        -- RESULT SET 2: Breakdown by Region
+        -- RESULT SET 2: Breakdowns by region, project and team from one
+        -- pass over the tickets. BreakdownType tags each row ('region',
+        -- 'project', 'team'); dimension columns outside a row's grouping
+        -- set come back NULL and are dropped by get_ticket_summary
         SELECT 
+            CASE WHEN GROUPING(p.Name) = 1 THEN 'region'
+                 WHEN GROUPING(tm.Name) = 1 THEN 'project'
+                 ELSE 'team' END AS BreakdownType,
+            tm.Name AS TeamName,
             sp.Name AS RegionName,
-            COUNT(*) AS TotalTickets,
-            SUM(CASE WHEN lc.Name = 'Open' THEN 1 ELSE 0 END) AS OpenTickets,
-            SUM(CASE WHEN t.CallStatusId = 9 THEN 1 ELSE 0 END) AS SuspendedTickets,
-            SUM(CASE WHEN lc.Name IN ('Completed', 'Closed') THEN 1 ELSE 0 END) AS CompletedTickets,
-            SUM(CASE WHEN t.ApprovalStatusId = 15 AND t.CallStatusId = 18 THEN 1 ELSE 0 END) AS PendingApproval,  -- ✅ FIXED
-            SUM(CASE 
-                WHEN t.CallStatusId != 9 
-                 AND ISNULL(lc.Name,'') NOT IN ('Completed', 'Closed')
-                 AND DATEDIFF(DAY, t.CreatedAt, GETDATE()) > 1 
-                THEN 1 ELSE 0 
-            END) AS SLABreached,
-            CAST(
-                CASE WHEN COUNT(*) > 0 
-                    THEN (SUM(CASE WHEN lc.Name IN ('Completed', 'Closed') THEN 1.0 ELSE 0 END) / COUNT(*)) * 100
-                    ELSE 0 
-                END AS DECIMAL(5,2)
-            ) AS CompletionRate
-        FROM dbo.Tickets t
-        LEFT JOIN dbo.LookupChild lc ON lc.Id = t.CallStatusId
-        INNER JOIN dbo.Teams tm ON tm.Id = t.TeamId
-        LEFT JOIN dbo.StateProvince sp ON sp.Id = tm.RegionId
-        WHERE 
-            t.IsActive = 1 AND ISNULL(t.IsDeleted, 0) = 0
-            AND t.TeamId IN (SELECT TeamId FROM @FilteredTeams)
-            AND (@ProjectNames IS NULL OR t.ProjectId IN (SELECT ProjectId FROM @SelectedProjects))  -- ✅ FIXED
-            AND (
-                (@Month IS NOT NULL AND MONTH(t.CreatedAt) = @Month AND YEAR(t.CreatedAt) = @Year)
-                OR (@DateFrom IS NOT NULL AND CAST(t.CreatedAt AS DATE) >= @DateFrom 
-                    AND CAST(t.CreatedAt AS DATE) <= ISNULL(@DateTo, GETDATE()))
-                OR (@Month IS NULL AND @DateFrom IS NULL)
-            )
-            AND (@TaskTypeNames IS NULL OR t.TaskTypeId IN (SELECT TaskTypeId FROM @SelectedTaskTypes))
-            AND (@StatusNames IS NULL OR t.CallStatusId IN (SELECT StatusId FROM @SelectedStatuses))
-            AND (@CanViewAll = 1 OR t.EmployeeId = @EmployeeId OR (@IsSupervisor = 1 AND t.CallStatusId = 9))
-        GROUP BY sp.Name
-        ORDER BY TotalTickets DESC;
-        
-        -- RESULT SET 3: Breakdown by Project
-        SELECT 
             p.Name AS ProjectName,
             COUNT(*) AS TotalTickets,
             SUM(CASE WHEN lc.Name = 'Open' THEN 1 ELSE 0 END) AS OpenTickets,
@@ -325,42 +293,10 @@ BEGIN
             ) AS CompletionRate
         FROM dbo.Tickets t
         LEFT JOIN dbo.LookupChild lc ON lc.Id = t.CallStatusId
-        INNER JOIN dbo.Projects p ON p.Id = t.ProjectId
-        WHERE 
-            t.IsActive = 1 AND ISNULL(t.IsDeleted, 0) = 0
-            AND t.TeamId IN (SELECT TeamId FROM @FilteredTeams)
-            AND (@ProjectNames IS NULL OR t.ProjectId IN (SELECT ProjectId FROM @SelectedProjects))  -- ✅ FIXED
-            AND (
-                (@Month IS NOT NULL AND MONTH(t.CreatedAt) = @Month AND YEAR(t.CreatedAt) = @Year)
-                OR (@DateFrom IS NOT NULL AND CAST(t.CreatedAt AS DATE) >= @DateFrom 
-                    AND CAST(t.CreatedAt AS DATE) <= ISNULL(@DateTo, GETDATE()))
-                OR (@Month IS NULL AND @DateFrom IS NULL)
-            )
-            AND (@TaskTypeNames IS NULL OR t.TaskTypeId IN (SELECT TaskTypeId FROM @SelectedTaskTypes))
-            AND (@StatusNames IS NULL OR t.CallStatusId IN (SELECT StatusId FROM @SelectedStatuses))
-            AND (@CanViewAll = 1 OR t.EmployeeId = @EmployeeId OR (@IsSupervisor = 1 AND t.CallStatusId = 9))
-        GROUP BY p.Name
-        ORDER BY TotalTickets DESC;
-        
-        -- RESULT SET 4: Breakdown by Team
-        SELECT 
-            tm.Name AS TeamName,
-            sp.Name AS RegionName,
-            p.Name AS ProjectName,
-            COUNT(*) AS TotalTickets,
-            SUM(CASE WHEN lc.Name = 'Open' THEN 1 ELSE 0 END) AS OpenTickets,
-            SUM(CASE WHEN lc.Name IN ('Completed', 'Closed') THEN 1 ELSE 0 END) AS CompletedTickets,
-            SUM(CASE WHEN t.ApprovalStatusId = 15 AND t.CallStatusId = 18 THEN 1 ELSE 0 END) AS PendingApproval,  -- ✅ FIXED
-            SUM(CASE 
-                WHEN t.CallStatusId != 9 
-                 AND ISNULL(lc.Name,'') NOT IN ('Completed', 'Closed')
-                 AND DATEDIFF(DAY, t.CreatedAt, GETDATE()) > 1 
-                THEN 1 ELSE 0 
-            END) AS SLABreached
-        FROM dbo.Tickets t
-        LEFT JOIN dbo.LookupChild lc ON lc.Id = t.CallStatusId
         INNER JOIN dbo.Teams tm ON tm.Id = t.TeamId
-        INNER JOIN dbo.Projects p ON p.Id = t.ProjectId
+        -- LEFT JOIN so tickets without a project still count per region;
+        -- the HAVING below keeps them out of project and team rows
+        LEFT JOIN dbo.Projects p ON p.Id = t.ProjectId
         LEFT JOIN dbo.StateProvince sp ON sp.Id = tm.RegionId
         WHERE 
             t.IsActive = 1 AND ISNULL(t.IsDeleted, 0) = 0
@@ -375,7 +311,8 @@ BEGIN
             AND (@TaskTypeNames IS NULL OR t.TaskTypeId IN (SELECT TaskTypeId FROM @SelectedTaskTypes))
             AND (@StatusNames IS NULL OR t.CallStatusId IN (SELECT StatusId FROM @SelectedStatuses))
             AND (@CanViewAll = 1 OR t.EmployeeId = @EmployeeId OR (@IsSupervisor = 1 AND t.CallStatusId = 9))
-        GROUP BY tm.Name, sp.Name, p.Name
-        ORDER BY TotalTickets DESC;
+        GROUP BY GROUPING SETS ((sp.Name), (p.Name), (tm.Name, sp.Name, p.Name))
+        HAVING GROUPING(p.Name) = 1 OR p.Name IS NOT NULL
+        ORDER BY BreakdownType, TotalTickets DESC;
     END
 END
\ No newline at end of file
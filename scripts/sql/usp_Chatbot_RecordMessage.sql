@@ -0,0 +1,72 @@
+-- =============================================================================
+-- usp_Chatbot_RecordMessage
+-- Records a chat message, creating its ChatbotSessions row first if needed,
+-- in one call and one transaction. Used by chat_history.record_chat_message()
+-- for the first message a process sees in a session (later messages go
+-- through the batched writer).
+--
+-- Returns one row: MessageId (the new ChatbotMessages.Id) and SessionCreated
+-- (1 if the session row was inserted by this call).
+--
+-- Usage:
+--   EXEC usp_Chatbot_RecordMessage @SessionId='6F9619FF-8B86-D011-B42D-00C04FC964FF',
+--        @UserId=1, @Role='user', @Content='Show me open tickets', @Title='Show me open tickets'
+--
+-- Run this in SSMS against the TickTraq database to create the procedure.
+-- =============================================================================
+
+USE [TickTraq]
+GO
+
+IF OBJECT_ID('dbo.usp_Chatbot_RecordMessage', 'P') IS NOT NULL
+    DROP PROCEDURE dbo.usp_Chatbot_RecordMessage
+GO
+
+-- Required: ChatbotSessions has a filtered index (IX_ChatbotSessions_User_Updated),
+-- and writes to it fail in a procedure created with QUOTED_IDENTIFIER OFF
+SET ANSI_NULLS ON
+GO
+SET QUOTED_IDENTIFIER ON
+GO
+
+CREATE PROCEDURE [dbo].[usp_Chatbot_RecordMessage]
+    @SessionId          UNIQUEIDENTIFIER,
+    @UserId             INT,
+    @Role               NVARCHAR(20),
+    @Content            NVARCHAR(MAX),
+    @Title              NVARCHAR(200)   = NULL,
+    @ReportHtml         NVARCHAR(MAX)   = NULL,
+    @ReportModelJson    NVARCHAR(MAX)   = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+    SET XACT_ABORT ON;  -- any error rolls the whole call back
+
+    DECLARE @SessionCreated BIT = 0;
+    DECLARE @MessageId INT;
+
+    BEGIN TRANSACTION;
+
+    -- UPDLOCK/HOLDLOCK: concurrent first messages serialize on the key
+    IF NOT EXISTS (
+        SELECT 1 FROM dbo.ChatbotSessions WITH (UPDLOCK, HOLDLOCK) WHERE Id = @SessionId
+    )
+    BEGIN
+        INSERT INTO dbo.ChatbotSessions (Id, UserId, Title, CreatedAt, UpdatedAt, IsActive, IsDeleted)
+        VALUES (@SessionId, @UserId, @Title, SYSDATETIMEOFFSET(), SYSDATETIMEOFFSET(), 1, 0);
+        SET @SessionCreated = 1;
+    END
+    ELSE
+        UPDATE dbo.ChatbotSessions SET UpdatedAt = SYSDATETIMEOFFSET() WHERE Id = @SessionId;
+
+    INSERT INTO dbo.ChatbotMessages
+        (SessionId, Role, Content, ReportHtml, ReportModelJson, CreatedAt)
+    VALUES
+        (@SessionId, @Role, @Content, @ReportHtml, @ReportModelJson, SYSDATETIMEOFFSET());
+    SET @MessageId = CAST(SCOPE_IDENTITY() AS INT);
+
+    COMMIT TRANSACTION;
+
+    SELECT @MessageId AS MessageId, @SessionCreated AS SessionCreated;
+END
+GO